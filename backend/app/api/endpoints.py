@@ -13,7 +13,8 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 from ..models.request import AnalyzeRequest
 from ..models.response import (
     AnalyzeResponse, ErrorResponse, HealthCheckResponse, VersionResponse,
-    ErrorInfo, ErrorDetail, DependencyInfo
+    ErrorInfo, ErrorDetail, DependencyInfo, CircuitBreakerResponse,
+    ConcurrencyResponse, SerpQuotaResponse
 )
 from ..models.status import (
     JobCreateResponse, JobStatusResponse
@@ -22,7 +23,7 @@ from ..config import get_config
 from ..services.integration_service import get_integration_service
 from ..services.job_manager import get_job_manager
 from ..services.serp_service import SerpAPIException
-from ..services.scraper_service import ScraperException
+from ..services.scraper_service import ScraperException, get_scraper_service
 from ..services.ai_service import AIServiceException, AIAPIException
 from ..utils.error_handler import (
     create_service_error,
@@ -331,6 +332,106 @@ async def health_check() -> HealthCheckResponse:
         )
 
 
+@router.get(
+    "/scraper/circuits",
+    response_model=CircuitBreakerResponse,
+    tags=["系統監控"],
+    summary="查詢爬蟲網域斷路器狀態",
+    response_description="開啟中與半開狀態的網域，以及各網域的近期失敗率"
+)
+async def get_circuit_breakers() -> CircuitBreakerResponse:
+    """查詢爬蟲網域斷路器狀態。
+
+    列出有失敗紀錄或曾開啟的網域，用於確認哪些競爭對手網站
+    目前被直接略過。
+
+    Returns:
+        CircuitBreakerResponse: 斷路器狀態
+
+    Example:
+        >>> response = await get_circuit_breakers()
+        >>> print(response.open)  # 開啟中的網域數
+    """
+    stats = get_scraper_service().get_circuit_stats()
+    return CircuitBreakerResponse(
+        enabled=stats['enabled'],
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        open=stats.get('open', 0),
+        half_open=stats.get('half_open', 0),
+        domains=stats.get('domains', {})
+    )
+
+
+@router.get(
+    "/scraper/concurrency",
+    response_model=ConcurrencyResponse,
+    tags=["系統監控"],
+    summary="查詢爬蟲全域並行上限",
+    response_description="自適應調整後的目前並行上限與進行中的請求數"
+)
+async def get_scraper_concurrency() -> ConcurrencyResponse:
+    """查詢爬蟲全域並行上限。
+
+    回傳依請求結果自適應調整 (AIMD) 後的目前上限，用於觀察
+    尖峰時段是否因逾時或連線錯誤而降低並行數。
+
+    Returns:
+        ConcurrencyResponse: 並行上限狀態
+
+    Example:
+        >>> response = await get_scraper_concurrency()
+        >>> print(response.limit)  # 目前的並行上限
+    """
+    stats = get_scraper_service().get_concurrency_stats()
+    return ConcurrencyResponse(
+        enabled=stats['enabled'],
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        limit=stats['limit'],
+        min_limit=stats.get('min_limit'),
+        max_limit=stats.get('max_limit'),
+        in_flight=stats.get('in_flight', 0),
+        waiting=stats.get('waiting', 0),
+        increases=stats.get('increases', 0),
+        decreases=stats.get('decreases', 0)
+    )
+
+
+@router.get(
+    "/serp/quota",
+    response_model=SerpQuotaResponse,
+    tags=["系統監控"],
+    summary="查詢 SerpAPI 速率限制與配額",
+    response_description="本月剩餘配額與目前的排隊等待時間"
+)
+async def get_serp_quota() -> SerpQuotaResponse:
+    """查詢 SerpAPI 速率限制與配額。
+
+    回傳用戶端速率限制器的狀態，用於在尖峰時段判斷搜尋是否
+    需要排隊，以及本月配額是否即將用盡。
+
+    Returns:
+        SerpQuotaResponse: 速率限制與配額狀態
+
+    Example:
+        >>> response = await get_serp_quota()
+        >>> print(response.remaining_quota)  # 本月剩餘配額
+    """
+    from ..services.serp_service import get_serp_service
+    stats = get_serp_service().get_rate_limit_stats()
+    return SerpQuotaResponse(
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        rate=stats['rate'],
+        burst=stats['burst'],
+        monthly_quota=stats['monthly_quota'],
+        used_quota=stats['used_quota'],
+        remaining_quota=stats['remaining_quota'],
+        queue_wait=stats['queue_wait'],
+        waiting=stats['waiting'],
+        avg_wait=stats['avg_wait'],
+        rejected=stats['rejected'] + stats['quota_rejected']
+    )
+
+
 @router.get(
     "/version", 
     response_model=VersionResponse,
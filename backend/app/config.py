@@ -123,6 +123,54 @@ class Config:
         """取得搜尋語言設定。"""
         return self._config.get("serp", "language", fallback="zh-tw")
 
+    def get_serp_timeout(self) -> float:
+        """取得 SerpAPI 請求逾時秒數。"""
+        return self._config.getfloat("serp", "timeout", fallback=30.0)
+
+    def get_serp_pool_limit(self) -> int:
+        """取得 SerpAPI 共用連線池的最大連線數。"""
+        return self._config.getint("serp", "pool_limit", fallback=20)
+
+    def get_serp_page_size(self) -> int:
+        """取得 SerpAPI 每頁搜尋結果數（分頁搜尋時使用）。"""
+        return self._config.getint("serp", "page_size", fallback=10)
+
+    def get_serp_result_count(self) -> int:
+        """取得分析流程擷取的 SERP 結果數。"""
+        return self._config.getint("serp", "result_count", fallback=10)
+
+    def get_serp_cache_enabled(self) -> bool:
+        """是否快取 SerpAPI 搜尋回應。"""
+        return self._config.getboolean("serp", "cache", fallback=True)
+
+    def get_serp_cache_ttl(self) -> float:
+        """取得 SERP 快取存活秒數。"""
+        return self._config.getfloat("serp", "cache_ttl", fallback=24 * 3600.0)
+
+    def get_serp_cache_max_entries(self) -> int:
+        """取得 SERP 快取記憶體層的最大項目數。"""
+        return self._config.getint("serp", "cache_max_entries", fallback=512)
+
+    def get_serp_cache_dir(self) -> str:
+        """取得 SERP 快取磁碟層目錄（空字串表示使用預設位置）。"""
+        return self._config.get("serp", "cache_dir", fallback="")
+
+    def get_serp_rate_limit(self) -> float:
+        """取得 SerpAPI 每秒平均搜尋數上限（0 表示不限制）。"""
+        return self._config.getfloat("serp", "requests_per_second", fallback=1.0)
+
+    def get_serp_rate_burst(self) -> int:
+        """取得 SerpAPI 可連續送出的搜尋數。"""
+        return self._config.getint("serp", "burst", fallback=5)
+
+    def get_serp_monthly_quota(self) -> int:
+        """取得 SerpAPI 每月搜尋配額（0 表示不限制）。"""
+        return self._config.getint("serp", "monthly_quota", fallback=0)
+
+    def get_serp_queue_timeout(self) -> float:
+        """取得 SerpAPI 搜尋排隊等待的最長秒數。"""
+        return self._config.getfloat("serp", "queue_timeout", fallback=30.0)
+
     # Azure OpenAI 配置
     def get_openai_api_key(self) -> str:
         """取得 Azure OpenAI API 密鑰。"""
@@ -161,6 +209,18 @@ class Config:
         """取得爬蟲最大並行數。"""
         return self._config.getint("scraper", "max_concurrent", fallback=10)
 
+    def get_scraper_adaptive_concurrency_enabled(self) -> bool:
+        """取得是否依請求結果自動調整全域並行數 (AIMD)。"""
+        return self._config.getboolean("scraper", "adaptive_concurrency", fallback=True)
+
+    def get_scraper_concurrency_min(self) -> int:
+        """取得自適應並行數的下限。"""
+        return self._config.getint("scraper", "concurrency_min", fallback=1)
+
+    def get_scraper_concurrency_max(self) -> int:
+        """取得自適應並行數的上限。"""
+        return self._config.getint("scraper", "concurrency_max", fallback=32)
+
     def get_scraper_user_agent(self) -> str:
         """取得爬蟲 User-Agent。"""
         return self._config.get(
@@ -177,6 +237,162 @@ class Config:
         """取得爬蟲重試延遲秒數。"""
         return self._config.getfloat("scraper", "retry_delay", fallback=1.0)
 
+    def get_scraper_adaptive_timeout_enabled(self) -> bool:
+        """是否依網域延遲歷史調整爬蟲逾時。"""
+        return self._config.getboolean("scraper", "adaptive_timeout", fallback=True)
+
+    def get_scraper_timeout_floor(self) -> float:
+        """取得自適應逾時的下限秒數。"""
+        return self._config.getfloat("scraper", "timeout_floor", fallback=2.0)
+
+    def get_scraper_timeout_cap(self) -> float:
+        """取得自適應逾時的上限秒數。"""
+        return self._config.getfloat("scraper", "timeout_cap", fallback=30.0)
+
+    def get_scraper_timeout_percentile(self) -> float:
+        """取得推算自適應逾時使用的延遲百分位數。"""
+        return self._config.getfloat("scraper", "timeout_percentile", fallback=99.0)
+
+    def get_scraper_timeout_history_path(self) -> str:
+        """取得網域延遲歷史的保存路徑（空字串表示僅保存在記憶體）。"""
+        return self._config.get("scraper", "timeout_history_path", fallback="")
+
+    def get_scraper_min_success(self) -> int:
+        """取得提前回傳的成功頁數門檻（0 表示等待全部完成）。"""
+        return self._config.getint("scraper", "min_success", fallback=0)
+
+    def get_scraper_deadline(self) -> float:
+        """取得整批爬取截止秒數（0 表示不限制）。"""
+        return self._config.getfloat("scraper", "deadline", fallback=0.0)
+
+    def get_scraper_hedge_enabled(self) -> bool:
+        """是否對慢速請求發出對沖請求。"""
+        return self._config.getboolean("scraper", "hedge", fallback=True)
+
+    def get_scraper_hedge_percentile(self) -> float:
+        """取得觸發對沖的近期延遲百分位數。"""
+        return self._config.getfloat("scraper", "hedge_percentile", fallback=95.0)
+
+    def get_scraper_hedge_budget(self) -> float:
+        """取得對沖請求占主要請求數的比例上限。"""
+        return self._config.getfloat("scraper", "hedge_budget", fallback=0.1)
+
+    def get_scraper_hedge_min_samples(self) -> int:
+        """取得開始對沖前所需的最少延遲樣本數。"""
+        return self._config.getint("scraper", "hedge_min_samples", fallback=20)
+
+    def get_scraper_circuit_breaker_enabled(self) -> bool:
+        """是否啟用網域斷路器。"""
+        return self._config.getboolean("scraper", "circuit_breaker", fallback=True)
+
+    def get_scraper_circuit_failure_threshold(self) -> float:
+        """取得開啟網域斷路器的近期失敗率門檻。"""
+        return self._config.getfloat("scraper", "circuit_failure_threshold", fallback=0.5)
+
+    def get_scraper_circuit_min_failures(self) -> int:
+        """取得開啟網域斷路器所需的最少近期失敗數。"""
+        return self._config.getint("scraper", "circuit_min_failures", fallback=5)
+
+    def get_scraper_circuit_cooldown(self) -> float:
+        """取得網域斷路器開啟後的冷卻秒數。"""
+        return self._config.getfloat("scraper", "circuit_cooldown", fallback=30.0)
+
+    def get_scraper_robots_enabled(self) -> bool:
+        """是否遵守 robots.txt。"""
+        return self._config.getboolean("scraper", "robots", fallback=True)
+
+    def get_scraper_robots_user_agent(self) -> str:
+        """取得比對 robots.txt User-agent 群組使用的名稱。"""
+        return self._config.get("scraper", "robots_user_agent", fallback="SEOAnalyzer")
+
+    def get_scraper_robots_ttl(self) -> float:
+        """取得 robots.txt 規則的快取秒數。"""
+        return self._config.getfloat("scraper", "robots_ttl", fallback=24 * 3600.0)
+
+    def get_scraper_pool_limit(self) -> int:
+        """取得爬蟲連線池總連線數上限。"""
+        return self._config.getint("scraper", "pool_limit", fallback=100)
+
+    def get_scraper_pool_limit_per_host(self) -> int:
+        """取得爬蟲連線池單一主機連線數上限（0 表示不限制）。"""
+        return self._config.getint("scraper", "pool_limit_per_host", fallback=10)
+
+    def get_scraper_keepalive_timeout(self) -> float:
+        """取得爬蟲閒置連線保留秒數（keep-alive）。"""
+        return self._config.getfloat("scraper", "keepalive_timeout", fallback=30.0)
+
+    def get_scraper_stream_read(self) -> bool:
+        """取得是否以串流模式讀取網頁內容（可提前終止）。"""
+        return self._config.getboolean("scraper", "stream_read", fallback=False)
+
+    def get_scraper_max_content_bytes(self) -> int:
+        """取得串流模式下單頁最多讀取的位元組數。"""
+        return self._config.getint("scraper", "max_content_bytes", fallback=2 * 1024 * 1024)
+
+    def get_scraper_pdf_enabled(self) -> bool:
+        """是否擷取 PDF 文字（需安裝 pypdf）。"""
+        return self._config.getboolean("scraper", "pdf", fallback=True)
+
+    def get_scraper_pdf_max_bytes(self) -> int:
+        """取得 PDF 最大下載位元組數。"""
+        return self._config.getint("scraper", "pdf_max_bytes", fallback=10 * 1024 * 1024)
+
+    def get_scraper_parser_mode(self) -> str:
+        """取得 HTML 解析工作池模式 (process、thread 或 inline)。"""
+        return self._config.get("scraper", "parser_mode", fallback="process").strip().lower()
+
+    def get_scraper_parser_workers(self) -> int:
+        """取得 HTML 解析工作者數量（0 表示依 CPU 數量自動決定）。"""
+        return self._config.getint("scraper", "parser_workers", fallback=0)
+
+    def get_scraper_per_host_concurrent(self) -> int:
+        """取得同一主機的最大並行請求數（0 表示不限制）。"""
+        return self._config.getint("scraper", "per_host_concurrent", fallback=2)
+
+    def get_scraper_host_delay(self) -> float:
+        """取得同一主機兩次請求開始之間的最小間隔秒數。"""
+        return self._config.getfloat("scraper", "host_delay", fallback=0.5)
+
+    def get_scraper_html_store_enabled(self) -> bool:
+        """取得是否啟用 HTML 磁碟儲存與條件式重新驗證。"""
+        return self._config.getboolean("scraper", "html_store", fallback=True)
+
+    def get_scraper_html_store_dir(self) -> str:
+        """取得 HTML 磁碟儲存目錄（空字串表示使用 ~/.cache/seo-analyzer/html）。"""
+        return self._config.get("scraper", "html_store_dir", fallback="")
+
+    def get_scraper_html_store_max_bytes(self) -> int:
+        """取得 HTML 磁碟儲存的總容量上限（位元組）。"""
+        return self._config.getint("scraper", "html_store_max_bytes", fallback=256 * 1024 * 1024)
+
+    def get_scraper_dns_cache_enabled(self) -> bool:
+        """取得是否啟用共用 DNS 快取。"""
+        return self._config.getboolean("scraper", "dns_cache", fallback=True)
+
+    def get_scraper_dns_cache_ttl(self) -> float:
+        """取得 DNS 解析結果快取秒數。"""
+        return self._config.getfloat("scraper", "dns_cache_ttl", fallback=300.0)
+
+    def get_scraper_dns_negative_ttl(self) -> float:
+        """取得 DNS 解析失敗的負向快取秒數。"""
+        return self._config.getfloat("scraper", "dns_negative_ttl", fallback=30.0)
+
+    def get_scraper_parse_cache_enabled(self) -> bool:
+        """取得是否啟用解析結果快取（內容未變更時略過解析）。"""
+        return self._config.getboolean("scraper", "parse_cache", fallback=True)
+
+    def get_scraper_parse_cache_ttl(self) -> int:
+        """取得解析結果快取存活時間（秒），預設一週。"""
+        return self._config.getint("scraper", "parse_cache_ttl", fallback=7 * 24 * 3600)
+
+    def get_scraper_parse_cache_max_entries(self) -> int:
+        """取得解析結果快取最大項目數。"""
+        return self._config.getint("scraper", "parse_cache_max_entries", fallback=2048)
+
+    def get_scraper_parser_engine(self) -> str:
+        """取得 HTML 擷取引擎 (lxml 或 bs4)。"""
+        return self._config.get("scraper", "parser_engine", fallback="lxml").strip().lower()
+
     # 快取配置
     def get_cache_enabled(self) -> bool:
         """取得快取啟用狀態。"""
@@ -198,6 +414,19 @@ class Config:
         """取得快取存活時間（秒）。"""
         return self._config.getint("cache", "ttl", fallback=3600)
 
+    # 重試預算配置（爬蟲、SerpAPI、Azure OpenAI 各自一份預算）
+    def get_retry_budget_ratio(self) -> float:
+        """取得重試數占首次嘗試數的比例上限。"""
+        return self._config.getfloat("retry", "budget_ratio", fallback=0.2)
+
+    def get_retry_budget_reserve(self) -> float:
+        """取得重試預算的 token 上限（低流量時可用的重試數）。"""
+        return self._config.getfloat("retry", "budget_reserve", fallback=10.0)
+
+    def get_retry_max_delay(self) -> float:
+        """取得單次重試退避的最長秒數（Retry-After 超過時放棄重試）。"""
+        return self._config.getfloat("retry", "max_delay", fallback=30.0)
+
     # 日誌配置
     def get_log_level(self) -> str:
         """取得日誌等級。"""
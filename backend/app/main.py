@@ -4,6 +4,8 @@
 設定中間件、註冊路由和啟動伺服器。
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -14,6 +16,9 @@ import os
 
 from .config import get_config
 from .api.endpoints import router
+from .services.dns_resolver import close_dns_resolver
+from .services.scraper_service import get_scraper_service
+from .services.serp_service import close_serp_service
 
 # 取得配置實例
 config = get_config()
@@ -24,8 +29,27 @@ APP_DIR = os.path.dirname(os.path.abspath(__file__))
 # 初始化模板引擎
 templates = Jinja2Templates(directory=os.path.join(APP_DIR, "templates"))
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """應用程式生命週期管理。
+
+    啟動時建立爬蟲共用連線池，關閉時釋放爬蟲與 SerpAPI 的所有連線及
+    共用 DNS 解析器。
+    """
+    scraper_service = get_scraper_service()
+    await scraper_service.startup()
+    try:
+        yield
+    finally:
+        await scraper_service.close()
+        await close_serp_service()
+        await close_dns_resolver()
+
+
 # 初始化 FastAPI 應用程式（關閉預設文檔）
 app = FastAPI(
+    lifespan=lifespan,
     title="SEO Analyzer API",
     description="""
 ## SEO 關鍵字分析工具 REST API
@@ -446,4 +446,161 @@ class VersionResponse(BaseModel):
                     "beautifulsoup4": "4.13.4"
                 }
             }
-        }
\ No newline at end of file
+        }
+
+class CircuitState(BaseModel):
+    """單一網域的斷路器狀態。
+
+    Attributes:
+        state: 斷路器狀態（"closed", "open", "half_open"）
+        failures: 近期失敗次數
+        requests: 近期結果次數
+        failure_rate: 近期失敗率
+        opens: 累計開啟次數
+        rejected: 開啟期間直接拒絕的請求數
+        retry_after: 剩餘冷卻秒數
+    """
+
+    state: str = Field(..., description="斷路器狀態")
+    failures: int = Field(..., description="近期失敗次數")
+    requests: int = Field(..., description="近期結果次數")
+    failure_rate: float = Field(..., description="近期失敗率")
+    opens: int = Field(..., description="累計開啟次數")
+    rejected: int = Field(..., description="開啟期間直接拒絕的請求數")
+    retry_after: float = Field(..., description="剩餘冷卻秒數")
+
+
+class CircuitBreakerResponse(BaseModel):
+    """爬蟲網域斷路器狀態回應模型。
+
+    GET /api/scraper/circuits 端點的回應資料結構。
+
+    Attributes:
+        enabled: 是否啟用網域斷路器
+        timestamp: 查詢時間戳
+        open: 開啟中的網域數
+        half_open: 半開狀態的網域數
+        domains: 有失敗紀錄或曾開啟的網域狀態
+    """
+
+    enabled: bool = Field(..., description="是否啟用網域斷路器")
+    timestamp: str = Field(..., description="查詢時間戳（ISO 8601 格式）")
+    open: int = Field(0, description="開啟中的網域數")
+    half_open: int = Field(0, description="半開狀態的網域數")
+    domains: Dict[str, CircuitState] = Field(
+        default_factory=dict,
+        description="有失敗紀錄或曾開啟的網域狀態"
+    )
+
+    class Config:
+        """Pydantic 模型配置。"""
+        json_schema_extra = {
+            "example": {
+                "enabled": True,
+                "timestamp": "2025-01-22T10:30:00Z",
+                "open": 1,
+                "half_open": 0,
+                "domains": {
+                    "example.com": {
+                        "state": "open",
+                        "failures": 6,
+                        "requests": 8,
+                        "failure_rate": 0.75,
+                        "opens": 1,
+                        "rejected": 3,
+                        "retry_after": 21.4
+                    }
+                }
+            }
+        }
+
+
+class ConcurrencyResponse(BaseModel):
+    """爬蟲全域並行上限回應模型。
+
+    GET /api/scraper/concurrency 端點的回應資料結構。
+
+    Attributes:
+        enabled: 是否啟用自適應並行調整
+        timestamp: 查詢時間戳
+        limit: 目前的全域並行上限
+        min_limit: 並行上限的下限
+        max_limit: 並行上限的上限
+        in_flight: 進行中的請求數
+        waiting: 等待名額的請求數
+        increases: 累計加法遞增次數
+        decreases: 累計乘法遞減次數
+    """
+
+    enabled: bool = Field(..., description="是否啟用自適應並行調整")
+    timestamp: str = Field(..., description="查詢時間戳（ISO 8601 格式）")
+    limit: int = Field(..., description="目前的全域並行上限")
+    min_limit: Optional[int] = Field(None, description="並行上限的下限")
+    max_limit: Optional[int] = Field(None, description="並行上限的上限")
+    in_flight: int = Field(0, description="進行中的請求數")
+    waiting: int = Field(0, description="等待名額的請求數")
+    increases: int = Field(0, description="累計加法遞增次數")
+    decreases: int = Field(0, description="累計乘法遞減次數")
+
+    class Config:
+        """Pydantic 模型配置。"""
+        json_schema_extra = {
+            "example": {
+                "enabled": True,
+                "timestamp": "2025-01-22T10:30:00Z",
+                "limit": 14,
+                "min_limit": 1,
+                "max_limit": 32,
+                "in_flight": 9,
+                "waiting": 0,
+                "increases": 6,
+                "decreases": 1
+            }
+        }
+
+
+class SerpQuotaResponse(BaseModel):
+    """SerpAPI 速率限制與配額回應模型。
+
+    GET /api/serp/quota 端點的回應資料結構。
+
+    Attributes:
+        timestamp: 查詢時間戳
+        rate: 每秒平均搜尋數上限
+        burst: 可連續送出的搜尋數
+        monthly_quota: 每月配額 (0 表示不限制)
+        used_quota: 本月已送出的搜尋數
+        remaining_quota: 本月剩餘配額
+        queue_wait: 新的搜尋目前需要排隊的秒數
+        waiting: 排隊中的搜尋數
+        avg_wait: 曾排隊的搜尋平均等待秒數
+        rejected: 因排隊過久或配額用盡而拒絕的次數
+    """
+
+    timestamp: str = Field(..., description="查詢時間戳（ISO 8601 格式）")
+    rate: float = Field(..., description="每秒平均搜尋數上限（0 表示不限制）")
+    burst: int = Field(..., description="可連續送出的搜尋數")
+    monthly_quota: int = Field(0, description="每月配額（0 表示不限制）")
+    used_quota: int = Field(0, description="本月已送出的搜尋數")
+    remaining_quota: Optional[int] = Field(None, description="本月剩餘配額，未設定配額時為 null")
+    queue_wait: float = Field(0.0, description="新的搜尋目前需要排隊的秒數")
+    waiting: int = Field(0, description="排隊中的搜尋數")
+    avg_wait: float = Field(0.0, description="曾排隊的搜尋平均等待秒數")
+    rejected: int = Field(0, description="因排隊過久或配額用盡而拒絕的次數")
+
+    class Config:
+        """Pydantic 模型配置。"""
+        json_schema_extra = {
+            "example": {
+                "timestamp": "2025-01-22T10:30:00Z",
+                "rate": 1.0,
+                "burst": 5,
+                "monthly_quota": 5000,
+                "used_quota": 1280,
+                "remaining_quota": 3720,
+                "queue_wait": 2.0,
+                "waiting": 3,
+                "avg_wait": 0.8,
+                "rejected": 0
+            }
+        }
@@ -0,0 +1,212 @@
+"""自適應 (AIMD) 全域並行上限模組。
+
+固定的並行數在離峰時偏低、在尖峰時又可能塞滿對外頻寬。此模組
+依近期請求結果調整上限：
+
+- 每累積一個視窗的結果 (約等於目前上限的請求數) 評估一次
+- 逾時與連線錯誤比例超過門檻，或平均延遲超過基準延遲的倍數時，
+  上限乘以 decrease_factor (乘法遞減)
+- 否則若上限在視窗內確實被用滿，上限加 increase (加法遞增)；
+  沒有負載時不會無限制地增加
+
+上限降低時不會中斷進行中的請求，只是新請求要等到進行中數量低於
+新上限後才放行。
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+class AdaptiveConcurrencyLimiter:
+    """以 AIMD 調整上限的全域並行限制器。
+
+    提供與 asyncio.Semaphore 相同的 acquire() / release() 介面，
+    可直接作為 HostScheduler.slot() 的 gate。
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial=10, max_limit=32)
+        >>> await limiter.acquire()
+        >>> try:
+        ...     limiter.record(success=True, latency=0.8)
+        ... finally:
+        ...     limiter.release()
+    """
+
+    def __init__(
+        self,
+        initial: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        error_threshold: float = 0.2,
+        latency_tolerance: float = 2.0,
+        min_window: int = 5
+    ):
+        """初始化並行限制器。
+
+        Args:
+            initial: 初始並行上限
+            min_limit: 並行上限的下限
+            max_limit: 並行上限的上限
+            increase: 視窗健康且上限被用滿時增加的並行數
+            decrease_factor: 視窗壅塞時上限乘上的係數 (0-1)
+            error_threshold: 視為壅塞的逾時與連線錯誤比例
+            latency_tolerance: 平均延遲超過基準延遲此倍數時視為壅塞
+            min_window: 每次評估所需的最少結果數
+        """
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.error_threshold = error_threshold
+        self.latency_tolerance = latency_tolerance
+        self.min_window = max(min_window, 1)
+        self._limit = float(min(max(initial, self.min_limit), self.max_limit))
+
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 目前視窗的統計
+        self._window_total = 0
+        self._window_errors = 0
+        self._window_ok = 0
+        self._window_latency = 0.0
+        self._saturated = False
+
+        # 健康視窗的平均延遲 (指數移動平均)
+        self._baseline: Optional[float] = None
+
+        # 統計資訊
+        self._increases = 0
+        self._decreases = 0
+        self._last_error_rate = 0.0
+
+    @property
+    def limit(self) -> int:
+        """目前的並行上限。"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """目前進行中的請求數。"""
+        return self._in_flight
+
+    def locked(self) -> bool:
+        """是否沒有可立即取得的名額 (與 asyncio.Semaphore.locked 相容)。"""
+        try:
+            if self._loop is not asyncio.get_running_loop():
+                # 切換事件迴圈時 acquire 會重建狀態，名額可立即取得
+                return False
+        except RuntimeError:
+            pass
+        return self._in_flight >= self.limit or any(not waiter.done() for waiter in self._waiters)
+
+    async def acquire(self) -> None:
+        """取得一個並行名額，達到上限時等待。"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 等待中的 Future 綁定事件迴圈，切換迴圈時重建
+            self._waiters = deque()
+            self._in_flight = 0
+            self._loop = loop
+
+        # 清除佇列前端已取消的等待者
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+        if self._in_flight < self.limit and not self._waiters:
+            self._take()
+            return
+
+        self._saturated = True
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 已被放行卻在恢復前取消，歸還名額
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """歸還一個並行名額。"""
+        self._in_flight = max(self._in_flight - 1, 0)
+        self._wake()
+
+    def _take(self) -> None:
+        self._in_flight += 1
+        if self._in_flight >= self.limit:
+            self._saturated = True
+
+    def _wake(self) -> None:
+        """依目前上限放行等待中的請求。"""
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._take()
+                waiter.set_result(None)
+
+    def record(self, success: bool, latency: Optional[float] = None) -> None:
+        """回報一次請求結果。
+
+        Args:
+            success: 請求是否取得回應 (逾時與連線錯誤為 False)
+            latency: 取得回應的延遲秒數 (可選)
+        """
+        self._window_total += 1
+        if not success:
+            self._window_errors += 1
+        elif latency is not None:
+            self._window_ok += 1
+            self._window_latency += latency
+
+        if self._window_total >= max(self.limit, self.min_window):
+            self._adjust()
+
+    def _adjust(self) -> None:
+        """依目前視窗的結果調整並行上限。"""
+        error_rate = self._window_errors / self._window_total
+        avg_latency = self._window_latency / self._window_ok if self._window_ok else None
+        slow = (
+            avg_latency is not None and self._baseline is not None
+            and avg_latency > self._baseline * self.latency_tolerance
+        )
+        self._last_error_rate = error_rate
+
+        if error_rate > self.error_threshold or slow:
+            self._limit = max(self._limit * self.decrease_factor, float(self.min_limit))
+            self._decreases += 1
+        else:
+            if avg_latency is not None:
+                self._baseline = avg_latency if self._baseline is None else (
+                    0.9 * self._baseline + 0.1 * avg_latency
+                )
+            if self._saturated and self._limit < self.max_limit:
+                self._limit = min(self._limit + self.increase, float(self.max_limit))
+                self._increases += 1
+                self._wake()
+
+        self._window_total = self._window_errors = self._window_ok = 0
+        self._window_latency = 0.0
+        self._saturated = bool(self._waiters) or self._in_flight >= self.limit
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得並行上限與調整統計資訊。
+
+        Returns:
+            dict: 包含目前上限、進行中與等待中的請求數及調整次數的字典
+        """
+        return {
+            'limit': self.limit,
+            'min_limit': self.min_limit,
+            'max_limit': self.max_limit,
+            'in_flight': self._in_flight,
+            'waiting': sum(1 for waiter in self._waiters if not waiter.done()),
+            'increases': self._increases,
+            'decreases': self._decreases,
+            'last_error_rate': round(self._last_error_rate, 3),
+            'baseline_latency': round(self._baseline, 3) if self._baseline is not None else None,
+        }
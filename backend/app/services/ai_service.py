@@ -16,6 +16,7 @@ import openai
 from ..config import get_config
 from .serp_service import SerpResult
 from .scraper_service import ScrapingResult
+from .retry_budget import RetryBudget, parse_retry_after
 
 
 # 自定義例外類別
@@ -96,11 +97,20 @@ class AIService:
         self.max_retries = 3
         self.retry_delay = 2.0
         
-        # 初始化 Azure OpenAI 客戶端
+        # 重試預算（Azure OpenAI 故障或限流時限制重試量，並遵守 Retry-After）
+        self.retry_budget = RetryBudget(
+            "azure_openai",
+            ratio=self.config.get_retry_budget_ratio(),
+            reserve=self.config.get_retry_budget_reserve(),
+            max_delay=self.config.get_retry_max_delay()
+        )
+        
+        # 初始化 Azure OpenAI 客戶端（重試由上方的重試預算統一控制，停用 SDK 內建重試）
         self.client = AsyncAzureOpenAI(
             api_key=self.api_key,
             api_version=self.api_version,
             azure_endpoint=self.endpoint,
+            max_retries=0,
         )
     
     async def analyze_seo_content(
@@ -443,23 +453,19 @@ class AIService:
             AITimeoutException: API 呼叫逾時
         """
         last_error = None
+        self.retry_budget.record_attempt()
         
         for attempt in range(self.max_retries):
+            retry_after = None
             try:
                 return await self._call_openai_api(prompt)
                 
             except openai.RateLimitError as e:
                 last_error = AIAPIException(f"API 速率限制: {str(e)}")
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)  # 指數退避
-                    await asyncio.sleep(delay)
-                    continue
+                retry_after = self._get_retry_after(e)
                     
             except openai.APITimeoutError as e:
                 last_error = AITimeoutException(f"API 逾時: {str(e)}")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay)
-                    continue
                     
             except openai.APIError as e:
                 last_error = AIAPIException(f"API 錯誤: {str(e)}")
@@ -468,6 +474,14 @@ class AIService:
             except Exception as e:
                 last_error = AIServiceException(f"未預期錯誤: {str(e)}")
                 break
+            
+            if attempt == self.max_retries - 1:
+                break
+            # 指數退避加 jitter，速率限制時至少等待 Retry-After
+            delay = self.retry_budget.retry_delay(attempt, self.retry_delay, retry_after)
+            if delay is None:
+                break  # 重試預算用盡或 Retry-After 過長
+            await asyncio.sleep(delay)
         
         # 所有重試都失敗
         if last_error:
@@ -475,6 +489,29 @@ class AIService:
         else:
             raise AIAPIException("Azure OpenAI API 呼叫失敗")
     
+    @staticmethod
+    def _get_retry_after(error: openai.APIStatusError) -> Optional[float]:
+        """由錯誤回應標頭取得 Retry-After 秒數 (支援 retry-after-ms)。"""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+        retry_after_ms = headers.get('retry-after-ms')
+        if retry_after_ms:
+            try:
+                return max(float(retry_after_ms) / 1000, 0.0)
+            except ValueError:
+                pass
+        return parse_retry_after(headers.get('retry-after'))
+    
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """取得重試預算的統計資訊。
+        
+        Returns:
+            dict: 包含首次嘗試數、重試數與預算用盡次數的統計
+        """
+        return self.retry_budget.get_stats()
+    
     async def _call_openai_api(self, prompt: str) -> Dict[str, Any]:
         """實際呼叫 Azure OpenAI API。
         
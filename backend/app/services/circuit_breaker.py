@@ -0,0 +1,224 @@
+"""依網域運作的斷路器模組。
+
+當某個網域故障或封鎖爬蟲時，斷路器依近期失敗率開啟，之後對
+該網域的請求直接失敗，不再耗費重試與退避時間；冷卻時間過後
+進入半開狀態，只放行一個探測請求，成功即恢復、失敗則再次開啟。
+"""
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+
+# 斷路器狀態
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class _Circuit:
+    """單一網域的斷路器狀態。"""
+
+    __slots__ = ('state', 'outcomes', 'opened_at', 'probe_started', 'opens', 'rejected')
+
+    def __init__(self, window: int) -> None:
+        self.state = CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.probe_started: Optional[float] = None
+        self.opens = 0
+        self.rejected = 0
+
+    @property
+    def failures(self) -> int:
+        return sum(1 for ok in self.outcomes if not ok)
+
+
+class CircuitBreaker:
+    """依網域追蹤近期失敗率的斷路器。
+
+    - closed：正常放行，近期 window 次結果中失敗數達 min_failures 且
+      失敗率達 failure_threshold 時開啟
+    - open：直接拒絕，經過 cooldown 秒後轉為 half_open
+    - half_open：只放行一個探測請求，成功則關閉、失敗則重新開啟；
+      探測請求超過 cooldown 秒仍無結果（例如被取消）時放行下一個
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=0.5, cooldown=30)
+        >>> if breaker.allow("https://example.com/a"):
+        ...     breaker.record("https://example.com/a", success=False)
+    """
+
+    # 網域數超過此數量時清除已關閉且無失敗的項目
+    PRUNE_THRESHOLD = 4096
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        min_failures: int = 5,
+        window: int = 20,
+        cooldown: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """初始化斷路器。
+
+        Args:
+            failure_threshold: 開啟斷路器的近期失敗率門檻 (0-1)
+            min_failures: 開啟斷路器所需的最少近期失敗數
+            window: 計算失敗率的近期結果數
+            cooldown: 開啟後轉為半開狀態前的冷卻秒數
+            clock: 計算冷卻時間使用的時鐘函式 (測試可注入假時鐘)
+        """
+        self.failure_threshold = failure_threshold
+        self.min_failures = max(min_failures, 1)
+        self.window = max(window, self.min_failures)
+        self.cooldown = cooldown
+        self._clock = clock
+        self._circuits: Dict[str, _Circuit] = {}
+
+    @staticmethod
+    def domain_key(url: str) -> str:
+        """取得 URL 的網域鍵值 (小寫的主機名稱)。
+
+        Args:
+            url: 目標 URL
+
+        Returns:
+            str: 網域鍵值，無法解析時為空字串
+        """
+        try:
+            return (urlsplit(url).hostname or '').lower()
+        except ValueError:
+            return ''
+
+    def _get_circuit(self, key: str) -> _Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            if len(self._circuits) >= self.PRUNE_THRESHOLD:
+                self._circuits = {
+                    k: v for k, v in self._circuits.items()
+                    if v.state != CLOSED or v.failures
+                }
+            circuit = self._circuits[key] = _Circuit(self.window)
+        return circuit
+
+    def allow(self, url: str) -> bool:
+        """判斷是否放行對指定 URL 網域的請求。
+
+        半開狀態下放行的請求即為探測請求，應以 record() 回報結果。
+
+        Args:
+            url: 目標 URL
+
+        Returns:
+            bool: 放行時為 True；斷路器開啟時為 False
+        """
+        circuit = self._circuits.get(self.domain_key(url))
+        if circuit is None or circuit.state == CLOSED:
+            return True
+
+        now = self._clock()
+        if circuit.state == OPEN and now - circuit.opened_at >= self.cooldown:
+            circuit.state = HALF_OPEN
+            circuit.probe_started = None
+
+        if circuit.state == HALF_OPEN and (
+            circuit.probe_started is None or now - circuit.probe_started >= self.cooldown
+        ):
+            circuit.probe_started = now
+            return True
+
+        circuit.rejected += 1
+        return False
+
+    def is_open(self, url: str) -> bool:
+        """指定 URL 的網域是否處於開啟狀態（不改變狀態）。
+
+        Args:
+            url: 目標 URL
+
+        Returns:
+            bool: 斷路器開啟時為 True
+        """
+        circuit = self._circuits.get(self.domain_key(url))
+        return circuit is not None and circuit.state == OPEN
+
+    def retry_after(self, url: str) -> float:
+        """取得斷路器開啟中的網域剩餘冷卻秒數。
+
+        Args:
+            url: 目標 URL
+
+        Returns:
+            float: 剩餘冷卻秒數，未開啟時為 0
+        """
+        circuit = self._circuits.get(self.domain_key(url))
+        if circuit is None or circuit.state != OPEN:
+            return 0.0
+        return max(self.cooldown - (self._clock() - circuit.opened_at), 0.0)
+
+    def record(self, url: str, success: bool) -> None:
+        """回報一次請求結果。
+
+        Args:
+            url: 目標 URL
+            success: 請求是否成功（網域可正常回應）
+        """
+        key = self.domain_key(url)
+        if not key:
+            return
+        circuit = self._get_circuit(key)
+
+        if circuit.state == HALF_OPEN:
+            if success:
+                circuit.state = CLOSED
+                circuit.outcomes.clear()
+                circuit.probe_started = None
+            else:
+                self._open(circuit)
+            return
+
+        circuit.outcomes.append(success)
+        if circuit.state == CLOSED and not success:
+            failures = circuit.failures
+            if (failures >= self.min_failures
+                    and failures / len(circuit.outcomes) >= self.failure_threshold):
+                self._open(circuit)
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = self._clock()
+        circuit.probe_started = None
+        circuit.opens += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得斷路器設定與各網域的狀態。
+
+        Returns:
+            dict: 包含門檻設定、各狀態網域數與非閒置網域詳細狀態的字典
+        """
+        domains = {}
+        for key, circuit in self._circuits.items():
+            if circuit.state == CLOSED and not circuit.failures and not circuit.opens:
+                continue
+            total = len(circuit.outcomes)
+            domains[key] = {
+                'state': circuit.state,
+                'failures': circuit.failures,
+                'requests': total,
+                'failure_rate': round(circuit.failures / total, 3) if total else 0.0,
+                'opens': circuit.opens,
+                'rejected': circuit.rejected,
+                'retry_after': round(self.retry_after(f"http://{key}/"), 1),
+            }
+        states = [circuit.state for circuit in self._circuits.values()]
+        return {
+            'failure_threshold': self.failure_threshold,
+            'min_failures': self.min_failures,
+            'window': self.window,
+            'cooldown': self.cooldown,
+            'open': states.count(OPEN),
+            'half_open': states.count(HALF_OPEN),
+            'domains': domains,
+        }
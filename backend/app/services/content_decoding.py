@@ -0,0 +1,206 @@
+"""HTTP 內容編碼 (Content-Encoding) 解碼模組。
+
+爬蟲關閉 aiohttp 的自動解壓縮，改由此模組逐段解碼，藉此同時
+取得傳輸位元組數 (wire bytes) 與解碼後位元組數，並支援 aiohttp
+本身不支援的 zstd。
+
+brotli 與 zstd 為選用相依套件，只有在可匯入時才會出現在
+Accept-Encoding 中；未安裝時自動退回 gzip / deflate。
+"""
+
+import zlib
+from typing import List, Optional
+
+from aiohttp.compression_utils import HAS_BROTLI, BrotliDecompressor
+
+try:
+    # Python 3.14 以上內建 zstd
+    from compression import zstd as _zstd  # type: ignore[import-not-found]
+    HAS_ZSTD = True
+except ImportError:
+    try:
+        import zstandard as _zstd  # type: ignore[import-not-found]
+        HAS_ZSTD = True
+    except ImportError:
+        _zstd = None
+        HAS_ZSTD = False
+
+
+class ContentDecodingError(Exception):
+    """內容編碼不支援或解碼失敗。"""
+
+
+def supported_encodings() -> List[str]:
+    """取得目前環境可解碼的內容編碼，依偏好排序。
+
+    Returns:
+        List[str]: 內容編碼名稱清單
+    """
+    encodings = []
+    if HAS_ZSTD:
+        encodings.append('zstd')
+    if HAS_BROTLI:
+        encodings.append('br')
+    encodings.extend(['gzip', 'deflate'])
+    return encodings
+
+
+def accept_encoding_header() -> str:
+    """產生 Accept-Encoding 請求標頭值。
+
+    Returns:
+        str: 例如 "zstd, br, gzip, deflate"
+    """
+    return ', '.join(supported_encodings())
+
+
+class _ZlibDecoder:
+    """gzip / deflate 解碼器。
+
+    部分伺服器的 deflate 實際上是不含 zlib 標頭的 raw deflate，
+    第一段解碼失敗時改用 raw 模式重試。
+    """
+
+    def __init__(self, encoding: str):
+        self._gzip = encoding == 'gzip'
+        wbits = 16 + zlib.MAX_WBITS if self._gzip else zlib.MAX_WBITS
+        self._obj = zlib.decompressobj(wbits)
+        self._started = False
+
+    def decompress(self, data: bytes) -> bytes:
+        try:
+            output = self._obj.decompress(data)
+        except zlib.error:
+            if self._gzip or self._started:
+                raise
+            self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+            output = self._obj.decompress(data)
+        self._started = True
+        return output
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+class _BrotliDecoder:
+    """brotli 解碼器（沿用 aiohttp 對 Brotli / brotlicffi 的封裝）。"""
+
+    def __init__(self):
+        self._obj = BrotliDecompressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._obj.decompress_sync(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+class _ZstdDecoder:
+    """zstd 解碼器（支援內建 compression.zstd 與 zstandard 套件）。"""
+
+    def __init__(self):
+        decompressor = _zstd.ZstdDecompressor()
+        # zstandard 需透過 decompressobj() 取得串流解碼物件
+        self._obj = getattr(decompressor, 'decompressobj', lambda: decompressor)()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._obj.decompress(data)
+
+    def flush(self) -> bytes:
+        return b''
+
+
+class ContentDecoder:
+    """依 Content-Encoding 逐段解碼回應內容並統計位元組數。
+
+    Attributes:
+        wire_bytes: 已送入的傳輸位元組數
+        decoded_bytes: 已輸出的解碼後位元組數
+
+    Example:
+        >>> decoder = ContentDecoder(response.headers.get('Content-Encoding'))
+        >>> body = decoder.decompress(raw_chunk) + decoder.flush()
+    """
+
+    def __init__(self, content_encoding: Optional[str] = None):
+        """初始化解碼器。
+
+        Args:
+            content_encoding: Content-Encoding 標頭值，可為逗號分隔的多層編碼
+
+        Raises:
+            ContentDecodingError: 包含不支援的內容編碼
+        """
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self._decoders = []
+
+        codings = [
+            coding.strip().lower()
+            for coding in (content_encoding or '').split(',')
+            if coding.strip()
+        ]
+        # 多層編碼依套用順序的相反順序解碼
+        for coding in reversed(codings):
+            if coding == 'identity':
+                continue
+            self._decoders.append(self._create_decoder(coding))
+
+    @staticmethod
+    def _create_decoder(coding: str):
+        """建立單一編碼的解碼器。"""
+        if coding in ('gzip', 'x-gzip'):
+            return _ZlibDecoder('gzip')
+        if coding == 'deflate':
+            return _ZlibDecoder('deflate')
+        if coding == 'br' and HAS_BROTLI:
+            return _BrotliDecoder()
+        if coding == 'zstd' and HAS_ZSTD:
+            return _ZstdDecoder()
+        raise ContentDecodingError(f"不支援的內容編碼: {coding}")
+
+    @property
+    def is_identity(self) -> bool:
+        """內容是否未經壓縮。"""
+        return not self._decoders
+
+    def decompress(self, data: bytes) -> bytes:
+        """解碼一段傳輸內容。
+
+        Args:
+            data: 傳輸內容
+
+        Returns:
+            bytes: 解碼後內容（可能為空，等待後續資料）
+
+        Raises:
+            ContentDecodingError: 內容損毀無法解碼
+        """
+        self.wire_bytes += len(data)
+        try:
+            for decoder in self._decoders:
+                data = decoder.decompress(data)
+        except Exception as e:
+            raise ContentDecodingError(f"內容解碼失敗: {str(e)}") from e
+        self.decoded_bytes += len(data)
+        return data
+
+    def flush(self) -> bytes:
+        """取出解碼器中剩餘的內容。
+
+        Returns:
+            bytes: 剩餘的解碼後內容
+
+        Raises:
+            ContentDecodingError: 內容損毀無法解碼
+        """
+        data = b''
+        try:
+            for decoder in self._decoders:
+                if data:
+                    data = decoder.decompress(data)
+                data += decoder.flush()
+        except Exception as e:
+            raise ContentDecodingError(f"內容解碼失敗: {str(e)}") from e
+        self.decoded_bytes += len(data)
+        return data
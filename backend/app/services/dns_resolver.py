@@ -0,0 +1,221 @@
+"""具快取的 DNS 解析模組。
+
+此模組提供 aiohttp 連線器使用的 DNS 解析器，解析結果依 TTL
+快取並跨 Session 共用；解析失敗的主機以較短的 TTL 負向快取，
+同一主機的並行查詢合併為單一次查詢。
+"""
+
+import asyncio
+import socket
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiohttp.abc import AbstractResolver, ResolveResult
+from aiohttp.resolver import DefaultResolver
+
+
+@dataclass
+class _DNSEntry:
+    """單一主機的快取項目（成功結果或解析錯誤）。"""
+    addresses: Optional[List[ResolveResult]]
+    error: Optional[OSError]
+    expires_at: float
+
+
+class CachingResolver(AbstractResolver):
+    """依 TTL 快取結果並合併並行查詢的 DNS 解析器。
+
+    - 成功結果快取 ttl 秒，解析失敗快取 negative_ttl 秒
+    - 同一 (主機, 連接埠, 位址族) 的並行查詢只送出一次
+    - 可同時提供給多個 TCPConnector 使用，連線器關閉時不會關閉此解析器
+
+    Example:
+        >>> resolver = CachingResolver(ttl=300, negative_ttl=30)
+        >>> connector = aiohttp.TCPConnector(resolver=resolver, use_dns_cache=False)
+    """
+
+    # 快取項目超過此數量時清除過期項目
+    PRUNE_THRESHOLD = 4096
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """初始化 DNS 解析器。
+
+        Args:
+            ttl: 成功結果的快取秒數
+            negative_ttl: 解析失敗的快取秒數，<= 0 表示不快取失敗
+            clock: 判斷快取過期使用的時鐘函式 (測試可注入假時鐘)
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._cache: Dict[Tuple[str, int, int], _DNSEntry] = {}
+        self._inflight: Dict[Tuple[str, int, int], asyncio.Task] = {}
+        self._resolver: Optional[AbstractResolver] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 統計資訊
+        self._stats = {
+            'lookups': 0,
+            'hits': 0,
+            'negative_hits': 0,
+            'coalesced': 0,
+            'misses': 0,
+            'failures': 0,
+        }
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    def _get_resolver(self) -> AbstractResolver:
+        """取得目前事件迴圈的底層解析器。"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 底層解析器與進行中的查詢皆綁定事件迴圈，切換迴圈時重建
+            self._resolver = DefaultResolver()
+            self._inflight = {}
+            self._loop = loop
+        return self._resolver
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> List[ResolveResult]:
+        """解析主機名稱。
+
+        Args:
+            host: 主機名稱
+            port: 連接埠
+            family: 位址族
+
+        Returns:
+            List[ResolveResult]: 解析結果
+
+        Raises:
+            OSError: 主機名稱無法解析（含負向快取命中）
+        """
+        resolver = self._get_resolver()
+        key = (host.lower(), port, int(family))
+        self._stats['lookups'] += 1
+
+        entry = self._cache.get(key)
+        if entry is not None and entry.expires_at > self._clock():
+            if entry.error is not None:
+                self._stats['negative_hits'] += 1
+                raise type(entry.error)(*entry.error.args)
+            self._stats['hits'] += 1
+            return list(entry.addresses)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self._stats['coalesced'] += 1
+        else:
+            self._stats['misses'] += 1
+            task = self._loop.create_task(self._lookup(resolver, key, host, port, family))
+            # 所有等待者都已取消時仍取出結果，避免未處理例外的警告
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+
+        # shield：單一呼叫端取消時不影響其他合併中的查詢
+        return list(await asyncio.shield(task))
+
+    async def _lookup(
+        self,
+        resolver: AbstractResolver,
+        key: Tuple[str, int, int],
+        host: str,
+        port: int,
+        family: socket.AddressFamily
+    ) -> List[ResolveResult]:
+        """實際查詢並寫入快取。"""
+        started = time.perf_counter()
+        try:
+            addresses = await resolver.resolve(host, port, family)
+        except OSError as e:
+            self._stats['failures'] += 1
+            if self.negative_ttl > 0:
+                self._store(key, _DNSEntry(None, e, self._clock() + self.negative_ttl))
+            raise
+        else:
+            self._store(key, _DNSEntry(addresses, None, self._clock() + self.ttl))
+            return addresses
+        finally:
+            latency = time.perf_counter() - started
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+            self._inflight.pop(key, None)
+
+    def _store(self, key: Tuple[str, int, int], entry: _DNSEntry) -> None:
+        """寫入快取，必要時清除過期項目。"""
+        if len(self._cache) >= self.PRUNE_THRESHOLD:
+            now = self._clock()
+            self._cache = {k: v for k, v in self._cache.items() if v.expires_at > now}
+        self._cache[key] = entry
+
+    def clear(self) -> None:
+        """清除所有快取項目。"""
+        self._cache.clear()
+
+    async def close(self) -> None:
+        """釋放底層解析器。"""
+        resolver, self._resolver, self._loop = self._resolver, None, None
+        self._inflight = {}
+        if resolver is not None:
+            await resolver.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得解析統計資訊。
+
+        Returns:
+            dict: 包含查詢數、命中率與實際查詢延遲的字典
+        """
+        lookups = self._stats['lookups']
+        misses = self._stats['misses']
+        cached = self._stats['hits'] + self._stats['negative_hits'] + self._stats['coalesced']
+        return {
+            'ttl': self.ttl,
+            'negative_ttl': self.negative_ttl,
+            'entries': len(self._cache),
+            **self._stats,
+            'hit_rate': round(cached / lookups, 3) if lookups else 0.0,
+            'avg_latency': round(self._total_latency / misses, 4) if misses else 0.0,
+            'max_latency': round(self._max_latency, 4),
+        }
+
+
+# 全域解析器實例（所有對外連線共用）
+_DNS_RESOLVER: Optional[CachingResolver] = None
+
+
+def get_dns_resolver(ttl: float = 300.0, negative_ttl: float = 30.0) -> CachingResolver:
+    """取得共用的 DNS 解析器。
+
+    TTL 只在第一次呼叫建立實例時生效；之後以不同的 TTL 呼叫會
+    印出警告並沿用既有實例的設定。
+
+    Args:
+        ttl: 成功結果的快取秒數
+        negative_ttl: 解析失敗的快取秒數
+
+    Returns:
+        CachingResolver: 共用的 DNS 解析器
+    """
+    global _DNS_RESOLVER
+    if _DNS_RESOLVER is None:
+        _DNS_RESOLVER = CachingResolver(ttl=ttl, negative_ttl=negative_ttl)
+    elif (_DNS_RESOLVER.ttl, _DNS_RESOLVER.negative_ttl) != (ttl, negative_ttl):
+        print(
+            f"⚠️ 共用 DNS 解析器已建立 (ttl={_DNS_RESOLVER.ttl}, "
+            f"negative_ttl={_DNS_RESOLVER.negative_ttl})，忽略新的設定 "
+            f"(ttl={ttl}, negative_ttl={negative_ttl})"
+        )
+    return _DNS_RESOLVER
+
+
+async def close_dns_resolver() -> None:
+    """釋放共用 DNS 解析器的底層資源（應用程式關閉時呼叫）。"""
+    if _DNS_RESOLVER is not None:
+        await _DNS_RESOLVER.close()
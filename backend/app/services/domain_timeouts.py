@@ -0,0 +1,261 @@
+"""依網域延遲歷史調整逾時的模組。
+
+此模組為每個網域維護成功回應延遲的直方圖，並以延遲的高百分位數
+推算該網域的請求逾時：平常很快的網域使用較緊的逾時，已知較慢
+的網域給予較寬的逾時，兩者皆受全域下限與上限約束。逾時不列入
+延遲直方圖，而是另計近期逾時比例；近期多數請求逾時的網域不再
+放寬，而是向下限收緊。直方圖可選擇以 JSON 檔保存，應用程式重啟
+後沿用。
+"""
+
+import json
+import math
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+
+# 直方圖區間上界（秒），約以 1.25 倍遞增，涵蓋 50ms 至約 120 秒
+_BUCKET_BOUNDS: List[float] = [round(0.05 * 1.25 ** i, 4) for i in range(36)]
+
+
+class _LatencyHistogram:
+    """單一網域的成功延遲直方圖與逾時統計。"""
+
+    __slots__ = ('counts', 'total', 'timeouts', 'timeout_rate')
+
+    def __init__(
+        self,
+        counts: Optional[List[float]] = None,
+        timeouts: float = 0.0,
+        timeout_rate: float = 0.0
+    ):
+        self.counts = list(counts) if counts else [0.0] * len(_BUCKET_BOUNDS)
+        self.total = sum(self.counts)
+        self.timeouts = timeouts
+        # 近期逾時比例 (指數加權移動平均)
+        self.timeout_rate = timeout_rate
+
+    @property
+    def attempts(self) -> float:
+        return self.total + self.timeouts
+
+    def add(self, latency: float) -> None:
+        for index, bound in enumerate(_BUCKET_BOUNDS):
+            if latency <= bound:
+                break
+        self.counts[index] += 1
+        self.total += 1
+
+    def decay(self) -> None:
+        """樣本減半，讓近期的延遲占較大權重。"""
+        self.counts = [count / 2 for count in self.counts]
+        self.total = sum(self.counts)
+        self.timeouts /= 2
+
+    def percentile(self, percentile: float) -> float:
+        target = self.total * percentile / 100
+        cumulative = 0.0
+        for count, bound in zip(self.counts, _BUCKET_BOUNDS):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return _BUCKET_BOUNDS[-1]
+
+
+class DomainTimeoutTracker:
+    """記錄各網域延遲並推算個別逾時的追蹤器。
+
+    - 逾時 = 成功延遲的 percentile 百分位數 × multiplier，限制在 [floor, cap]
+    - 嘗試次數未達 min_samples、或成功樣本不足的網域使用預設逾時
+    - 逾時的請求不列入延遲直方圖，只更新近期逾時比例；比例達
+      TIMEOUT_RATE_THRESHOLD 時逾時不超過預設值，並依比例向下限收緊，
+      避免持續無回應的網域每次都等到上限
+    - 單一網域樣本數超過 max_samples 時減半，保持對近期變化的反應
+
+    Example:
+        >>> tracker = DomainTimeoutTracker(default=10.0, floor=2.0, cap=30.0)
+        >>> tracker.record("https://example.com/a", 0.8)
+        >>> tracker.timeout_for("https://example.com/b")
+        10.0
+    """
+
+    # 網域數超過此數量時清除樣本最少的項目
+    MAX_DOMAINS = 4096
+    # 近期逾時比例的更新權重與開始收緊逾時的門檻
+    TIMEOUT_RATE_WEIGHT = 0.3
+    TIMEOUT_RATE_THRESHOLD = 0.5
+
+    def __init__(
+        self,
+        default: float = 10.0,
+        floor: float = 2.0,
+        cap: float = 30.0,
+        percentile: float = 99.0,
+        multiplier: float = 2.0,
+        min_samples: int = 5,
+        max_samples: int = 500,
+        history_path: Optional[str] = None
+    ):
+        """初始化逾時追蹤器。
+
+        Args:
+            default: 樣本不足時使用的逾時秒數
+            floor: 逾時下限秒數
+            cap: 逾時上限秒數
+            percentile: 推算逾時使用的延遲百分位數 (0-100)
+            multiplier: 百分位數延遲的放大倍數
+            min_samples: 開始調整逾時前所需的最少樣本數
+            max_samples: 單一網域樣本數上限，超過時樣本減半
+            history_path: 延遲歷史的 JSON 保存路徑，None 表示僅保存在記憶體
+        """
+        self.default = default
+        self.floor = floor
+        self.cap = max(cap, floor)
+        self.percentile = min(max(percentile, 0.0), 100.0)
+        self.multiplier = multiplier
+        self.min_samples = max(min_samples, 1)
+        self.max_samples = max(max_samples, self.min_samples * 2)
+        self.history_path = history_path
+        self._domains: Dict[str, _LatencyHistogram] = {}
+
+        if history_path:
+            self._load()
+
+    @staticmethod
+    def domain_key(url: str) -> str:
+        """取得 URL 的網域鍵值 (小寫的主機名稱)。
+
+        Args:
+            url: 目標 URL
+
+        Returns:
+            str: 網域鍵值，無法解析時為空字串
+        """
+        try:
+            return (urlsplit(url).hostname or '').lower()
+        except ValueError:
+            return ''
+
+    def timeout_for(self, url: str) -> float:
+        """取得指定 URL 網域的請求逾時。
+
+        Args:
+            url: 目標 URL
+
+        Returns:
+            float: 逾時秒數
+        """
+        histogram = self._domains.get(self.domain_key(url))
+        if histogram is None or histogram.attempts < self.min_samples:
+            return self.default
+
+        if histogram.total >= self.min_samples:
+            # 只由成功延遲推算較寬或較緊的逾時
+            timeout = histogram.percentile(self.percentile) * self.multiplier
+        else:
+            timeout = self.default
+
+        if histogram.timeout_rate >= self.TIMEOUT_RATE_THRESHOLD:
+            # 近期多數逾時：不再放寬，依逾時比例向下限收緊
+            timeout = min(timeout, self.default) * (1 - histogram.timeout_rate)
+        return round(min(max(timeout, self.floor), self.cap), 3)
+
+    def record(self, url: str, latency: float, timed_out: bool = False) -> None:
+        """記錄一次請求的結果。
+
+        Args:
+            url: 目標 URL
+            latency: 請求耗時秒數；逾時時不列入延遲直方圖
+            timed_out: 請求是否逾時
+        """
+        key = self.domain_key(url)
+        if not key:
+            return
+        histogram = self._domains.get(key)
+        if histogram is None:
+            if len(self._domains) >= self.MAX_DOMAINS:
+                self._prune()
+            histogram = self._domains[key] = _LatencyHistogram()
+        weight = self.TIMEOUT_RATE_WEIGHT
+        histogram.timeout_rate = (1 - weight) * histogram.timeout_rate + weight * (1.0 if timed_out else 0.0)
+        if timed_out:
+            histogram.timeouts += 1
+        else:
+            histogram.add(latency)
+        if histogram.attempts > self.max_samples:
+            histogram.decay()
+
+    def _prune(self) -> None:
+        """移除樣本最少的一半網域。"""
+        ordered = sorted(self._domains.items(), key=lambda item: item[1].total, reverse=True)
+        self._domains = dict(ordered[:len(ordered) // 2])
+
+    def _load(self) -> None:
+        """從 JSON 檔載入延遲歷史，檔案不存在或格式不符時略過。"""
+        try:
+            with open(self.history_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('bounds') != _BUCKET_BOUNDS:
+            return
+        for key, entry in data.get('domains', {}).items():
+            counts = entry.get('counts', [])
+            if len(counts) == len(_BUCKET_BOUNDS):
+                self._domains[key] = _LatencyHistogram(
+                    counts, entry.get('timeouts', 0.0), entry.get('timeout_rate', 0.0)
+                )
+
+    def save(self) -> None:
+        """將延遲歷史寫入 JSON 檔（未設定保存路徑時不做任何事）。"""
+        if not self.history_path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.history_path))
+        os.makedirs(directory, exist_ok=True)
+        data = {
+            'bounds': _BUCKET_BOUNDS,
+            'domains': {
+                key: {
+                    'counts': histogram.counts,
+                    'timeouts': histogram.timeouts,
+                    'timeout_rate': histogram.timeout_rate,
+                }
+                for key, histogram in self._domains.items()
+            },
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.history_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得各網域的延遲與逾時統計。
+
+        Returns:
+            dict: 包含全域設定與各網域樣本數、百分位數延遲與目前逾時的字典
+        """
+        domains = {}
+        for key, histogram in self._domains.items():
+            domains[key] = {
+                'samples': math.floor(histogram.total),
+                'timeouts': math.floor(histogram.timeouts),
+                'timeout_rate': round(histogram.timeout_rate, 3),
+                'p50': histogram.percentile(50),
+                'p99': histogram.percentile(99),
+                'timeout': self.timeout_for(f"http://{key}/"),
+            }
+        return {
+            'default': self.default,
+            'floor': self.floor,
+            'cap': self.cap,
+            'percentile': self.percentile,
+            'multiplier': self.multiplier,
+            'domains': domains,
+        }
@@ -0,0 +1,116 @@
+"""對沖請求 (hedged request) 策略模組。
+
+此模組依近期請求延遲的百分位數決定何時對慢速請求發出第二個
+相同請求，並以預算限制額外請求的比例，降低單一卡住連線造成
+的尾端延遲。
+"""
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+class HedgePolicy:
+    """依延遲百分位數與預算決定是否發出對沖請求。
+
+    - 請求耗時超過近期延遲的 percentile 百分位數時觸發對沖
+    - 樣本數未達 min_samples 前不對沖（延遲分布尚未可信）
+    - 對沖請求數不超過主要請求數的 budget 比例
+
+    Example:
+        >>> policy = HedgePolicy(percentile=95, budget=0.1)
+        >>> delay = policy.hedge_delay()  # None 表示目前不對沖
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        budget: float = 0.1,
+        min_samples: int = 20,
+        window: int = 200
+    ):
+        """初始化對沖策略。
+
+        Args:
+            percentile: 觸發對沖的延遲百分位數 (0-100)
+            budget: 對沖請求占主要請求數的比例上限
+            min_samples: 開始對沖前所需的最少延遲樣本數
+            window: 保留的近期延遲樣本數
+        """
+        self.percentile = min(max(percentile, 0.0), 100.0)
+        self.budget = max(budget, 0.0)
+        self.min_samples = max(min_samples, 1)
+        self._latencies: Deque[float] = deque(maxlen=max(window, 1))
+
+        # 統計資訊
+        self._requests = 0
+        self._hedged = 0
+        self._won = 0
+        self._denied = 0
+        self._no_slot = 0
+
+    def record(self, latency: float) -> None:
+        """記錄一次成功請求的延遲。
+
+        Args:
+            latency: 請求耗時 (秒)
+        """
+        self._latencies.append(latency)
+
+    def hedge_delay(self) -> Optional[float]:
+        """取得主要請求開始後觸發對沖的等待秒數，並計入一次主要請求。
+
+        Returns:
+            Optional[float]: 觸發對沖的秒數，樣本不足時為 None
+        """
+        self._requests += 1
+        return self._trigger_delay()
+
+    def _trigger_delay(self) -> Optional[float]:
+        """計算近期延遲的百分位數，樣本不足時為 None。"""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = math.ceil(len(ordered) * self.percentile / 100) - 1
+        return ordered[min(max(index, 0), len(ordered) - 1)]
+
+    def try_acquire(self) -> bool:
+        """嘗試取得一次對沖預算。
+
+        Returns:
+            bool: 預算足夠時為 True 並計入一次對沖
+        """
+        if self._hedged + 1 > self._requests * self.budget:
+            self._denied += 1
+            return False
+        self._hedged += 1
+        return True
+
+    def record_no_slot(self) -> None:
+        """記錄因主機或全域名額已滿而未發出的對沖。"""
+        self._no_slot += 1
+
+    def record_win(self) -> None:
+        """記錄對沖請求先於主要請求完成。"""
+        self._won += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得對沖統計資訊。
+
+        Returns:
+            dict: 包含主要請求數、對沖數、對沖勝出數、因預算或名額不足
+            而未對沖的次數與目前觸發延遲的字典
+        """
+        trigger = self._trigger_delay()
+        return {
+            'percentile': self.percentile,
+            'budget': self.budget,
+            'samples': len(self._latencies),
+            'trigger_delay': round(trigger, 4) if trigger is not None else None,
+            'requests': self._requests,
+            'hedged': self._hedged,
+            'won': self._won,
+            'denied': self._denied,
+            'no_slot': self._no_slot,
+            'hedge_ratio': round(self._hedged / self._requests, 4) if self._requests else 0.0,
+        }
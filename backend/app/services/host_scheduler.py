@@ -0,0 +1,238 @@
+"""主機禮貌性排程模組。
+
+此模組限制同一主機的並行請求數，並在同一主機的兩次請求
+開始之間保留最小間隔，避免 SERP 中同網域的多個結果同時
+打到同一台主機而觸發限流 (HTTP 429)。
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+
+class _HostState:
+    """單一主機的排程狀態。"""
+
+    __slots__ = ('semaphore', 'next_start', 'active', 'waiting')
+
+    def __init__(self, limit: int) -> None:
+        self.semaphore: Optional[asyncio.Semaphore] = asyncio.Semaphore(limit) if limit > 0 else None
+        self.next_start = 0.0
+        self.active = 0
+        self.waiting = 0
+
+
+class HostScheduler:
+    """依主機排程請求的禮貌性排程器。
+
+    - 每個主機最多同時 per_host_limit 個請求（<= 0 表示不限制）
+    - 同一主機兩次請求開始之間至少間隔 min_delay 秒
+    - 不同主機之間互不影響；全域並行上限仍由呼叫端控制
+    - 對沖等可放棄的額外請求以 try_acquire() 不等待地取得名額
+
+    Example:
+        >>> scheduler = HostScheduler(per_host_limit=2, min_delay=0.5)
+        >>> async with scheduler.slot("https://example.com/a"):
+        ...     pass
+    """
+
+    # 主機狀態超過此數量時清除閒置項目
+    PRUNE_THRESHOLD = 1024
+
+    def __init__(self, per_host_limit: int = 2, min_delay: float = 0.5):
+        """初始化主機排程器。
+
+        Args:
+            per_host_limit: 單一主機最大並行請求數，<= 0 表示不限制
+            min_delay: 同一主機兩次請求開始之間的最小間隔秒數
+        """
+        self.per_host_limit = per_host_limit
+        self.min_delay = max(min_delay, 0.0)
+        self._hosts: Dict[str, _HostState] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 統計資訊
+        self._requests = 0
+        self._delayed = 0
+        self._total_delay = 0.0
+        self._skipped = 0
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        """取得 URL 的主機鍵值 (小寫的 host:port)。
+
+        Args:
+            url: 目標 URL
+
+        Returns:
+            str: 主機鍵值，無法解析時為空字串
+        """
+        try:
+            return urlsplit(url).netloc.lower()
+        except ValueError:
+            return ''
+
+    @asynccontextmanager
+    async def slot(
+        self, url: str, gate: Optional[asyncio.Semaphore] = None
+    ) -> AsyncIterator[None]:
+        """取得指定 URL 主機的請求名額，離開區塊時釋放。
+
+        禮貌性間隔在取得 gate (例如全域並行上限) 之後才預約，
+        避免在 gate 前等待的同主機請求被同時放行而連續發出；
+        需要等待間隔時先釋放 gate，等待期間不佔用全域名額。
+
+        Args:
+            url: 目標 URL
+            gate: 取得主機名額後還需取得的 Semaphore (可選)
+        """
+        state = self._get_state(url)
+
+        state.waiting += 1
+        try:
+            if state.semaphore is not None:
+                await state.semaphore.acquire()
+        finally:
+            state.waiting -= 1
+
+        try:
+            await self._wait_for_turn(state, gate)
+            try:
+                state.active += 1
+                self._requests += 1
+                yield
+            finally:
+                state.active -= 1
+                if gate is not None:
+                    gate.release()
+        finally:
+            if state.semaphore is not None:
+                state.semaphore.release()
+
+    async def try_acquire(self, url: str, gate: Optional[asyncio.Semaphore] = None) -> bool:
+        """不等待地嘗試取得主機名額與 gate，供對沖等可放棄的額外請求使用。
+
+        主機名額已滿、gate 沒有空位，或尚未到達主機的下一個開始時間時
+        回傳 False 且不佔用任何名額；成功時預約開始時間，請求結束後
+        須呼叫 release()。
+
+        Args:
+            url: 目標 URL
+            gate: 還需取得的 Semaphore 或自適應並行限制器 (可選)
+
+        Returns:
+            bool: 是否已取得名額
+        """
+        state = self._get_state(url)
+        now = self._loop.time()
+        if ((state.semaphore is not None and state.semaphore.locked())
+                or (gate is not None and gate.locked())
+                or (self.min_delay > 0 and state.next_start > now)):
+            self._skipped += 1
+            return False
+
+        # 未滿時 acquire 不會暫停，檢查與取得之間不會被其他工作插入
+        if state.semaphore is not None:
+            await state.semaphore.acquire()
+        if gate is not None:
+            await gate.acquire()
+        if self.min_delay > 0:
+            state.next_start = now + self.min_delay
+        state.active += 1
+        self._requests += 1
+        return True
+
+    def release(self, url: str, gate: Optional[asyncio.Semaphore] = None) -> None:
+        """歸還 try_acquire() 取得的主機名額與 gate。
+
+        Args:
+            url: 目標 URL
+            gate: try_acquire() 時傳入的 gate (可選)
+        """
+        state = self._hosts.get(self.host_key(url))
+        if state is not None:
+            state.active -= 1
+            if state.semaphore is not None:
+                state.semaphore.release()
+        if gate is not None:
+            gate.release()
+
+    def _get_state(self, url: str) -> _HostState:
+        """取得 URL 主機的排程狀態，必要時建立。"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Semaphore 綁定事件迴圈，切換迴圈時重建主機狀態
+            self._hosts = {}
+            self._loop = loop
+
+        host = self.host_key(url)
+        state = self._hosts.get(host)
+        if state is None:
+            self._prune()
+            state = self._hosts[host] = _HostState(self.per_host_limit)
+        return state
+
+    async def _wait_for_turn(
+        self, state: _HostState, gate: Optional[asyncio.Semaphore] = None
+    ) -> None:
+        """取得 gate 並預約請求開始時間，返回時持有 gate。
+
+        尚未到達主機的下一個開始時間時，先釋放 gate 再等待，醒來後
+        重新取得 gate 並再次檢查；只有持有 gate 且間隔已過時才預約，
+        因此同主機的請求不會連續發出，等待中的請求也不佔用 gate。
+        """
+        delayed = False
+        while True:
+            if gate is not None:
+                await gate.acquire()
+
+            # 在同一個事件迴圈步驟內讀取並更新，預約不會互相覆蓋
+            now = self._loop.time()
+            delay = state.next_start - now if self.min_delay > 0 else 0.0
+            if delay <= 0:
+                if self.min_delay > 0:
+                    state.next_start = now + self.min_delay
+                if delayed:
+                    self._delayed += 1
+                return
+
+            if gate is not None:
+                gate.release()
+            delayed = True
+            self._total_delay += delay
+            await asyncio.sleep(delay)
+
+    def _prune(self) -> None:
+        """清除沒有進行中請求、且禮貌性間隔已過期的主機狀態。"""
+        if len(self._hosts) < self.PRUNE_THRESHOLD:
+            return
+        now = self._loop.time()
+        idle = [
+            host for host, state in self._hosts.items()
+            if not state.active and not state.waiting and state.next_start <= now
+        ]
+        for host in idle:
+            del self._hosts[host]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得排程統計資訊。
+
+        Returns:
+            dict: 包含各主機進行中與等待中的請求數，以及禮貌性延遲統計
+        """
+        busy_hosts = {
+            host: {'active': state.active, 'waiting': state.waiting}
+            for host, state in self._hosts.items()
+            if state.active or state.waiting
+        }
+        return {
+            'per_host_limit': self.per_host_limit,
+            'min_delay': self.min_delay,
+            'tracked_hosts': len(self._hosts),
+            'busy_hosts': busy_hosts,
+            'requests': self._requests,
+            'delayed_requests': self._delayed,
+            'total_delay': round(self._total_delay, 3),
+            'skipped_requests': self._skipped,
+        }
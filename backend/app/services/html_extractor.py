@@ -0,0 +1,437 @@
+"""HTML SEO 元素擷取模組。
+
+此模組提供不依賴事件迴圈的純函式 HTML 解析，可直接在
+執行緒池或行程池中執行，並回傳精簡的 SEO 元素字典。
+
+提供兩種擷取引擎：
+- lxml: 以 lxml 解析器目標 (parser target) 單次走訪完成所有擷取，
+  不建立樹狀結構，速度快且記憶體用量低（預設）
+- bs4: 原本的 BeautifulSoup 實作，保留作為對照與備援
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, Tag
+from bs4.element import NavigableString
+from lxml import etree
+
+from ..utils.charset import bom_length, charset_candidates, resolve_charset
+from ..utils.text_stats import analyze_text
+
+
+ENGINES = ('lxml', 'bs4')
+DEFAULT_ENGINE = 'lxml'
+
+
+class HTMLExtractionError(Exception):
+    """HTML 無法解析時的例外。"""
+
+
+def extract_seo_elements(
+    html: Union[str, bytes],
+    encoding: Optional[str] = None,
+    engine: str = DEFAULT_ENGINE
+) -> Dict[str, Any]:
+    """從 HTML 內容中提取 SEO 相關元素。
+    
+    Args:
+        html: HTML 原始內容 (字串或位元組)
+        encoding: 位元組內容的已知編碼 (可選)
+        engine: 擷取引擎 (lxml 或 bs4)
+        
+    Returns:
+        dict: 包含 title、meta_description、h1、h2_list、
+        word_count、paragraph_count 與 sentence_count 的字典
+        
+    Raises:
+        HTMLExtractionError: HTML 解析失敗
+        ValueError: 引擎不受支援時
+    """
+    if engine == 'lxml':
+        return _extract_with_lxml(html, encoding)
+    if engine == 'bs4':
+        return _extract_with_bs4(html, encoding)
+    raise ValueError(f"不支援的 HTML 擷取引擎: {engine}")
+
+
+def _extract_with_bs4(
+    html: Union[str, bytes],
+    encoding: Optional[str] = None
+) -> Dict[str, Any]:
+    """以 BeautifulSoup 提取 SEO 元素（原始實作）。
+    
+    Args:
+        html: HTML 原始內容 (字串或位元組)
+        encoding: 位元組內容的已知編碼 (可選)
+        
+    Returns:
+        dict: SEO 元素字典
+        
+    Raises:
+        HTMLExtractionError: HTML 解析失敗
+    """
+    try:
+        # 使用 lxml 解析器提升效能
+        if isinstance(html, bytes):
+            # 預先以 BOM / 標頭 / meta 判定編碼，避免整份文件的編碼猜測
+            soup = BeautifulSoup(html, 'lxml', from_encoding=resolve_charset(html, encoding)[0])
+        else:
+            soup = BeautifulSoup(html, 'lxml')
+    except Exception as e:
+        raise HTMLExtractionError(f"HTML 解析失敗: {str(e)}") from e
+    
+    result = {}
+    
+    # 提取頁面標題
+    title_tag = soup.find('title')
+    result['title'] = title_tag.get_text(strip=True) if title_tag else None
+    
+    # 提取 Meta Description
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    if not meta_desc:
+        meta_desc = soup.find('meta', attrs={'property': 'og:description'})
+    
+    if meta_desc and isinstance(meta_desc, Tag):
+        # 根據 BeautifulSoup 文檔，使用 get 方法安全存取屬性
+        content = meta_desc.get('content', '')
+        if content and isinstance(content, (str, list)):
+            # 處理可能的 list 類型 (如 class 屬性)
+            content_str = content[0] if isinstance(content, list) else content
+            result['meta_description'] = content_str.strip() if content_str else None
+        else:
+            result['meta_description'] = None
+    else:
+        result['meta_description'] = None
+    
+    # 提取 H1 標籤 (取第一個)
+    h1_tag = soup.find('h1')
+    result['h1'] = h1_tag.get_text(strip=True) if h1_tag else None
+    
+    # 提取所有 H2 標籤
+    h2_tags = soup.find_all('h2')
+    result['h2_list'] = []
+    for h2 in h2_tags:
+        if h2 and isinstance(h2, Tag):
+            h2_text = h2.get_text(strip=True)
+            if h2_text:
+                result['h2_list'].append(h2_text)
+    
+    # 計算內文字數和段落數
+    # 移除 script, style, nav, footer 等非內容標籤
+    for element in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
+        element.decompose()
+    
+    # 提取主要內容區域的文字
+    main_content = (soup.find('main') or soup.find('article') or 
+                   soup.find('div', class_='content') or soup.find('body'))
+    
+    if main_content and isinstance(main_content, (Tag, NavigableString)):
+        # 字數、句數與文字段落數 (CJK 字元 + 單字)
+        if isinstance(main_content, Tag):
+            stats = analyze_text(main_content.get_text(separator=' '))
+            paragraphs = main_content.find_all('p')
+        else:
+            stats = analyze_text(str(main_content))
+            paragraphs = []
+        result['word_count'] = stats.word_count
+        result['sentence_count'] = stats.sentence_count
+        
+        # 計算段落數 (p 標籤 + 以空行分隔的文字區塊)
+        result['paragraph_count'] = max(len(paragraphs), stats.paragraph_count, 1)
+    else:
+        result['word_count'] = 0
+        result['paragraph_count'] = 0
+        result['sentence_count'] = 0
+    
+    return result
+
+
+# lxml 引擎：與 BeautifulSoup 建樹規則一致的字串切分與分類
+_ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+# 內容被 BeautifulSoup 歸為特殊字串類別、不計入 get_text() 的標籤
+_STRING_CONTAINER_TAGS = frozenset({'rt', 'rp', 'style', 'script', 'template'})
+_PRESERVE_WHITESPACE_TAGS = frozenset({'pre', 'textarea'})
+# 計算字數前移除的非內容標籤
+_NON_CONTENT_TAGS = frozenset({'script', 'style', 'nav', 'footer', 'header', 'aside'})
+# 主要內容區域候選，依優先順序排列
+_MAIN_CONTENT_KINDS = ('main', 'article', 'div.content', 'body')
+
+
+class _ContentCandidate:
+    """主要內容區域候選元素的累積資料。"""
+
+    __slots__ = ('strings', 'paragraphs')
+
+    def __init__(self) -> None:
+        self.strings: List[str] = []
+        self.paragraphs = 0
+
+
+class _SEOExtractionTarget:
+    """lxml 解析器目標，在解析事件中一次完成所有 SEO 元素擷取。
+    
+    字串的切分、空白折疊與分類規則比照 BeautifulSoup 的建樹邏輯，
+    使擷取結果與 bs4 引擎一致：
+    - 相鄰的文字事件合併為同一字串，遇到標籤、註解等事件時切分
+    - 只有 ASCII 空白的字串折疊為單一換行或空白（pre、textarea 內除外）
+    - script、style、template 等標籤內的字串不計入文字
+    - 結束標籤會關閉最近一個同名的開啟標籤，找不到時忽略
+    """
+
+    def __init__(self) -> None:
+        self._stack: List[Tuple[str, tuple]] = []
+        self._open_counts: Dict[str, int] = {}
+        self._data: List[str] = []
+        self._container_depth = 0
+        self._preserve_depth = 0
+        self._removed_depth = 0
+
+        self._title: Optional[List[str]] = None
+        self._h1: Optional[List[str]] = None
+        self._h2_list: List[List[str]] = []
+        self._meta_description: Optional[str] = None
+        self._meta_found = False
+        self._og_description: Optional[str] = None
+        self._og_found = False
+
+        # 目前開啟中、需要收集文字的元素
+        self._active_captures: List[List[str]] = []
+        self._active_candidates: List[_ContentCandidate] = []
+        self._candidates: Dict[str, _ContentCandidate] = {}
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        self._flush()
+        roles = []
+
+        if tag in _STRING_CONTAINER_TAGS:
+            self._container_depth += 1
+        if tag in _PRESERVE_WHITESPACE_TAGS:
+            self._preserve_depth += 1
+        if tag in _NON_CONTENT_TAGS:
+            self._removed_depth += 1
+
+        # title、h1、h2 與 meta 在移除非內容標籤之前擷取
+        if tag == 'title' and self._title is None:
+            self._title = []
+            roles.append(self._title)
+        elif tag == 'h1' and self._h1 is None:
+            self._h1 = []
+            roles.append(self._h1)
+        elif tag == 'h2':
+            parts: List[str] = []
+            self._h2_list.append(parts)
+            roles.append(parts)
+        elif tag == 'meta':
+            self._handle_meta(attrib)
+
+        if not self._removed_depth:
+            if tag == 'p':
+                for candidate in self._active_candidates:
+                    candidate.paragraphs += 1
+            else:
+                kind = self._candidate_kind(tag, attrib)
+                if kind and kind not in self._candidates:
+                    candidate = _ContentCandidate()
+                    self._candidates[kind] = candidate
+                    roles.append(candidate)
+
+        for role in roles:
+            if isinstance(role, _ContentCandidate):
+                self._active_candidates.append(role)
+            else:
+                self._active_captures.append(role)
+
+        self._stack.append((tag, tuple(roles)))
+        self._open_counts[tag] = self._open_counts.get(tag, 0) + 1
+
+    def end(self, tag: str) -> None:
+        self._flush()
+        if not self._open_counts.get(tag):
+            return
+        while self._stack:
+            if self._pop() == tag:
+                break
+
+    def data(self, data: str) -> None:
+        self._data.append(data)
+
+    def comment(self, _text: str) -> None:
+        self._flush()
+
+    def pi(self, _target: str, _data: Optional[str] = None) -> None:
+        self._flush()
+
+    def doctype(self, *_args: Any) -> None:
+        self._flush()
+
+    def close(self) -> Dict[str, Any]:
+        self._flush()
+        while self._stack:
+            self._pop()
+        return self._result()
+
+    def _handle_meta(self, attrib: Dict[str, str]) -> None:
+        """記錄第一個 description 與 og:description meta 的內容。"""
+        if not self._meta_found and attrib.get('name') == 'description':
+            self._meta_found = True
+            self._meta_description = attrib.get('content', '')
+        elif not self._og_found and attrib.get('property') == 'og:description':
+            self._og_found = True
+            self._og_description = attrib.get('content', '')
+
+    @staticmethod
+    def _candidate_kind(tag: str, attrib: Dict[str, str]) -> Optional[str]:
+        """判斷元素屬於哪一種主要內容區域候選。"""
+        if tag in ('main', 'article', 'body'):
+            return tag
+        if tag == 'div' and 'content' in attrib.get('class', '').split():
+            return 'div.content'
+        return None
+
+    def _pop(self) -> str:
+        """關閉堆疊頂端的元素並回傳其標籤名稱。"""
+        tag, roles = self._stack.pop()
+        self._open_counts[tag] -= 1
+        if tag in _STRING_CONTAINER_TAGS:
+            self._container_depth -= 1
+        if tag in _PRESERVE_WHITESPACE_TAGS:
+            self._preserve_depth -= 1
+        if tag in _NON_CONTENT_TAGS:
+            self._removed_depth -= 1
+        for role in roles:
+            active = self._active_candidates if isinstance(role, _ContentCandidate) else self._active_captures
+            # 以物件身分移除（內容相同的收集清單彼此相等）
+            for index in range(len(active) - 1, -1, -1):
+                if active[index] is role:
+                    del active[index]
+                    break
+        return tag
+
+    def _flush(self) -> None:
+        """將累積的文字事件合併為一個字串並分配給收集中的元素。"""
+        if not self._data:
+            return
+        text = ''.join(self._data)
+        self._data = []
+
+        if not self._preserve_depth and not text.strip(_ASCII_SPACES):
+            text = '\n' if '\n' in text else ' '
+
+        # 特殊容器內的字串不計入任何 get_text() 結果
+        if self._container_depth:
+            return
+
+        if self._active_captures:
+            stripped = text.strip()
+            if stripped:
+                for parts in self._active_captures:
+                    parts.append(stripped)
+
+        if not self._removed_depth:
+            for candidate in self._active_candidates:
+                candidate.strings.append(text)
+
+    def _result(self) -> Dict[str, Any]:
+        """組合擷取結果，欄位與 bs4 引擎相同。"""
+        result: Dict[str, Any] = {}
+        result['title'] = ''.join(self._title) if self._title is not None else None
+
+        if self._meta_found:
+            content = self._meta_description
+        elif self._og_found:
+            content = self._og_description
+        else:
+            content = None
+        result['meta_description'] = content.strip() if content else None
+
+        result['h1'] = ''.join(self._h1) if self._h1 is not None else None
+        result['h2_list'] = [text for text in (''.join(parts) for parts in self._h2_list) if text]
+
+        main_content = next(
+            (self._candidates[kind] for kind in _MAIN_CONTENT_KINDS if kind in self._candidates),
+            None
+        )
+        if main_content is None:
+            result['word_count'] = 0
+            result['paragraph_count'] = 0
+            result['sentence_count'] = 0
+            return result
+
+        # 與 bs4 引擎的 get_text(separator=' ') 相同的文字
+        stats = analyze_text(' '.join(main_content.strings))
+        result['word_count'] = stats.word_count
+        result['sentence_count'] = stats.sentence_count
+        result['paragraph_count'] = max(main_content.paragraphs, stats.paragraph_count, 1)
+        return result
+
+
+def _lxml_parse_strategies(
+    html: Union[str, bytes],
+    encoding: Optional[str]
+) -> List[Tuple[Union[str, bytes], Optional[str]]]:
+    """產生 (內容, 編碼) 嘗試清單。
+
+    位元組內容直接交給 lxml 解碼，不先轉成字串；編碼依 BOM、
+    已知編碼與 meta 預掃描判定，失敗時改用 UTF-8 / windows-1252。
+    """
+    if isinstance(html, str):
+        # lxml 無法處理開頭的 BOM
+        if html.startswith('\ufeff'):
+            html = html[1:]
+        return [(html, None), (html.encode('utf8'), 'utf8')]
+
+    markup = html[bom_length(html):]
+    return [(markup, candidate) for candidate in charset_candidates(html, encoding)]
+
+
+def _extract_with_lxml(
+    html: Union[str, bytes],
+    encoding: Optional[str] = None
+) -> Dict[str, Any]:
+    """以 lxml 解析器目標單次走訪提取 SEO 元素。
+    
+    Args:
+        html: HTML 原始內容 (字串或位元組)
+        encoding: 位元組內容的已知編碼 (可選)
+        
+    Returns:
+        dict: SEO 元素字典，與 bs4 引擎結果相同
+        
+    Raises:
+        HTMLExtractionError: HTML 解析失敗
+    """
+    errors = []
+    for markup, candidate_encoding in _lxml_parse_strategies(html, encoding):
+        try:
+            parser = etree.HTMLParser(
+                target=_SEOExtractionTarget(), recover=True, encoding=candidate_encoding
+            )
+            parser.feed(markup)
+            return parser.close()
+        except (UnicodeDecodeError, LookupError, etree.ParserError) as e:
+            errors.append(e)
+    raise HTMLExtractionError(f"HTML 解析失敗: {errors[-1] if errors else '無可用編碼'}")
+
+
+def extract_with_cpu_time(
+    html: Union[str, bytes],
+    encoding: Optional[str] = None,
+    engine: str = DEFAULT_ENGINE
+) -> Tuple[Dict[str, Any], float]:
+    """提取 SEO 元素並量測本次解析耗用的 CPU 時間。
+    
+    使用 thread_time() 量測，在執行緒池與行程池中皆只計入
+    當前工作者本身的 CPU 時間。
+    
+    Args:
+        html: HTML 原始內容 (字串或位元組)
+        encoding: 位元組內容的已知編碼 (可選)
+        engine: 擷取引擎 (lxml 或 bs4)
+        
+    Returns:
+        tuple: (SEO 元素字典, CPU 時間秒數)
+    """
+    cpu_start = time.thread_time()
+    result = extract_seo_elements(html, encoding, engine)
+    return result, time.thread_time() - cpu_start
@@ -0,0 +1,322 @@
+"""原始 HTML 磁碟儲存模組。
+
+此模組將爬取到的 HTML 連同 HTTP 驗證器 (ETag / Last-Modified)
+儲存在本機磁碟，讓之後的爬取可以發送條件式請求
+(If-None-Match / If-Modified-Since)，在伺服器回應 304 時
+直接重用已儲存的內容，並以總容量上限搭配 LRU 淘汰舊項目。
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+
+@dataclass
+class StoredPage:
+    """已儲存頁面的中繼資料。
+
+    Attributes:
+        url: 原始 URL
+        etag: 伺服器回傳的 ETag
+        last_modified: 伺服器回傳的 Last-Modified
+        charset: 內容編碼 (可選)
+        size: 內容位元組數
+        truncated: 內容是否為串流模式提前停止讀取的部分內容
+        stored_at: 儲存時間 (Unix 時間戳)
+        last_access: 最後存取時間 (Unix 時間戳)
+    """
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    charset: Optional[str] = None
+    size: int = 0
+    truncated: bool = False
+    stored_at: float = 0.0
+    last_access: float = 0.0
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """產生條件式請求標頭。
+
+        Returns:
+            dict: If-None-Match 與 If-Modified-Since 標頭
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTMLStore:
+    """具容量上限的 HTML 磁碟儲存。
+
+    每個 URL 以其 SHA-256 作為檔名，內容存為 <key>.html，
+    中繼資料存為 <key>.json。索引在第一次使用時由目錄掃描建立，
+    之後保留在記憶體中；磁碟讀寫都在執行緒中進行，不阻塞事件迴圈。
+    同一個 URL 的寫入依序進行，確保內容與驗證器來自同一個回應。
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        """初始化 HTML 儲存。
+
+        Args:
+            directory: 儲存目錄
+            max_bytes: 內容總容量上限 (位元組)，超過時淘汰最久未使用的項目
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index: Optional["OrderedDict[str, StoredPage]"] = None
+        self._total_bytes = 0
+        # 每個鍵值的寫入鎖與使用中的協程數 (歸零時移除)
+        self._locks: Dict[str, List[Any]] = {}
+
+        # 統計資訊
+        self._stats = {
+            'lookups': 0,
+            'candidates': 0,
+            'revalidated': 0,
+            'stored': 0,
+            'evicted': 0,
+        }
+
+    @staticmethod
+    def _key(url: str) -> str:
+        """取得 URL 對應的儲存鍵值。"""
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str) -> tuple:
+        """取得內容與中繼資料檔案路徑。"""
+        return (
+            os.path.join(self.directory, f"{key}.html"),
+            os.path.join(self.directory, f"{key}.json"),
+        )
+
+    @asynccontextmanager
+    async def _key_lock(self, key: str) -> AsyncIterator[None]:
+        """序列化同一個鍵值的檔案寫入。"""
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[key]
+
+    async def _ensure_index(self) -> "OrderedDict[str, StoredPage]":
+        """載入磁碟索引（僅第一次呼叫時掃描目錄）。"""
+        if self._index is None:
+            index = await asyncio.to_thread(self._scan_directory)
+            # 掃描期間可能已由其他協程建立索引
+            if self._index is None:
+                self._index = index
+                self._total_bytes = sum(page.size for page in index.values())
+        return self._index
+
+    def _scan_directory(self) -> "OrderedDict[str, StoredPage]":
+        """掃描儲存目錄並依最後存取時間排序建立索引。"""
+        entries = []
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if not name.endswith('.json'):
+                    continue
+                key = name[:-len('.json')]
+                body_path, meta_path = self._paths(key)
+                try:
+                    with open(meta_path, 'r', encoding='utf-8') as f:
+                        page = StoredPage(**json.load(f))
+                    if os.path.exists(body_path):
+                        entries.append((key, page))
+                except (OSError, ValueError, TypeError):
+                    # 損毀的中繼資料直接略過，之後會被覆寫
+                    continue
+        entries.sort(key=lambda item: item[1].last_access)
+        return OrderedDict(entries)
+
+    async def lookup(self, url: str) -> Optional[StoredPage]:
+        """查詢 URL 是否有可用於重新驗證的儲存內容。
+
+        Args:
+            url: 目標 URL
+
+        Returns:
+            Optional[StoredPage]: 有驗證器的儲存項目，沒有時為 None
+        """
+        index = await self._ensure_index()
+        self._stats['lookups'] += 1
+        page = index.get(self._key(url))
+        if page is None or not (page.etag or page.last_modified):
+            return None
+        self._stats['candidates'] += 1
+        return page
+
+    async def load_body(self, url: str) -> Optional[bytes]:
+        """讀取已儲存的內容並更新最後存取時間。
+
+        Args:
+            url: 目標 URL
+
+        Returns:
+            Optional[bytes]: 儲存的內容，檔案遺失時為 None
+        """
+        index = await self._ensure_index()
+        key = self._key(url)
+        body_path, meta_path = self._paths(key)
+        async with self._key_lock(key):
+            # 等待期間可能已被覆寫或淘汰，以最新的索引項目為準
+            page = index.get(key)
+            if page is None:
+                return None
+            page.last_access = time.time()
+            try:
+                body = await asyncio.to_thread(self._read_and_touch, body_path, meta_path, page)
+            except OSError:
+                self._forget(key)
+                return None
+
+        index.move_to_end(key)
+        self._stats['revalidated'] += 1
+        return body
+
+    @staticmethod
+    def _read_and_touch(body_path: str, meta_path: str, page: StoredPage) -> bytes:
+        """讀取內容並寫回最後存取時間。"""
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        HTMLStore._write_atomic(meta_path, json.dumps(asdict(page)).encode('utf-8'))
+        return body
+
+    async def save(
+        self,
+        url: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        charset: Optional[str] = None,
+        truncated: bool = False
+    ) -> bool:
+        """儲存內容與驗證器，必要時淘汰最久未使用的項目。
+
+        沒有任何驗證器的回應無法重新驗證，不會儲存。
+
+        Args:
+            url: 原始 URL
+            body: 內容位元組
+            etag: ETag 標頭
+            last_modified: Last-Modified 標頭
+            charset: 內容編碼
+            truncated: 是否為部分內容
+
+        Returns:
+            bool: 是否已儲存
+        """
+        if not (etag or last_modified) or len(body) > self.max_bytes:
+            return False
+
+        index = await self._ensure_index()
+        key = self._key(url)
+        now = time.time()
+        page = StoredPage(
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            charset=charset,
+            size=len(body),
+            truncated=truncated,
+            stored_at=now,
+            last_access=now,
+        )
+        body_path, meta_path = self._paths(key)
+        async with self._key_lock(key):
+            try:
+                await asyncio.to_thread(self._write_entry, body_path, meta_path, body, page)
+            except OSError as e:
+                print(f"⚠️ HTML 儲存寫入失敗: {url} - {str(e)}")
+                return False
+
+            previous = index.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size
+            index[key] = page
+            self._total_bytes += page.size
+            self._stats['stored'] += 1
+
+        await self._evict()
+        return True
+
+    def _write_entry(self, body_path: str, meta_path: str, body: bytes, page: StoredPage) -> None:
+        """寫入內容與中繼資料檔案。"""
+        os.makedirs(self.directory, exist_ok=True)
+        self._write_atomic(body_path, body)
+        self._write_atomic(meta_path, json.dumps(asdict(page)).encode('utf-8'))
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        """先寫入唯一的暫存檔再取代，避免讀到寫到一半的檔案。"""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    async def _evict(self) -> None:
+        """淘汰最久未使用的項目直到總容量低於上限。"""
+        index = self._index
+        victims = []
+        while index and self._total_bytes > self.max_bytes:
+            key, page = index.popitem(last=False)
+            self._total_bytes -= page.size
+            victims.append(key)
+
+        if victims:
+            self._stats['evicted'] += len(victims)
+            await asyncio.to_thread(self._delete_files, [self._paths(key) for key in victims])
+
+    def _forget(self, key: str) -> None:
+        """從索引移除檔案已遺失的項目。"""
+        page = self._index.pop(key, None) if self._index is not None else None
+        if page is not None:
+            self._total_bytes -= page.size
+
+    @staticmethod
+    def _delete_files(path_groups: list) -> None:
+        """刪除淘汰項目的檔案。"""
+        for paths in path_groups:
+            for path in paths:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得儲存統計資訊。
+
+        Returns:
+            dict: 包含項目數、總容量、重新驗證命中與淘汰次數的字典
+        """
+        return {
+            'directory': self.directory,
+            'entries': len(self._index) if self._index is not None else 0,
+            'total_bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+            **self._stats,
+        }
@@ -13,6 +13,8 @@ from typing import Dict, List, Optional
 
 from .job_manager import JobManager
 
+from ..config import get_config
+
 from ..models.request import AnalyzeRequest, AnalyzeOptions as RequestOptions
 from ..models.response import (
     AnalyzeResponse, AnalysisData, SerpSummary, 
@@ -38,6 +40,9 @@ class IntegrationService:
         self.serp_service = get_serp_service()
         self.scraper_service = get_scraper_service()
         self.ai_service = get_ai_service()
+
+        # SERP 擷取結果數（超過一頁時分頁並行取得）
+        self.serp_result_count = get_config().get_serp_result_count()
         
         # 效能監控配置
         self.performance_thresholds = {
@@ -226,7 +231,7 @@ class IntegrationService:
             
             serp_data = await self.serp_service.search_keyword(
                 keyword=request.keyword,
-                num_results=10
+                num_results=self.serp_result_count
             )
             
             timer.end_phase("serp")
@@ -424,7 +429,7 @@ class IntegrationService:
 
             serp_data = await self.serp_service.search_keyword(
                 keyword=request.keyword,
-                num_results=10
+                num_results=self.serp_result_count
             )
 
             timer.end_phase("serp")
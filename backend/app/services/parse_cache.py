@@ -0,0 +1,140 @@
+"""HTML 解析結果快取模組。
+
+此模組以 URL 與內容雜湊作為鍵值快取 SEO 元素提取結果。
+同一個 URL 回傳的內容未變更時（雜湊相同）直接重用上次的
+提取結果，完全略過 CPU 密集的 HTML 解析。
+"""
+
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+
+@dataclass
+class _ParseEntry:
+    """單一 URL 的快取項目。"""
+    content_hash: str
+    page_data: Dict[str, Any]
+    stored_at: float
+
+
+class ParseCache:
+    """以 URL 與內容雜湊為鍵值的解析結果快取。
+
+    - 每個 URL 只保留最新內容的提取結果，內容變更時覆寫
+    - 項目超過 ttl 秒即失效
+    - 超過 max_entries 時淘汰最久未使用的項目
+
+    Example:
+        >>> cache = ParseCache(ttl=604800)
+        >>> content_hash = ParseCache.content_hash("<html></html>")
+        >>> cache.get("https://example.com", content_hash) is None
+        True
+    """
+
+    def __init__(self, ttl: float = 7 * 24 * 3600, max_entries: int = 2048):
+        """初始化解析結果快取。
+
+        Args:
+            ttl: 快取存活時間（秒），預設一週
+            max_entries: 最大快取項目數
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _ParseEntry]" = OrderedDict()
+
+        # 統計資訊
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evicted = 0
+
+    @staticmethod
+    def content_hash(html: Union[str, bytes], encoding: Optional[str] = None) -> str:
+        """計算 HTML 內容的雜湊值。
+
+        位元組內容的解碼結果取決於編碼，因此已知編碼也納入雜湊。
+
+        Args:
+            html: HTML 原始內容 (字串或位元組)
+            encoding: 位元組內容的已知編碼 (可選)
+
+        Returns:
+            str: SHA-256 十六進位雜湊值
+        """
+        if isinstance(html, str):
+            digest = hashlib.sha256(html.encode('utf-8', 'surrogatepass'))
+        else:
+            digest = hashlib.sha256(html)
+            if encoding:
+                digest.update(b'\x00' + encoding.lower().encode('ascii', 'replace'))
+        return digest.hexdigest()
+
+    def get(self, url: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        """取得內容未變更時的提取結果。
+
+        Args:
+            url: 原始 URL
+            content_hash: 本次內容的雜湊值
+
+        Returns:
+            Optional[Dict[str, Any]]: 提取結果的副本，未命中時為 None
+        """
+        entry = self._entries.get(url)
+        if entry is None or entry.content_hash != content_hash:
+            self._misses += 1
+            return None
+
+        if time.time() - entry.stored_at > self.ttl:
+            del self._entries[url]
+            self._expired += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(url)
+        self._hits += 1
+        # 回傳副本，避免呼叫端修改 h2_list 等可變欄位影響快取
+        return copy.deepcopy(entry.page_data)
+
+    def put(self, url: str, content_hash: str, page_data: Dict[str, Any]) -> None:
+        """儲存提取結果。
+
+        Args:
+            url: 原始 URL
+            content_hash: 內容雜湊值
+            page_data: SEO 元素字典
+        """
+        self._entries.pop(url, None)
+        self._entries[url] = _ParseEntry(
+            content_hash=content_hash,
+            page_data=copy.deepcopy(page_data),
+            stored_at=time.time(),
+        )
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evicted += 1
+
+    def clear(self) -> None:
+        """清除所有快取項目。"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得快取統計資訊。
+
+        Returns:
+            dict: 包含項目數、命中、未命中、過期與淘汰次數的字典
+        """
+        lookups = self._hits + self._misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl': self.ttl,
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': round(self._hits / lookups, 3) if lookups else 0.0,
+            'expired': self._expired,
+            'evicted': self._evicted,
+        }
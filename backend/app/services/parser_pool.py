@@ -0,0 +1,177 @@
+"""HTML 解析工作池模組。
+
+此模組將 CPU 密集的 HTML 解析移出 asyncio 事件迴圈，交由
+行程池或執行緒池處理，並提供工作池大小、佇列深度與每次
+解析 CPU 時間等統計資訊。
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .html_extractor import DEFAULT_ENGINE, ENGINES, extract_with_cpu_time
+from .pdf_extractor import extract_pdf_with_cpu_time
+
+
+class ParserPool:
+    """HTML 解析工作池。
+
+    支援三種模式：
+    - process: 行程池，完全避開 GIL，適合大量或大型頁面
+    - thread: 執行緒池，啟動成本低，但解析時仍會與事件迴圈競爭 GIL
+    - inline: 直接在事件迴圈上解析（舊行為，供比較與除錯使用）
+
+    工作者只接收原始 HTML 與編碼，回傳精簡的 SEO 元素字典。
+    """
+
+    MODES = ('process', 'thread', 'inline')
+
+    def __init__(
+        self,
+        mode: str = 'process',
+        max_workers: Optional[int] = None,
+        engine: str = DEFAULT_ENGINE
+    ):
+        """初始化解析工作池。
+
+        Args:
+            mode: 工作池模式 (process、thread 或 inline)
+            max_workers: 工作者數量，未指定或 <= 0 時依 CPU 數量決定
+            engine: HTML 擷取引擎 (lxml 或 bs4)
+
+        Raises:
+            ValueError: 模式或擷取引擎不受支援時
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"不支援的解析工作池模式: {mode}")
+        if engine not in ENGINES:
+            raise ValueError(f"不支援的 HTML 擷取引擎: {engine}")
+
+        self.mode = mode
+        self.engine = engine
+        self.max_workers = max_workers if max_workers and max_workers > 0 else min(4, os.cpu_count() or 1)
+        self._executor: Optional[Executor] = None
+
+        # 統計資訊
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._cpu_time_total = 0.0
+        self._cpu_time_max = 0.0
+        self._last_cpu_time = 0.0
+
+    def _get_executor(self) -> Executor:
+        """取得工作池執行器，必要時延遲建立。
+
+        Returns:
+            Executor: 行程池或執行緒池
+        """
+        if self._executor is None:
+            if self.mode == 'process':
+                # 使用 spawn 避免在多執行緒的伺服器行程中 fork
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='html-parser'
+                )
+        return self._executor
+
+    async def parse(
+        self,
+        html: Union[str, bytes],
+        encoding: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], float]:
+        """解析 HTML 並提取 SEO 元素。
+
+        Args:
+            html: HTML 原始內容 (字串或位元組)
+            encoding: 位元組內容的已知編碼 (可選)
+
+        Returns:
+            tuple: (SEO 元素字典, 解析耗用的 CPU 時間秒數)
+
+        Raises:
+            HTMLExtractionError: HTML 解析失敗
+        """
+        return await self._run(extract_with_cpu_time, html, encoding, self.engine)
+
+    async def parse_pdf(self, data: bytes) -> Tuple[Dict[str, Any], float]:
+        """擷取 PDF 文字並提取 SEO 元素。
+
+        Args:
+            data: PDF 原始內容
+
+        Returns:
+            tuple: (SEO 元素字典, 解析耗用的 CPU 時間秒數)
+
+        Raises:
+            PDFExtractionError: 未安裝 pypdf 或 PDF 解析失敗
+        """
+        return await self._run(extract_pdf_with_cpu_time, data)
+
+    async def _run(
+        self, func: Callable[..., Tuple[Dict[str, Any], float]], *args: Any
+    ) -> Tuple[Dict[str, Any], float]:
+        """在工作池中執行擷取函式並更新統計。"""
+        self._in_flight += 1
+        try:
+            if self.mode == 'inline':
+                result, cpu_time = func(*args)
+            else:
+                loop = asyncio.get_running_loop()
+                try:
+                    result, cpu_time = await loop.run_in_executor(self._get_executor(), func, *args)
+                except BrokenProcessPool:
+                    # 工作者異常結束時重建行程池並重試一次
+                    self.shutdown(wait=False)
+                    result, cpu_time = await loop.run_in_executor(self._get_executor(), func, *args)
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+
+        self._completed += 1
+        self._cpu_time_total += cpu_time
+        self._cpu_time_max = max(self._cpu_time_max, cpu_time)
+        self._last_cpu_time = cpu_time
+        return result, cpu_time
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得工作池統計資訊。
+
+        Returns:
+            dict: 包含工作池大小、佇列深度與 CPU 時間統計的字典
+        """
+        workers = 1 if self.mode == 'inline' else self.max_workers
+        return {
+            'mode': self.mode,
+            'engine': self.engine,
+            'max_workers': workers,
+            'in_flight': self._in_flight,
+            'queue_depth': max(self._in_flight - workers, 0),
+            'completed': self._completed,
+            'failed': self._failed,
+            'cpu_time_total': round(self._cpu_time_total, 6),
+            'cpu_time_avg': round(self._cpu_time_total / self._completed, 6) if self._completed else 0.0,
+            'cpu_time_max': round(self._cpu_time_max, 6),
+            'last_cpu_time': round(self._last_cpu_time, 6),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """關閉工作池並釋放工作者。
+
+        Args:
+            wait: 是否等待執行中的解析完成
+        """
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
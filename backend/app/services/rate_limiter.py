@@ -0,0 +1,266 @@
+"""SerpAPI 用戶端速率限制與月配額計算模組。
+
+SerpAPI 依方案限制每小時的搜尋量與每月配額，超過時回傳 429，
+整個分析隨之失敗。此模組在送出請求前先行整形：
+
+- 權杖桶（以 GCRA 實作）：平均每秒 rate 次、最多連續 burst 次；
+  超過時呼叫端依序排隊等待，預估等待超過 max_wait 才拒絕
+- 月配額：依 UTC 月份累計已送出的搜尋數，用完即拒絕，不再排隊；
+  可保存於 JSON 檔，重新啟動或重新部署後沿用本月用量
+
+同一行程內的所有分析工作共用同一個限制器（SerpService 為單例），
+時鐘與 sleep 函式皆可注入，測試不需真正等待。
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class RateLimitError(Exception):
+    """速率限制拒絕請求（預估排隊時間過長）。"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class QuotaExhaustedError(RateLimitError):
+    """本月配額已用盡。"""
+
+
+class SerpRateLimiter:
+    """權杖桶速率限制加上月配額計算。
+
+    每次取得名額時同步預約下一個可用時間點，因此並行的呼叫依
+    取得順序排隊，不需要鎖；取消等待時退回已計入的配額。
+
+    Example:
+        >>> limiter = SerpRateLimiter(rate=1.0, burst=5, monthly_quota=5000)
+        >>> await limiter.acquire()  # 必要時等待
+        >>> limiter.remaining_quota
+        4999
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: int = 5,
+        monthly_quota: int = 0,
+        max_wait: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        state_path: Optional[str] = None
+    ):
+        """初始化速率限制器。
+
+        Args:
+            rate: 每秒平均請求數，0 表示不限制速率
+            burst: 可連續送出的請求數
+            monthly_quota: 每月配額，0 表示不限制
+            max_wait: 排隊等待的最長秒數，超過即拒絕
+            clock: 計算等待時間使用的時鐘函式 (測試可注入假時鐘)
+            wall_clock: 判斷月份使用的 Unix 時間函式
+            sleep: 等待使用的非同步函式
+            state_path: 本月用量的 JSON 保存路徑，None 表示僅保存在記憶體
+        """
+        self.rate = rate
+        self.burst = max(int(burst), 1)
+        self.monthly_quota = max(int(monthly_quota), 0)
+        self.max_wait = max_wait
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._sleep = sleep
+        self.state_path = state_path
+
+        # 下一個請求的理論送出時間（GCRA 的 TAT）
+        self._tat = 0.0
+        self._month: Optional[Tuple[int, int]] = None
+        self._used = 0
+        self._waiting = 0
+
+        # 統計資訊
+        self._stats = {
+            'acquired': 0,
+            'delayed': 0,
+            'rejected': 0,
+            'quota_rejected': 0,
+            'penalties': 0,
+            'total_wait': 0.0,
+            'longest_wait': 0.0,
+        }
+
+        if state_path:
+            self._load_state()
+
+    @property
+    def _interval(self) -> float:
+        return 1.0 / self.rate if self.rate > 0 else 0.0
+
+    @property
+    def _tolerance(self) -> float:
+        """桶滿時可提前送出的時間（burst - 1 個間隔）。"""
+        return (self.burst - 1) * self._interval
+
+    async def acquire(self) -> float:
+        """取得一次搜尋的名額，必要時排隊等待。
+
+        Returns:
+            float: 實際排隊等待的秒數
+
+        Raises:
+            QuotaExhaustedError: 本月配額已用盡
+            RateLimitError: 預估等待時間超過 max_wait
+        """
+        self._roll_month()
+        if self.monthly_quota and self._used >= self.monthly_quota:
+            self._stats['quota_rejected'] += 1
+            raise QuotaExhaustedError(
+                f"本月 SerpAPI 配額已用盡 ({self._used}/{self.monthly_quota})"
+            )
+
+        now = self._clock()
+        wait = self._wait_at(now)
+        if wait > self.max_wait:
+            self._stats['rejected'] += 1
+            raise RateLimitError(
+                f"SerpAPI 排隊等待 {wait:.1f} 秒超過上限 {self.max_wait:.1f} 秒",
+                retry_after=wait
+            )
+
+        # 同步預約，之後的呼叫排在此請求之後
+        self._tat = max(self._tat, now) + self._interval
+        self._used += 1
+        self._save_state()
+
+        if wait > 0:
+            self._waiting += 1
+            try:
+                await self._sleep(wait)
+            except asyncio.CancelledError:
+                # 請求未送出，退回配額（已預約的時段保守地不退回）
+                self._used -= 1
+                self._save_state()
+                raise
+            finally:
+                self._waiting -= 1
+            self._stats['delayed'] += 1
+            self._stats['total_wait'] += wait
+            self._stats['longest_wait'] = max(self._stats['longest_wait'], wait)
+
+        self._stats['acquired'] += 1
+        return wait
+
+    def penalize(self, delay: float) -> None:
+        """上游回傳速率限制時，讓之後的請求至少等待 delay 秒。
+
+        Args:
+            delay: 暫停送出的秒數
+        """
+        if delay <= 0:
+            return
+        self._tat = max(self._tat, self._clock() + delay + self._tolerance)
+        self._stats['penalties'] += 1
+
+    def _wait_at(self, now: float) -> float:
+        """計算於 now 取得名額需要等待的秒數。"""
+        if self._interval <= 0:
+            return max(0.0, self._tat - now)
+        return max(0.0, max(self._tat, now) - self._tolerance - now)
+
+    def _current_month(self) -> Tuple[int, int]:
+        return tuple(time.gmtime(self._wall_clock())[:2])
+
+    def _roll_month(self) -> None:
+        """進入新的 UTC 月份時重設配額計數。"""
+        month = self._current_month()
+        if month != self._month:
+            self._month = month
+            self._used = 0
+
+    def _load_state(self) -> None:
+        """載入保存的本月用量，檔案不存在、格式不符或屬於其他月份時略過。"""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            year, month = (int(part) for part in data['month'].split('-'))
+            used = int(data['used'])
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"⚠️ SerpAPI 配額紀錄無法讀取，本月用量從 0 開始: {str(e)}")
+            return
+        if (year, month) == self._current_month():
+            self._month = (year, month)
+            self._used = max(used, 0)
+
+    def _save_state(self) -> None:
+        """以暫存檔加上 rename 寫入本月用量（檔案很小，直接同步寫入）。
+
+        同步寫入保證多個並行請求的寫入順序與計數一致；多個行程共用
+        同一檔案時不保證計數正確。
+        """
+        if not self.state_path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.state_path))
+        year, month = self._month
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'month': f"{year:04d}-{month:02d}", 'used': self._used}, f)
+                os.replace(tmp_path, self.state_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            # 保存失敗不影響搜尋，重新啟動後可能少算本月用量
+            print(f"⚠️ SerpAPI 配額紀錄寫入失敗: {str(e)}")
+
+    @property
+    def used_quota(self) -> int:
+        """本月已計入的搜尋數。"""
+        self._roll_month()
+        return self._used
+
+    @property
+    def remaining_quota(self) -> Optional[int]:
+        """本月剩餘配額，未設定配額時為 None。"""
+        if not self.monthly_quota:
+            return None
+        return max(self.monthly_quota - self.used_quota, 0)
+
+    @property
+    def queue_wait(self) -> float:
+        """新的呼叫目前需要排隊等待的秒數。"""
+        return self._wait_at(self._clock())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得速率限制統計資訊。
+
+        Returns:
+            dict: 包含速率設定、本月用量、剩餘配額、目前排隊等待時間
+            與累計等待、拒絕次數的字典
+        """
+        delayed = self._stats['delayed']
+        return {
+            'rate': self.rate,
+            'burst': self.burst,
+            'max_wait': self.max_wait,
+            'monthly_quota': self.monthly_quota,
+            'persistent': bool(self.state_path),
+            'used_quota': self.used_quota,
+            'remaining_quota': self.remaining_quota,
+            'queue_wait': round(self.queue_wait, 3),
+            'waiting': self._waiting,
+            **self._stats,
+            'avg_wait': round(self._stats['total_wait'] / delayed, 3) if delayed else 0.0,
+        }
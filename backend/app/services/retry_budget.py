@@ -0,0 +1,137 @@
+"""外部呼叫的重試預算模組。
+
+在上游故障期間，各服務各自以固定的指數退避重試會使負載倍增。
+此模組以 token bucket 限制重試量：每次首次嘗試存入 ratio 個 token，
+每次重試消耗一個，因此重試數最多約為首次嘗試數的 ratio 比例
+（另保留 reserve 個 token 供冷啟動或低流量時使用）。
+
+退避時間採用 full jitter，若伺服器提供 Retry-After 則以其為下限；
+Retry-After 超過 max_delay 時直接放棄重試。
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """解析 Retry-After 標頭。
+
+    Args:
+        value: 標頭值，可為秒數或 HTTP 日期
+        now: 目前的 Unix 時間 (測試用，預設為 time.time())
+
+    Returns:
+        Optional[float]: 需等待的秒數，無法解析時為 None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+    return max(retry_at - (time.time() if now is None else now), 0.0)
+
+
+class RetryBudget:
+    """單一相依服務的重試預算與退避計算。
+
+    Example:
+        >>> budget = RetryBudget("serpapi", ratio=0.2)
+        >>> budget.record_attempt()
+        >>> delay = budget.retry_delay(attempt=0, base_delay=1.0)
+        >>> if delay is not None:
+        ...     await asyncio.sleep(delay)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ratio: float = 0.2,
+        reserve: float = 10.0,
+        max_delay: float = 30.0,
+        rng: Callable[[float, float], float] = random.uniform
+    ):
+        """初始化重試預算。
+
+        Args:
+            name: 相依服務名稱 (用於統計與訊息)
+            ratio: 每次首次嘗試存入的 token 數，即重試占首次嘗試的比例上限
+            reserve: token 上限與初始值
+            max_delay: 單次退避的最長秒數，Retry-After 超過此值時放棄重試
+            rng: 產生 jitter 的亂數函式 (測試可注入固定值)
+        """
+        self.name = name
+        self.ratio = max(ratio, 0.0)
+        self.reserve = max(reserve, 1.0)
+        self.max_delay = max_delay
+        self._rng = rng
+        self._tokens = self.reserve
+
+        # 統計資訊
+        self._attempts = 0
+        self._retries = 0
+        self._exhausted = 0
+        self._retry_after_honored = 0
+        self._retry_after_too_long = 0
+
+    def record_attempt(self) -> None:
+        """記錄一次首次嘗試，存入重試 token。"""
+        self._attempts += 1
+        self._tokens = min(self._tokens + self.ratio, self.reserve)
+
+    def retry_delay(
+        self,
+        attempt: int,
+        base_delay: float,
+        retry_after: Optional[float] = None
+    ) -> Optional[float]:
+        """取得一次重試預算並計算退避秒數。
+
+        Args:
+            attempt: 已失敗的嘗試次數 (從 0 起算)
+            base_delay: 第一次重試的基本退避秒數
+            retry_after: 伺服器要求的最少等待秒數 (可選)
+
+        Returns:
+            Optional[float]: 退避秒數；預算用盡或 Retry-After 過長而不應重試時為 None
+        """
+        if retry_after is not None and retry_after > self.max_delay:
+            self._retry_after_too_long += 1
+            return None
+        if self._tokens < 1:
+            self._exhausted += 1
+            return None
+
+        self._tokens -= 1
+        self._retries += 1
+        # full jitter：在 [0, 指數退避上限] 之間隨機等待，避免重試同步湧入
+        delay = self._rng(0.0, min(base_delay * (2 ** attempt), self.max_delay))
+        if retry_after is not None:
+            self._retry_after_honored += 1
+            delay = max(delay, retry_after)
+        return delay
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得重試預算統計資訊。
+
+        Returns:
+            dict: 包含首次嘗試數、重試數、預算用盡次數與剩餘 token 的字典
+        """
+        return {
+            'name': self.name,
+            'ratio': self.ratio,
+            'tokens': round(self._tokens, 2),
+            'attempts': self._attempts,
+            'retries': self._retries,
+            'exhausted': self._exhausted,
+            'retry_after_honored': self._retry_after_honored,
+            'retry_after_too_long': self._retry_after_too_long,
+            'retry_ratio': round(self._retries / self._attempts, 4) if self._attempts else 0.0,
+        }
@@ -0,0 +1,204 @@
+"""robots.txt 快取與爬取許可檢查模組。
+
+此模組依來源 (scheme://host:port) 取得並快取 robots.txt 的解析結果，
+同一來源的並行查詢只發出一次請求，快取有效期間內的檢查完全不需要
+網路往返。規則解析沿用標準函式庫的 urllib.robotparser。
+
+取得失敗時的處理：
+- 4xx（含 404）：視為沒有限制，依 ttl 快取
+- 5xx、逾時或連線錯誤：暫時視為沒有限制，依較短的 error_ttl 快取，
+  實際頁面請求仍會回報對應的錯誤
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import aiohttp
+
+from .content_decoding import ContentDecoder
+
+
+@dataclass
+class _RobotsEntry:
+    """單一來源的 robots.txt 解析結果。"""
+    parser: RobotFileParser
+    expires_at: float
+
+
+def _allow_all() -> RobotFileParser:
+    parser = RobotFileParser()
+    parser.allow_all = True
+    return parser
+
+
+class RobotsCache:
+    """依來源快取 robots.txt 規則並檢查 URL 是否允許爬取。
+
+    Example:
+        >>> robots = RobotsCache(user_agent="SEOAnalyzer", ttl=86400)
+        >>> if await robots.allowed(session, "https://example.com/page"):
+        ...     pass
+    """
+
+    # 快取項目超過此數量時清除過期項目
+    PRUNE_THRESHOLD = 4096
+
+    # robots.txt 最多讀取的位元組數 (RFC 9309 要求至少 500 KiB)
+    MAX_BYTES = 512 * 1024
+
+    def __init__(
+        self,
+        user_agent: str = "SEOAnalyzer",
+        ttl: float = 24 * 3600,
+        error_ttl: float = 300.0,
+        timeout: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """初始化 robots.txt 快取。
+
+        Args:
+            user_agent: 比對 robots.txt User-agent 群組使用的名稱
+            ttl: 成功取得 (或 4xx) 的規則快取秒數
+            error_ttl: 5xx 或網路錯誤時的快取秒數
+            timeout: 取得 robots.txt 的逾時秒數
+            clock: 判斷快取過期使用的時鐘函式 (測試可注入假時鐘)
+        """
+        self.user_agent = user_agent
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.timeout = timeout
+        self._clock = clock
+        self._cache: Dict[str, _RobotsEntry] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 統計資訊
+        self._stats = {
+            'checks': 0,
+            'hits': 0,
+            'coalesced': 0,
+            'fetches': 0,
+            'fetch_errors': 0,
+            'disallowed': 0,
+        }
+
+    @staticmethod
+    def origin(url: str) -> str:
+        """取得 URL 的來源 (小寫的 scheme://host:port)。
+
+        Args:
+            url: 目標 URL
+
+        Returns:
+            str: 來源字串，無法解析或非 HTTP(S) 時為空字串
+        """
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return ''
+        if parts.scheme not in ('http', 'https') or not parts.netloc:
+            return ''
+        return f"{parts.scheme}://{parts.netloc.lower()}"
+
+    async def allowed(self, session: aiohttp.ClientSession, url: str) -> bool:
+        """檢查 URL 是否允許爬取。
+
+        快取有效時不發出任何請求；否則以 session 取得 robots.txt，
+        同一來源的並行檢查共用同一次請求。
+
+        Args:
+            session: 用於取得 robots.txt 的 HTTP 客戶端
+            url: 目標 URL
+
+        Returns:
+            bool: 允許爬取時為 True
+        """
+        origin = self.origin(url)
+        if not origin:
+            return True
+        self._stats['checks'] += 1
+
+        entry = self._cache.get(origin)
+        if entry is not None and entry.expires_at > self._clock():
+            self._stats['hits'] += 1
+        else:
+            loop = asyncio.get_running_loop()
+            if self._loop is not loop:
+                # 進行中的請求綁定事件迴圈，切換迴圈時重建
+                self._inflight = {}
+                self._loop = loop
+            task = self._inflight.get(origin)
+            if task is not None:
+                self._stats['coalesced'] += 1
+            else:
+                task = loop.create_task(self._fetch(session, origin))
+                self._inflight[origin] = task
+            # shield：單一呼叫端取消時不影響其他等待同一來源的檢查
+            entry = await asyncio.shield(task)
+
+        if entry.parser.can_fetch(self.user_agent, url):
+            return True
+        self._stats['disallowed'] += 1
+        return False
+
+    async def _fetch(self, session: aiohttp.ClientSession, origin: str) -> _RobotsEntry:
+        """取得並解析 robots.txt，寫入快取（不拋出例外）。"""
+        self._stats['fetches'] += 1
+        parser = _allow_all()
+        ttl = self.error_ttl
+        try:
+            async with session.get(
+                f"{origin}/robots.txt",
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                if 200 <= response.status < 300:
+                    raw = b''
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        raw += chunk
+                        if len(raw) >= self.MAX_BYTES:
+                            break
+                    decoder = ContentDecoder(response.headers.get('Content-Encoding'))
+                    body = decoder.decompress(raw[:self.MAX_BYTES]) + decoder.flush()
+                    parser = RobotFileParser()
+                    parser.parse(body.decode('utf-8', 'replace').splitlines())
+                    ttl = self.ttl
+                elif 400 <= response.status < 500:
+                    ttl = self.ttl
+                else:
+                    self._stats['fetch_errors'] += 1
+        except Exception:  # pylint: disable=broad-except
+            # 取不到 robots.txt 不應阻擋爬取，頁面請求會回報實際錯誤
+            self._stats['fetch_errors'] += 1
+        finally:
+            self._inflight.pop(origin, None)
+
+        entry = _RobotsEntry(parser, self._clock() + ttl)
+        if len(self._cache) >= self.PRUNE_THRESHOLD:
+            now = self._clock()
+            self._cache = {k: v for k, v in self._cache.items() if v.expires_at > now}
+        self._cache[origin] = entry
+        return entry
+
+    def clear(self) -> None:
+        """清除所有快取項目。"""
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得 robots.txt 檢查統計資訊。
+
+        Returns:
+            dict: 包含檢查數、快取命中率、實際請求數與拒絕數的字典
+        """
+        checks = self._stats['checks']
+        cached = self._stats['hits'] + self._stats['coalesced']
+        return {
+            'user_agent': self.user_agent,
+            'ttl': self.ttl,
+            'entries': len(self._cache),
+            **self._stats,
+            'hit_rate': round(cached / checks, 3) if checks else 0.0,
+        }
@@ -5,16 +5,30 @@ SEO 元素提取、錯誤處理和重試機制。
 """
 
 import asyncio
+import contextlib
+import os
 import time
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import AsyncContextManager, AsyncIterator, List, Dict, Any, Optional, Tuple, Union
 
 import aiohttp
 from aiohttp import ClientError
-from bs4 import BeautifulSoup, Tag
-from bs4.element import NavigableString
-
 from ..config import get_config
+from ..utils.charset import resolve_charset
+from .html_extractor import HTMLExtractionError
+from .host_scheduler import HostScheduler
+from .dns_resolver import CachingResolver, get_dns_resolver
+from .domain_timeouts import DomainTimeoutTracker
+from .adaptive_concurrency import AdaptiveConcurrencyLimiter
+from .circuit_breaker import CircuitBreaker
+from .content_decoding import ContentDecoder, ContentDecodingError, accept_encoding_header
+from .hedging import HedgePolicy
+from .html_store import HTMLStore, StoredPage
+from .parse_cache import ParseCache
+from .parser_pool import ParserPool
+from .pdf_extractor import HAS_PDF, PDFExtractionError
+from .retry_budget import RetryBudget, parse_retry_after
+from .robots import RobotsCache
 
 
 # 自定義例外類別
@@ -30,6 +44,18 @@ class ScraperParsingException(ScraperException):
     """HTML 解析錯誤。"""
 
 
+class ScraperSkippedException(ScraperException):
+    """已達成功頁數門檻或截止時間，未完成的爬取被取消。"""
+
+
+class ScraperCircuitOpenException(ScraperException):
+    """網域的斷路器開啟中，請求未送出即失敗。"""
+
+
+class ScraperDisallowedException(ScraperException):
+    """robots.txt 不允許爬取此 URL。"""
+
+
 # 資料結構定義
 @dataclass
 class PageContent:
@@ -43,10 +69,22 @@ class PageContent:
         h2_list: 副標題清單
         word_count: 內文字數統計
         paragraph_count: 段落數統計
+        sentence_count: 句數統計
         status_code: HTTP 回應狀態碼
         load_time: 頁面載入時間 (秒)
         success: 是否成功爬取
         error: 錯誤訊息 (如果有)
+        bytes_read: 串流模式下實際讀取的內容位元組數
+        wire_bytes: 實際傳輸的位元組數 (壓縮後)
+        decoded_bytes: 解壓縮後的內容位元組數
+        bytes_skipped: 提前終止而未讀取的位元組數 (無法得知時為 None)
+        truncated: 是否因達到上限或已取得所需區塊而提前停止讀取
+        parse_cpu_time: HTML 解析耗用的 CPU 時間 (秒)
+        revalidated: 是否經條件式請求確認未變更 (304) 而重用儲存的內容
+        parse_cached: 內容雜湊未變更而重用快取的提取結果 (略過解析)
+        charset: 內容編碼 (依 BOM、標頭、meta 預掃描判定，不猜測整份文件)
+        content_type: 回應的 MIME 類型 (未提供時為 None)
+        retry_after: HTTP 429 / 503 回應要求的重試等待秒數 (未提供時為 None)
     """
     url: str
     h2_list: List[str]
@@ -55,10 +93,22 @@ class PageContent:
     h1: Optional[str] = None
     word_count: int = 0
     paragraph_count: int = 0
+    sentence_count: int = 0
     status_code: int = 0
     load_time: float = 0.0
     success: bool = False
     error: Optional[str] = None
+    bytes_read: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    bytes_skipped: Optional[int] = None
+    truncated: bool = False
+    parse_cpu_time: float = 0.0
+    revalidated: bool = False
+    parse_cached: bool = False
+    charset: Optional[str] = None
+    content_type: Optional[str] = None
+    retry_after: Optional[float] = None
 
 
 @dataclass
@@ -74,6 +124,8 @@ class ScrapingResult:
         avg_paragraphs: 平均段落數
         pages: 各頁面詳細內容
         errors: 錯誤資訊清單
+        parse_cache_hits: 本次分析中重用解析快取的頁面數
+        parse_cache_misses: 本次分析中實際解析的頁面數
     """
     total_results: int
     successful_scrapes: int
@@ -81,6 +133,83 @@ class ScrapingResult:
     avg_paragraphs: int
     pages: List[PageContent]
     errors: List[Dict[str, Any]]
+    parse_cache_hits: int = 0
+    parse_cache_misses: int = 0
+
+
+@dataclass
+class ScrapeProgress:
+    """串流爬取時每完成一個 URL 產生的進度資料。
+    
+    Attributes:
+        page: 完成的頁面內容 (例外以失敗的 PageContent 表示)
+        error: 失敗時的錯誤資訊，格式同 ScrapingResult.errors
+        completed: 已完成的 URL 數量
+        total_results: 總 URL 數量
+        successful_scrapes: 目前成功爬取數量
+        avg_word_count: 目前成功頁面的平均字數
+        avg_paragraphs: 目前成功頁面的平均段落數
+    """
+    page: PageContent
+    error: Optional[Dict[str, Any]]
+    completed: int
+    total_results: int
+    successful_scrapes: int
+    avg_word_count: int
+    avg_paragraphs: int
+
+
+class _EssentialContentTracker:
+    """追蹤串流讀取時 SEO 擷取所需的區塊是否皆已完整出現。
+    
+    所需區塊為 <head>、第一個 <h1> 以及主要內容區 (<main>，
+    若頁面沒有 <main> 則為 <article>)。比對以位元組進行，並保留
+    前一個 chunk 的尾端以處理跨 chunk 的標籤。
+    """
+    
+    _TAIL_SIZE = 16
+    
+    def __init__(self):
+        """初始化追蹤狀態。"""
+        self._tail = b''
+        self.head_closed = False
+        self.h1_closed = False
+        self.main_opened = False
+        self.main_closed = False
+        self.article_closed = False
+    
+    def feed(self, chunk: bytes) -> bool:
+        """送入新讀取的 chunk 並回報所需區塊是否已齊全。
+        
+        Args:
+            chunk: 新讀取的內容
+            
+        Returns:
+            bool: 所需區塊是否皆已出現
+        """
+        window = (self._tail + chunk).lower()
+        self._tail = window[-self._TAIL_SIZE:]
+        
+        if not self.head_closed and b'</head' in window:
+            self.head_closed = True
+        if not self.h1_closed and b'</h1' in window:
+            self.h1_closed = True
+        if not self.main_opened and b'<main' in window:
+            self.main_opened = True
+        if not self.main_closed and b'</main' in window:
+            self.main_closed = True
+        if not self.article_closed and b'</article' in window:
+            self.article_closed = True
+        
+        return self.is_complete()
+    
+    def is_complete(self) -> bool:
+        """判斷所需區塊是否皆已出現。"""
+        if self.main_opened:
+            content_done = self.main_closed
+        else:
+            content_done = self.article_closed
+        return self.head_closed and self.h1_closed and content_done
 
 
 class ScraperService:
@@ -90,6 +219,12 @@ class ScraperService:
     支援重試機制、逾時控制和錯誤處理。
     """
 
+    # 串流讀取時每次讀取的 chunk 大小
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    # 視為 HTML 解析的 MIME 類型（未提供 Content-Type 時也當作 HTML）
+    HTML_CONTENT_TYPES = frozenset({'', 'text/html', 'application/xhtml+xml'})
+
     def __init__(self):
         """初始化爬蟲服務。
         
@@ -99,24 +234,382 @@ class ScraperService:
         
         # 爬蟲配置參數
         self.max_concurrent = self.config.get_scraper_max_concurrent()
+        
+        # 自適應全域並行上限（跨分析共用，以 max_concurrent 為初始值）
+        self.concurrency: Optional[AdaptiveConcurrencyLimiter] = None
+        if self.config.get_scraper_adaptive_concurrency_enabled():
+            self.concurrency = AdaptiveConcurrencyLimiter(
+                initial=self.max_concurrent,
+                min_limit=self.config.get_scraper_concurrency_min(),
+                max_limit=self.config.get_scraper_concurrency_max()
+            )
         self.timeout = self.config.get_scraper_timeout()
         self.max_retries = self.config.get_scraper_retry_count()
         self.retry_delay = self.config.get_scraper_retry_delay()
         
+        # 重試預算（上游故障時限制重試量，避免放大負載）
+        self.retry_budget = RetryBudget(
+            "scraper",
+            ratio=self.config.get_retry_budget_ratio(),
+            reserve=self.config.get_retry_budget_reserve(),
+            max_delay=self.config.get_retry_max_delay()
+        )
+        
+        # 依網域延遲歷史調整逾時（timeout 為樣本不足時的預設值）
+        self.domain_timeouts: Optional[DomainTimeoutTracker] = None
+        if self.config.get_scraper_adaptive_timeout_enabled():
+            self.domain_timeouts = DomainTimeoutTracker(
+                default=self.timeout,
+                floor=self.config.get_scraper_timeout_floor(),
+                cap=self.config.get_scraper_timeout_cap(),
+                percentile=self.config.get_scraper_timeout_percentile(),
+                history_path=self.config.get_scraper_timeout_history_path() or None
+            )
+        
+        # 提前回傳條件（0 表示停用）：成功頁數門檻與整批截止秒數
+        self.min_success = self.config.get_scraper_min_success()
+        self.deadline = self.config.get_scraper_deadline()
+        
+        # 對沖請求（耗時超過近期延遲百分位數時發出第二個相同請求）
+        self.hedge_policy: Optional[HedgePolicy] = None
+        if self.config.get_scraper_hedge_enabled():
+            self.hedge_policy = HedgePolicy(
+                percentile=self.config.get_scraper_hedge_percentile(),
+                budget=self.config.get_scraper_hedge_budget(),
+                min_samples=self.config.get_scraper_hedge_min_samples()
+            )
+        
+        # 網域斷路器（網域故障或封鎖時直接失敗，不再重試）
+        self.circuit_breaker: Optional[CircuitBreaker] = None
+        if self.config.get_scraper_circuit_breaker_enabled():
+            self.circuit_breaker = CircuitBreaker(
+                failure_threshold=self.config.get_scraper_circuit_failure_threshold(),
+                min_failures=self.config.get_scraper_circuit_min_failures(),
+                cooldown=self.config.get_scraper_circuit_cooldown()
+            )
+        
+        # robots.txt 規則快取（每個來源只取得一次，快取期間不需網路往返）
+        self.robots: Optional[RobotsCache] = None
+        if self.config.get_scraper_robots_enabled():
+            self.robots = RobotsCache(
+                user_agent=self.config.get_scraper_robots_user_agent(),
+                ttl=self.config.get_scraper_robots_ttl()
+            )
+        
+        # 連線池配置
+        self.pool_limit = self.config.get_scraper_pool_limit()
+        self.pool_limit_per_host = self.config.get_scraper_pool_limit_per_host()
+        self.keepalive_timeout = self.config.get_scraper_keepalive_timeout()
+        
+        # 同主機禮貌性排程（跨分析共用，避免同網域請求同時湧入）
+        self.host_scheduler = HostScheduler(
+            per_host_limit=self.config.get_scraper_per_host_concurrent(),
+            min_delay=self.config.get_scraper_host_delay()
+        )
+        
+        # 串流讀取配置
+        self.stream_read = self.config.get_scraper_stream_read()
+        self.max_content_bytes = self.config.get_scraper_max_content_bytes()
+        
+        # PDF 文字擷取（需安裝 pypdf，未安裝時 PDF 視為非 HTML 略過）
+        self.pdf_enabled = self.config.get_scraper_pdf_enabled() and HAS_PDF
+        self.pdf_max_bytes = self.config.get_scraper_pdf_max_bytes()
+        
+        # HTML 磁碟儲存（以 ETag / Last-Modified 重新驗證，304 時重用內容）
+        self.html_store: Optional[HTMLStore] = None
+        if self.config.get_scraper_html_store_enabled():
+            # 預設放在使用者快取目錄，不寫入原始碼目錄
+            store_dir = self.config.get_scraper_html_store_dir() or os.path.join(
+                os.path.expanduser("~"), ".cache", "seo-analyzer", "html"
+            )
+            self.html_store = HTMLStore(store_dir, self.config.get_scraper_html_store_max_bytes())
+        
+        # HTML 解析工作池（避免解析阻塞事件迴圈）
+        self.parser_pool = ParserPool(
+            mode=self.config.get_scraper_parser_mode(),
+            max_workers=self.config.get_scraper_parser_workers(),
+            engine=self.config.get_scraper_parser_engine()
+        )
+        
+        # 共用 DNS 快取（TTL 與負向快取，合併同主機的並行查詢）
+        self.dns_resolver: Optional[CachingResolver] = None
+        if self.config.get_scraper_dns_cache_enabled():
+            self.dns_resolver = get_dns_resolver(
+                ttl=self.config.get_scraper_dns_cache_ttl(),
+                negative_ttl=self.config.get_scraper_dns_negative_ttl()
+            )
+        
+        # 解析結果快取（內容雜湊未變更時略過解析）
+        self.parse_cache: Optional[ParseCache] = None
+        if self.config.get_scraper_parse_cache_enabled():
+            self.parse_cache = ParseCache(
+                ttl=self.config.get_scraper_parse_cache_ttl(),
+                max_entries=self.config.get_scraper_parse_cache_max_entries()
+            )
+        
         # HTTP 請求配置
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
         ]
+        self.default_headers = {
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'zh-TW,zh;q=0.9,en;q=0.8',
+            # 依已安裝的解壓縮套件協商 (zstd / br / gzip / deflate)
+            'Accept-Encoding': accept_encoding_header(),
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+        }
+        
+        # 共用 HTTP 客戶端（應用程式啟動時建立，關閉時釋放）
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pool_counters = {
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+        }
+    
+    async def startup(self) -> None:
+        """建立共用的連線池與 ClientSession。
+        
+        應於應用程式啟動時呼叫，重複呼叫不會建立新的連線池。
+        """
+        self._get_session()
+    
+    async def close(self) -> None:
+        """關閉共用的 ClientSession 與解析工作池，釋放所有連線與工作者。
+        
+        應於應用程式關閉時呼叫；啟用延遲歷史保存時同時寫入檔案。
+        """
+        session = self._session
+        self._session = None
+        self._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+        self.parser_pool.shutdown(wait=False)
+        if self.domain_timeouts is not None:
+            try:
+                self.domain_timeouts.save()
+            except OSError as e:
+                print(f"⚠️ 網域延遲歷史儲存失敗: {str(e)}")
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """取得共用的 ClientSession，必要時延遲建立。
+        
+        若 Session 尚未建立、已關閉或屬於其他事件迴圈（例如測試或
+        腳本多次呼叫 asyncio.run），則重新建立。
+        
+        Returns:
+            aiohttp.ClientSession: 共用的 HTTP 客戶端
+        """
+        loop = asyncio.get_running_loop()
+        if (self._session is None or self._session.closed
+                or self._session_loop is not loop):
+            dns_options: Dict[str, Any] = {}
+            if self.dns_resolver is not None:
+                # 由共用解析器負責快取，關閉連線器內建的 DNS 快取
+                dns_options = {'resolver': self.dns_resolver, 'use_dns_cache': False}
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_limit,
+                limit_per_host=self.pool_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                **dns_options,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.default_headers,
+                # 自行解碼內容以統計傳輸與解碼後的位元組數
+                auto_decompress=False,
+                trace_configs=[self._create_trace_config()],
+            )
+            self._session_loop = loop
+        return self._session
+    
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """建立用於統計連線池使用狀況的 TraceConfig。
+        
+        Returns:
+            aiohttp.TraceConfig: 已註冊連線事件回呼的追蹤設定
+        """
+        counters = self._pool_counters
+        
+        async def on_request_start(_session, _ctx, _params):
+            counters['requests'] += 1
         
-    async def scrape_urls(self, urls: List[str]) -> ScrapingResult:
+        async def on_connection_create_end(_session, _ctx, _params):
+            counters['connections_created'] += 1
+        
+        async def on_connection_reuseconn(_session, _ctx, _params):
+            counters['connections_reused'] += 1
+        
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """取得連線池統計資訊。
+        
+        Returns:
+            dict: 包含連線重用率、開啟中的 socket 數與等待者數量等資訊
+        """
+        counters = self._pool_counters
+        acquired = counters['connections_created'] + counters['connections_reused']
+        
+        in_use = 0
+        idle = 0
+        waiters = 0
+        session = self._session
+        if session is not None and not session.closed and session.connector is not None:
+            connector = session.connector
+            in_use = len(getattr(connector, '_acquired', ()))
+            idle = sum(len(conns) for conns in getattr(connector, '_conns', {}).values())
+            # 直接讀取連線器的等待佇列；取消或逾時的等待者會由連線器移除
+            waiters = sum(len(keyed) for keyed in getattr(connector, '_waiters', {}).values())
+        
+        return {
+            'active': session is not None and not session.closed,
+            'pool_limit': self.pool_limit,
+            'pool_limit_per_host': self.pool_limit_per_host,
+            'requests': counters['requests'],
+            'connections_created': counters['connections_created'],
+            'connections_reused': counters['connections_reused'],
+            'reuse_ratio': round(counters['connections_reused'] / acquired, 4) if acquired else 0.0,
+            'open_sockets': in_use + idle,
+            'in_use': in_use,
+            'idle': idle,
+            'waiters': waiters,
+        }
+    
+    def get_parser_stats(self) -> Dict[str, Any]:
+        """取得 HTML 解析工作池統計資訊。
+        
+        Returns:
+            dict: 包含工作池大小、佇列深度與每次解析 CPU 時間的統計
+        """
+        return self.parser_pool.get_stats()
+    
+    def get_html_store_stats(self) -> Dict[str, Any]:
+        """取得 HTML 磁碟儲存的統計資訊。
+        
+        Returns:
+            dict: 包含項目數、總容量、重新驗證命中與淘汰次數的統計，
+            未啟用時僅包含 enabled=False
+        """
+        if self.html_store is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.html_store.get_stats()}
+    
+    def get_dns_stats(self) -> Dict[str, Any]:
+        """取得 DNS 快取的統計資訊。
+        
+        Returns:
+            dict: 包含命中率與查詢延遲的統計，未啟用時僅包含 enabled=False
+        """
+        if self.dns_resolver is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.dns_resolver.get_stats()}
+    
+    def get_parse_cache_stats(self) -> Dict[str, Any]:
+        """取得解析結果快取的統計資訊。
+        
+        Returns:
+            dict: 包含項目數與累計命中率的統計，未啟用時僅包含 enabled=False
+        """
+        if self.parse_cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.parse_cache.get_stats()}
+    
+    def get_hedge_stats(self) -> Dict[str, Any]:
+        """取得對沖請求的統計資訊。
+        
+        Returns:
+            dict: 包含對沖數、對沖勝出數與目前觸發延遲的統計，
+            未啟用時僅包含 enabled=False
+        """
+        if self.hedge_policy is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.hedge_policy.get_stats()}
+    
+    def get_timeout_stats(self) -> Dict[str, Any]:
+        """取得各網域延遲與自適應逾時的統計資訊。
+        
+        Returns:
+            dict: 包含逾時上下限與各網域百分位數延遲、目前逾時的統計，
+            未啟用時僅包含 enabled=False
+        """
+        if self.domain_timeouts is None:
+            return {'enabled': False, 'default': self.timeout}
+        return {'enabled': True, **self.domain_timeouts.get_stats()}
+    
+    def get_circuit_stats(self) -> Dict[str, Any]:
+        """取得網域斷路器的狀態。
+        
+        Returns:
+            dict: 包含開啟與半開的網域數及各網域失敗率、剩餘冷卻秒數，
+            未啟用時僅包含 enabled=False
+        """
+        if self.circuit_breaker is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.circuit_breaker.get_stats()}
+    
+    def get_robots_stats(self) -> Dict[str, Any]:
+        """取得 robots.txt 檢查的統計資訊。
+        
+        Returns:
+            dict: 包含檢查數、快取命中率與拒絕數的統計，未啟用時僅包含 enabled=False
+        """
+        if self.robots is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.robots.get_stats()}
+    
+    def get_concurrency_stats(self) -> Dict[str, Any]:
+        """取得全域並行上限的統計資訊。
+        
+        Returns:
+            dict: 包含目前上限、進行中與等待中的請求數及調整次數的統計，
+            未啟用自適應調整時上限固定為 max_concurrent
+        """
+        if self.concurrency is None:
+            return {'enabled': False, 'limit': self.max_concurrent}
+        return {'enabled': True, **self.concurrency.get_stats()}
+    
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """取得重試預算的統計資訊。
+        
+        Returns:
+            dict: 包含首次嘗試數、重試數與預算用盡次數的統計
+        """
+        return self.retry_budget.get_stats()
+    
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """取得同主機禮貌性排程的統計資訊。
+        
+        Returns:
+            dict: 包含各主機進行中與等待中的請求數，以及禮貌性延遲統計
+        """
+        return self.host_scheduler.get_stats()
+        
+    async def scrape_urls(
+        self,
+        urls: List[str],
+        min_success: Optional[int] = None,
+        deadline: Optional[float] = None
+    ) -> ScrapingResult:
         """批量爬取 URL 清單。
         
-        使用並行處理爬取多個 URL，提供完整的統計資訊。
+        使用並行處理爬取多個 URL，提供完整的統計資訊。成功頁數達到
+        min_success 或超過 deadline 時立即回傳，取消其餘爬取並在
+        errors 中標記為 Skipped。
         
         Args:
             urls: 要爬取的 URL 清單
+            min_success: 成功頁數門檻，None 使用設定值，0 表示等待全部完成
+            deadline: 整批爬取截止秒數，None 使用設定值，0 表示不限制
             
         Returns:
             ScrapingResult: 包含統計資訊和各頁面內容的結果
@@ -136,18 +629,26 @@ class ScraperService:
         
         start_time = time.time()
         
-        # 使用 Semaphore 控制並行數量
-        semaphore = asyncio.Semaphore(self.max_concurrent)
+        # 控制全域並行數量，同主機請求另由 host_scheduler 排程
+        semaphore = self._concurrency_gate()
         
         # 建立並行任務
         tasks = [
-            self._scrape_single_url_with_semaphore(semaphore, url)
+            asyncio.ensure_future(self._scrape_single_url_with_semaphore(semaphore, url))
             for url in urls
         ]
         
         # 執行並行爬取
         try:
-            pages = await asyncio.gather(*tasks, return_exceptions=True)
+            pages = await self._wait_for_pages(
+                tasks,
+                self.min_success if min_success is None else min_success,
+                self.deadline if deadline is None else deadline
+            )
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
         except Exception as e:
             raise ScraperException(f"並行爬取執行失敗: {str(e)}")
         
@@ -156,21 +657,10 @@ class ScraperService:
         errors = []
         
         for i, result in enumerate(pages):
-            if isinstance(result, Exception):
-                errors.append({
-                    'url': urls[i],
-                    'error': str(result),
-                    'error_type': type(result).__name__
-                })
-            elif isinstance(result, PageContent):
-                if result.success:
-                    successful_pages.append(result)
-                else:
-                    errors.append({
-                        'url': result.url,
-                        'error': result.error or 'Unknown error',
-                        'error_type': 'ScrapingError'
-                    })
+            if isinstance(result, PageContent) and result.success:
+                successful_pages.append(result)
+            else:
+                errors.append(self._error_entry(urls[i], result))
         
         # 計算統計資訊
         total_results = len(urls)
@@ -183,6 +673,9 @@ class ScraperService:
             avg_word_count = 0
             avg_paragraphs = 0
         
+        parse_cache_hits = sum(1 for page in successful_pages if page.parse_cached)
+        parse_cache_misses = successful_scrapes - parse_cache_hits
+        
         processing_time = time.time() - start_time
         
         # 檢查是否達到最低成功率要求 (80%)
@@ -192,6 +685,8 @@ class ScraperService:
             print(f"警告：爬蟲成功率 {success_rate:.1%} 低於 80% 目標")
         
         print(f"爬蟲完成：{successful_scrapes}/{total_results} 成功，耗時 {processing_time:.2f} 秒")
+        if self.parse_cache is not None:
+            print(f"🗃️ 解析快取：命中 {parse_cache_hits}，未命中 {parse_cache_misses}")
         
         # 印出每筆URL資料的前100字元
         print("📄 網頁爬取內容預覽：")
@@ -222,52 +717,260 @@ class ScraperService:
             avg_word_count=avg_word_count,
             avg_paragraphs=avg_paragraphs,
             pages=successful_pages + [page for page in pages if isinstance(page, PageContent) and not page.success],
-            errors=errors
+            errors=errors,
+            parse_cache_hits=parse_cache_hits,
+            parse_cache_misses=parse_cache_misses
         )
     
-    async def _scrape_single_url_with_semaphore(self, semaphore: asyncio.Semaphore, url: str) -> PageContent:
-        """使用 Semaphore 控制的單頁爬取。
+    async def scrape_urls_iter(self, urls: List[str]) -> AsyncIterator[ScrapeProgress]:
+        """批量爬取 URL 清單，依完成順序逐一產生結果。
+        
+        與 scrape_urls 使用相同的並行控制，但每個 URL 完成即產生
+        ScrapeProgress（含目前的累計統計），下游可以先處理較早完成
+        的頁面。提前結束迭代時會取消其餘爬取。
+        
+        Args:
+            urls: 要爬取的 URL 清單
+            
+        Yields:
+            ScrapeProgress: 完成的頁面與累計統計
+            
+        Example:
+            >>> async for progress in scraper.scrape_urls_iter(urls):
+            ...     print(f"{progress.completed}/{progress.total_results} {progress.page.url}")
+        """
+        semaphore = self._concurrency_gate()
+        tasks = {
+            asyncio.ensure_future(self._scrape_single_url_with_semaphore(semaphore, url)): url
+            for url in urls
+        }
+        pending = set(tasks)
+        completed = 0
+        successful = 0
+        word_total = 0
+        paragraph_total = 0
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    url = tasks[task]
+                    result = task.exception() or task.result()
+                    completed += 1
+                    error = None
+                    if isinstance(result, PageContent) and result.success:
+                        page = result
+                        successful += 1
+                        word_total += page.word_count
+                        paragraph_total += page.paragraph_count
+                    else:
+                        error = self._error_entry(url, result)
+                        page = result if isinstance(result, PageContent) else PageContent(
+                            url=url, h2_list=[], success=False, error=error['error']
+                        )
+                    yield ScrapeProgress(
+                        page=page,
+                        error=error,
+                        completed=completed,
+                        total_results=len(urls),
+                        successful_scrapes=successful,
+                        avg_word_count=int(word_total / successful) if successful else 0,
+                        avg_paragraphs=int(paragraph_total / successful) if successful else 0
+                    )
+        finally:
+            # 提前結束迭代或被取消時，取消其餘爬取並釋放連線與主機名額
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    @staticmethod
+    def _error_entry(url: str, result: Union[PageContent, BaseException]) -> Dict[str, Any]:
+        """將失敗的爬取結果轉為 ScrapingResult.errors 的項目。
+        
+        Args:
+            url: 原始 URL
+            result: 失敗的 PageContent 或爬取時發生的例外
+            
+        Returns:
+            dict: 包含 url、error 與 error_type 的錯誤資訊
+        """
+        if isinstance(result, PageContent):
+            return {
+                'url': result.url,
+                'error': result.error or 'Unknown error',
+                'error_type': 'ScrapingError'
+            }
+        if isinstance(result, ScraperSkippedException):
+            error_type = 'Skipped'
+        elif isinstance(result, ScraperCircuitOpenException):
+            error_type = 'CircuitOpen'
+        elif isinstance(result, ScraperDisallowedException):
+            error_type = 'RobotsDisallowed'
+        else:
+            error_type = type(result).__name__
+        return {'url': url, 'error': str(result), 'error_type': error_type}
+    
+    @staticmethod
+    async def _wait_for_pages(
+        tasks: List["asyncio.Future[PageContent]"],
+        min_success: int,
+        deadline: float
+    ) -> List[Union[PageContent, BaseException]]:
+        """等待爬取任務完成，達到成功頁數門檻或截止時間時提前結束。
+        
+        Args:
+            tasks: 依 URL 順序排列的爬取任務
+            min_success: 成功頁數門檻，<= 0 表示不提前結束
+            deadline: 截止秒數，<= 0 表示不限制
+            
+        Returns:
+            list: 依 URL 順序的結果；例外以例外物件表示，
+            被取消的任務為 ScraperSkippedException
+        """
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + deadline if deadline > 0 else None
+        pending = set(tasks)
+        successes = 0
+        reason = None
+        
+        while pending:
+            timeout = None if deadline_at is None else max(deadline_at - loop.time(), 0)
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                reason = f"已略過：超過 {deadline:g} 秒截止時間"
+                break
+            successes += sum(
+                1 for task in done
+                if not task.cancelled() and task.exception() is None and task.result().success
+            )
+            if pending and 0 < min_success <= successes:
+                reason = f"已略過：已取得 {successes} 個成功頁面"
+                break
+        
+        # 取消尚未完成的爬取並等待其結束，釋放連線與主機名額
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        results: List[Union[PageContent, BaseException]] = []
+        for task in tasks:
+            if task in pending or task.cancelled():
+                results.append(ScraperSkippedException(reason or "已略過"))
+            elif task.exception() is not None:
+                results.append(task.exception())
+            else:
+                results.append(task.result())
+        return results
+    
+    def _concurrency_gate(self) -> Union[asyncio.Semaphore, AdaptiveConcurrencyLimiter]:
+        """取得控制全域並行數量的名額來源。
+        
+        Returns:
+            跨分析共用的自適應並行限制器；未啟用時為本次分析專用、
+            上限為 max_concurrent 的 Semaphore
+        """
+        if self.concurrency is not None:
+            return self.concurrency
+        return asyncio.Semaphore(self.max_concurrent)
+    
+    async def _scrape_single_url_with_semaphore(
+        self,
+        semaphore: Union[asyncio.Semaphore, AdaptiveConcurrencyLimiter],
+        url: str
+    ) -> PageContent:
+        """使用 Semaphore 與主機排程控制的單頁爬取。
+        
+        每次嘗試先取得主機名額再佔用全域名額，等待同主機禮貌性間隔
+        或重試退避 (含 Retry-After) 的請求不會佔住任何名額，其他主機
+        的請求可以繼續進行。網域斷路器開啟或 robots.txt 不允許時不佔用
+        任何名額，直接失敗。
         
         Args:
-            semaphore: 用於控制並行數量的 Semaphore
+            semaphore: 用於控制全域並行數量的 Semaphore 或自適應並行限制器
             url: 要爬取的 URL
             
         Returns:
             PageContent: 爬取結果
+            
+        Raises:
+            ScraperCircuitOpenException: 網域斷路器開啟中
+            ScraperDisallowedException: robots.txt 不允許爬取
         """
-        async with semaphore:
-            return await self.scrape_single_url(url)
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow(url):
+            raise ScraperCircuitOpenException(self._circuit_open_message(url))
+        
+        if self.robots is not None and not await self.robots.allowed(self._get_session(), url):
+            raise ScraperDisallowedException(f"robots.txt 不允許爬取 {url}")
+        
+        return await self.scrape_single_url(url, gate=semaphore)
     
-    async def scrape_single_url(self, url: str) -> PageContent:
+    async def scrape_single_url(
+        self,
+        url: str,
+        gate: Optional[Union[asyncio.Semaphore, AdaptiveConcurrencyLimiter]] = None
+    ) -> PageContent:
         """爬取單個 URL 的內容。
         
-        包含重試機制和完整的錯誤處理。
+        包含重試機制、對沖請求和完整的錯誤處理。
         
         Args:
             url: 要爬取的 URL
+            gate: 全域並行名額 (可選)；提供時每次嘗試都經由主機排程取得
+                主機與全域名額，重試退避期間歸還，對沖請求另外取得名額
             
         Returns:
             PageContent: 爬取的頁面內容
         """
         start_time = time.time()
         last_error = None
+        last_page = None
+        self.retry_budget.record_attempt()
         
         for attempt in range(self.max_retries):
+            if attempt and self.circuit_breaker is not None and self.circuit_breaker.is_open(url):
+                # 重試期間網域斷路器已開啟，不再重試
+                last_error = ScraperCircuitOpenException(self._circuit_open_message(url))
+                break
+            last_page = retry_after = None
+            attempt_start = time.monotonic()
             try:
-                return await self._execute_scraping(url, start_time)
+                async with self._attempt_slot(url, gate):
+                    page = await self._execute_hedged(url, start_time, gate)
+                self._record_concurrency(True, time.monotonic() - attempt_start)
+                self._record_circuit(url, page.status_code not in (403, 429) and page.status_code < 500)
+                # 只有伺服器明確要求稍後再試 (Retry-After) 的 429 / 503 才重試
+                if page.retry_after is None:
+                    return page
+                last_page, retry_after = page, page.retry_after
             except asyncio.TimeoutError:
+                self._record_concurrency(False)
+                self._record_circuit(url, False)
                 last_error = ScraperTimeoutException(f"URL {url} 爬取逾時")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
-                    continue
             except ClientError as e:
+                self._record_concurrency(False)
+                self._record_circuit(url, False)
                 last_error = ScraperException(f"網路錯誤: {str(e)}")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
-                    continue
             except Exception as e:
+                # 網域有回應，只是內容無法處理
+                self._record_circuit(url, True)
                 last_error = ScraperException(f"未預期錯誤: {str(e)}")
                 break  # 非網路錯誤不重試
+            
+            if attempt == self.max_retries - 1:
+                break
+            delay = self.retry_budget.retry_delay(attempt, self.retry_delay, retry_after)
+            if delay is None:
+                # 重試預算用盡或 Retry-After 過長
+                break
+            await asyncio.sleep(delay)
+        
+        if last_page is not None:
+            # 不再重試的 429 / 503 回應
+            return last_page
         
         # 所有重試都失敗，回傳失敗結果
         load_time = time.time() - start_time
@@ -279,12 +982,189 @@ class ScraperService:
             error=str(last_error) if last_error else "未知錯誤"
         )
     
-    async def _execute_scraping(self, url: str, start_time: float) -> PageContent:
+    def _attempt_slot(
+        self,
+        url: str,
+        gate: Optional[Union[asyncio.Semaphore, AdaptiveConcurrencyLimiter]] = None
+    ) -> AsyncContextManager[None]:
+        """取得單次嘗試的主機與全域名額；未提供 gate 時不排程。
+        
+        Args:
+            url: 要爬取的 URL
+            gate: 全域並行名額 (可選)
+            
+        Returns:
+            AsyncContextManager: 離開區塊時歸還名額
+        """
+        if gate is None:
+            return contextlib.nullcontext()
+        # 取得全域名額後才預約主機的禮貌性間隔
+        return self.host_scheduler.slot(url, gate=gate)
+    
+    def _record_concurrency(self, success: bool, latency: Optional[float] = None) -> None:
+        """回報請求結果給自適應並行限制器。
+        
+        Args:
+            success: 是否取得回應（逾時與連線錯誤視為失敗）
+            latency: 本次嘗試取得回應的秒數
+        """
+        if self.concurrency is not None:
+            self.concurrency.record(success, latency)
+    
+    def _record_circuit(self, url: str, success: bool) -> None:
+        """回報請求結果給網域斷路器。
+        
+        Args:
+            url: 目標 URL
+            success: 網域是否正常回應（逾時、連線錯誤、HTTP 403 / 429
+                與 5xx 視為網域失敗）
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(url, success)
+    
+    def _circuit_open_message(self, url: str) -> str:
+        """產生斷路器開啟時的錯誤訊息。"""
+        domain = CircuitBreaker.domain_key(url)
+        retry_after = self.circuit_breaker.retry_after(url)
+        return f"網域 {domain} 斷路器開啟中（近期失敗率過高），約 {retry_after:.0f} 秒後再試"
+    
+    async def _execute_hedged(
+        self,
+        url: str,
+        start_time: float,
+        gate: Optional[Union[asyncio.Semaphore, AdaptiveConcurrencyLimiter]] = None
+    ) -> PageContent:
+        """執行爬取，耗時超過近期延遲百分位數時發出對沖請求。
+        
+        兩個請求中先完成者的結果被採用，另一個請求立即取消；
+        先完成者失敗時改等另一個請求。對沖請求與一般請求一樣經過
+        主機排程與全域名額，名額不足時不對沖；對沖次數受預算限制。
+        
+        Args:
+            url: 要爬取的 URL
+            start_time: 開始時間 (用於計算載入時間)
+            gate: 全域並行名額 (可選)
+            
+        Returns:
+            PageContent: 爬取結果
+            
+        Raises:
+            各種網路和解析相關例外
+        """
+        policy = self.hedge_policy
+        if policy is None:
+            return await self._execute_timed(url, start_time)
+        
+        loop = asyncio.get_running_loop()
+        attempt_start = loop.time()
+        delay = policy.hedge_delay()
+        primary = asyncio.ensure_future(self._execute_timed(url, start_time))
+        tasks = [primary]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    hedge = await self._start_hedge(url, start_time, gate)
+                    if hedge is not None:
+                        tasks.append(hedge)
+            
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None or not pending:
+                    winner = winner or done.pop()
+                    break
+        finally:
+            # 取消落後的請求並等待其結束，釋放連線
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if winner is not primary:
+            policy.record_win()
+        page = winner.result()
+        if page.success:
+            policy.record(loop.time() - attempt_start)
+        return page
+    
+    async def _start_hedge(
+        self,
+        url: str,
+        start_time: float,
+        gate: Optional[Union[asyncio.Semaphore, AdaptiveConcurrencyLimiter]] = None
+    ) -> Optional["asyncio.Task[PageContent]"]:
+        """不等待地取得主機與全域名額後發出對沖請求。
+        
+        主機名額已滿、全域名額已滿、同主機禮貌性間隔未到或對沖預算
+        不足時不對沖。名額在對沖請求結束 (含取消) 時歸還。
+        
+        Args:
+            url: 要爬取的 URL
+            start_time: 開始時間 (用於計算載入時間)
+            gate: 全域並行名額 (可選)
+            
+        Returns:
+            Optional[asyncio.Task]: 對沖請求，未對沖時為 None
+        """
+        if not await self.host_scheduler.try_acquire(url, gate=gate):
+            self.hedge_policy.record_no_slot()
+            return None
+        if not self.hedge_policy.try_acquire():
+            self.host_scheduler.release(url, gate=gate)
+            return None
+        
+        hedge = asyncio.ensure_future(self._execute_timed(url, start_time))
+        # 以完成回呼歸還名額，開始執行前即被取消也不會遺漏
+        hedge.add_done_callback(lambda _task: self.host_scheduler.release(url, gate=gate))
+        return hedge
+    
+    async def _execute_timed(self, url: str, start_time: float) -> PageContent:
+        """以網域的自適應逾時執行爬取，並記錄本次延遲。
+        
+        Args:
+            url: 要爬取的 URL
+            start_time: 開始時間 (用於計算載入時間)
+            
+        Returns:
+            PageContent: 爬取結果
+            
+        Raises:
+            各種網路和解析相關例外
+        """
+        tracker = self.domain_timeouts
+        if tracker is None:
+            return await self._execute_scraping(url, start_time, timeout=self.timeout)
+        
+        timeout = tracker.timeout_for(url)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            page = await self._execute_scraping(url, start_time, timeout=timeout)
+        except asyncio.TimeoutError:
+            tracker.record(url, timeout, timed_out=True)
+            raise
+        if page.status_code:
+            tracker.record(url, loop.time() - started)
+        return page
+    
+    async def _execute_scraping(
+        self,
+        url: str,
+        start_time: float,
+        conditional: bool = True,
+        timeout: Optional[float] = None
+    ) -> PageContent:
         """執行實際的網頁爬取作業。
         
+        HTML 儲存中已有驗證器時發送條件式請求，伺服器回應 304
+        即直接重用儲存的內容。
+        
         Args:
             url: 要爬取的 URL
             start_time: 開始時間 (用於計算載入時間)
+            conditional: 是否允許使用儲存的驗證器發送條件式請求
+            timeout: 請求逾時秒數，None 使用設定值
             
         Returns:
             PageContent: 爬取結果
@@ -292,144 +1172,412 @@ class ScraperService:
         Raises:
             各種網路和解析相關例外
         """
-        # 建立 HTTP 客戶端配置
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        # 使用共用連線池發送請求，僅 User-Agent 依 URL 變化
+        session = self._get_session()
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
         headers = {
             'User-Agent': self.user_agents[hash(url) % len(self.user_agents)],
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'zh-TW,zh;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
         }
         
-        async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
-            async with session.get(url) as response:
-                # 記錄載入時間
-                load_time = time.time() - start_time
-                status_code = response.status
-                
-                # 檢查回應狀態
-                if status_code >= 400:
-                    return PageContent(
-                        url=url,
-                        h2_list=[],
-                        status_code=status_code,
-                        load_time=load_time,
-                        success=False,
-                        error=f"HTTP {status_code} 錯誤"
-                    )
-                
-                # 讀取網頁內容
-                html_content = await response.text()
-                
-                # 解析 HTML 並提取 SEO 元素
-                page_data = self._extract_seo_elements(html_content, url)
-                
-                return PageContent(
-                    url=url,
-                    h2_list=page_data.get('h2_list', []),
-                    title=page_data.get('title'),
-                    meta_description=page_data.get('meta_description'),
-                    h1=page_data.get('h1'),
-                    word_count=page_data.get('word_count', 0),
-                    paragraph_count=page_data.get('paragraph_count', 0),
-                    status_code=status_code,
-                    load_time=load_time,
-                    success=True
-                )
-    
-    def _extract_seo_elements(self, html: str, _original_url: str) -> Dict[str, Any]:
-        """從 HTML 內容中提取 SEO 相關元素。
+        stored = None
+        if conditional and self.html_store is not None:
+            stored = await self.html_store.lookup(url)
+            if stored is not None:
+                headers.update(stored.conditional_headers())
+        
+        async with session.get(url, headers=headers, timeout=client_timeout) as response:
+            # 記錄載入時間
+            load_time = time.time() - start_time
+            status_code = response.status
+            
+            # 內容未變更：重用儲存的 HTML
+            if status_code == 304:
+                page = await self._reuse_stored_page(url, stored, status_code, load_time)
+                if page is not None:
+                    return page
+            else:
+                return await self._read_response(response, url, status_code, load_time)
+        
+        # 儲存內容已遺失：先釋放 304 回應的連線，再發送一般請求
+        return await self._execute_scraping(url, start_time, conditional=False, timeout=timeout)
+    
+    async def _reuse_stored_page(
+        self,
+        url: str,
+        stored: Optional[StoredPage],
+        status_code: int,
+        load_time: float
+    ) -> Optional[PageContent]:
+        """伺服器回應 304 時以儲存的 HTML 建立結果。
         
         Args:
-            html: HTML 原始內容
-            original_url: 原始 URL (用於相對連結處理)
+            url: 原始 URL
+            stored: 發送條件式請求時使用的儲存項目
+            status_code: HTTP 狀態碼
+            load_time: 載入時間 (秒)
+            
+        Returns:
+            Optional[PageContent]: 爬取結果；儲存內容已遺失需重新請求時為 None
+        """
+        if stored is None:
+            # 未發送條件式請求卻收到 304，沒有可解析的內容
+            return PageContent(
+                url=url,
+                h2_list=[],
+                status_code=status_code,
+                load_time=load_time,
+                success=False,
+                error="HTTP 304 回應但沒有可重用的儲存內容"
+            )
+        
+        body = await self.html_store.load_body(url)
+        if body is None:
+            return None
+        
+        page_data, parse_cpu_time, parse_cached = await self._extract_with_cache(
+            body, url, encoding=stored.charset
+        )
+        return self._build_page_content(
+            url, page_data, status_code, load_time,
+            decoded_bytes=len(body),
+            truncated=stored.truncated,
+            parse_cpu_time=parse_cpu_time,
+            revalidated=True,
+            parse_cached=parse_cached,
+            charset=stored.charset
+        )
+    
+    async def _read_response(
+        self,
+        response: aiohttp.ClientResponse,
+        url: str,
+        status_code: int,
+        load_time: float
+    ) -> PageContent:
+        """讀取一般回應的內容並提取 SEO 元素。
+        
+        Args:
+            response: aiohttp 回應物件
+            url: 原始 URL
+            status_code: HTTP 狀態碼
+            load_time: 載入時間 (秒)
             
         Returns:
-            dict: 包含 SEO 元素的字典
+            PageContent: 爬取結果
             
         Raises:
+            ScraperException: 內容解碼失敗
             ScraperParsingException: HTML 解析失敗
         """
+        # 檢查回應狀態
+        if status_code >= 400:
+            retry_after = None
+            if status_code in (429, 503):
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            return PageContent(
+                url=url,
+                h2_list=[],
+                status_code=status_code,
+                load_time=load_time,
+                success=False,
+                error=f"HTTP {status_code} 錯誤",
+                retry_after=retry_after
+            )
+        
+        # 讀取內容前先依標頭判斷類型與大小，非 HTML 內容不下載
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        content_length = self._header_content_length(response)
+        if content_type == 'application/pdf' and self.pdf_enabled:
+            return await self._read_pdf_response(
+                response, url, status_code, load_time, content_length
+            )
+        if content_type not in self.HTML_CONTENT_TYPES:
+            return PageContent(
+                url=url,
+                h2_list=[],
+                status_code=status_code,
+                load_time=load_time,
+                success=False,
+                error=f"略過非 HTML 內容 ({content_type})",
+                content_type=content_type
+            )
+        # 超過上限的大型頁面一律以串流讀取截斷，不整份下載
+        stream_read = self.stream_read or (
+            content_length is not None and content_length > self.max_content_bytes
+        )
+        
+        etag = last_modified = None
+        if self.html_store is not None:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+        store_body = bool(etag or last_modified)
+        
+        # 讀取並解碼網頁內容
         try:
-            # 使用 lxml 解析器提升效能
-            soup = BeautifulSoup(html, 'lxml')
-        except Exception as e:
-            raise ScraperParsingException(f"HTML 解析失敗: {str(e)}")
-        
-        result = {}
-        
-        # 提取頁面標題
-        title_tag = soup.find('title')
-        result['title'] = title_tag.get_text(strip=True) if title_tag else None
-        
-        # 提取 Meta Description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if not meta_desc:
-            meta_desc = soup.find('meta', attrs={'property': 'og:description'})
-        
-        if meta_desc and isinstance(meta_desc, Tag):
-            # 根據 BeautifulSoup 文檔，使用 get 方法安全存取屬性
-            content = meta_desc.get('content', '')
-            if content and isinstance(content, (str, list)):
-                # 處理可能的 list 類型 (如 class 屬性)
-                content_str = content[0] if isinstance(content, list) else content
-                result['meta_description'] = content_str.strip() if content_str else None
-            else:
-                result['meta_description'] = None
-        else:
-            result['meta_description'] = None
-        
-        # 提取 H1 標籤 (取第一個)
-        h1_tag = soup.find('h1')
-        result['h1'] = h1_tag.get_text(strip=True) if h1_tag else None
-        
-        # 提取所有 H2 標籤
-        h2_tags = soup.find_all('h2')
-        result['h2_list'] = []
-        for h2 in h2_tags:
-            if h2 and isinstance(h2, Tag):
-                h2_text = h2.get_text(strip=True)
-                if h2_text:
-                    result['h2_list'].append(h2_text)
-        
-        # 計算內文字數和段落數
-        # 移除 script, style, nav, footer 等非內容標籤
-        for element in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-            element.decompose()
-        
-        # 提取主要內容區域的文字
-        main_content = (soup.find('main') or soup.find('article') or 
-                       soup.find('div', class_='content') or soup.find('body'))
-        
-        if main_content and isinstance(main_content, (Tag, NavigableString)):
-            # 計算字數 (移除多餘空白)
-            text_content = main_content.get_text(separator=' ', strip=True)
-            # 中英文字數統計 (中文字符 + 英文單字)
-            chinese_chars = len([c for c in text_content if '\u4e00' <= c <= '\u9fff'])
-            english_words = len(text_content.split()) - chinese_chars
-            result['word_count'] = chinese_chars + english_words
-            
-            # 計算段落數 (p 標籤 + br 標籤組)
-            paragraphs = []
-            if isinstance(main_content, Tag):
-                try:
-                    paragraphs = main_content.find_all('p')
-                except Exception:
-                    paragraphs = []
-            
-            if isinstance(main_content, Tag):
-                br_groups = len(main_content.get_text().split('\n\n'))
-                result['paragraph_count'] = max(len(paragraphs), br_groups - 1, 1)
+            decoder = ContentDecoder(response.headers.get('Content-Encoding'))
+            bytes_read = 0
+            bytes_skipped = None
+            truncated = False
+            if stream_read:
+                body, bytes_skipped, truncated = await self._read_body_streaming(response, decoder)
+                bytes_read = len(body)
             else:
-                result['paragraph_count'] = 1
+                body = decoder.decompress(await response.read())
+                body += decoder.flush()
+        except ContentDecodingError as e:
+            raise ScraperException(str(e)) from e
+        
+        # 位元組直接交給解析器，編碼只看 BOM、標頭與開頭 1024 位元組的 meta
+        charset, _ = resolve_charset(body, response.charset)
+        page_data, parse_cpu_time, parse_cached = await self._extract_with_cache(
+            body, url, encoding=charset
+        )
+        
+        if store_body:
+            await self.html_store.save(
+                url, body,
+                etag=etag,
+                last_modified=last_modified,
+                charset=charset,
+                truncated=truncated
+            )
+        
+        return self._build_page_content(
+            url, page_data, status_code, load_time,
+            bytes_read=bytes_read,
+            wire_bytes=decoder.wire_bytes,
+            decoded_bytes=len(body),
+            bytes_skipped=bytes_skipped,
+            truncated=truncated,
+            parse_cpu_time=parse_cpu_time,
+            parse_cached=parse_cached,
+            charset=charset,
+            content_type=content_type or None
+        )
+    
+    @staticmethod
+    def _header_content_length(response: aiohttp.ClientResponse) -> Optional[int]:
+        """由回應標頭取得 Content-Length，未提供或格式錯誤時為 None。"""
+        try:
+            return int(response.headers.get('Content-Length', ''))
+        except ValueError:
+            return None
+    
+    async def _read_pdf_response(
+        self,
+        response: aiohttp.ClientResponse,
+        url: str,
+        status_code: int,
+        load_time: float,
+        content_length: Optional[int]
+    ) -> PageContent:
+        """讀取 PDF 回應並擷取文字。
+        
+        PDF 截斷後無法解析，超過 pdf_max_bytes 時直接放棄而不截斷；
+        有 Content-Length 時在讀取前判斷。
+        
+        Args:
+            response: aiohttp 回應物件
+            url: 原始 URL
+            status_code: HTTP 狀態碼
+            load_time: 載入時間 (秒)
+            content_length: 標頭的 Content-Length
+            
+        Returns:
+            PageContent: 爬取結果
+            
+        Raises:
+            ScraperException: 內容解碼失敗
+            ScraperParsingException: PDF 解析失敗
+        """
+        too_large = PageContent(
+            url=url,
+            h2_list=[],
+            status_code=status_code,
+            load_time=load_time,
+            success=False,
+            error=f"PDF 超過 {self.pdf_max_bytes} 位元組上限",
+            content_type='application/pdf'
+        )
+        if content_length is not None and content_length > self.pdf_max_bytes:
+            return too_large
+        
+        try:
+            decoder = ContentDecoder(response.headers.get('Content-Encoding'))
+            chunks: List[bytes] = []
+            size = 0
+            async for raw_chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                chunk = decoder.decompress(raw_chunk)
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > self.pdf_max_bytes:
+                    return too_large
+            chunks.append(decoder.flush())
+        except ContentDecodingError as e:
+            raise ScraperException(str(e)) from e
+        body = b''.join(chunks)
+        
+        try:
+            page_data, parse_cpu_time = await self.parser_pool.parse_pdf(body)
+        except PDFExtractionError as e:
+            raise ScraperParsingException(str(e)) from e
+        
+        return self._build_page_content(
+            url, page_data, status_code, load_time,
+            wire_bytes=decoder.wire_bytes,
+            decoded_bytes=len(body),
+            parse_cpu_time=parse_cpu_time,
+            content_type='application/pdf'
+        )
+    
+    @staticmethod
+    def _build_page_content(
+        url: str,
+        page_data: Dict[str, Any],
+        status_code: int,
+        load_time: float,
+        **extra: Any
+    ) -> PageContent:
+        """由解析結果建立成功的 PageContent。
+        
+        Args:
+            url: 原始 URL
+            page_data: SEO 元素字典
+            status_code: HTTP 狀態碼
+            load_time: 載入時間 (秒)
+            **extra: 其他 PageContent 欄位 (讀取量、解析時間等)
+            
+        Returns:
+            PageContent: 爬取結果
+        """
+        return PageContent(
+            url=url,
+            h2_list=page_data.get('h2_list', []),
+            title=page_data.get('title'),
+            meta_description=page_data.get('meta_description'),
+            h1=page_data.get('h1'),
+            word_count=page_data.get('word_count', 0),
+            paragraph_count=page_data.get('paragraph_count', 0),
+            sentence_count=page_data.get('sentence_count', 0),
+            status_code=status_code,
+            load_time=load_time,
+            success=True,
+            **extra
+        )
+    
+    async def _read_body_streaming(
+        self, response: aiohttp.ClientResponse, decoder: ContentDecoder
+    ) -> Tuple[bytes, Optional[int], bool]:
+        """以串流方式分段讀取並解碼回應內容。
+        
+        讀取至解碼後 max_content_bytes 上限，或在 <head>、第一個 <h1> 與
+        主要內容區皆已出現時提前停止。提前停止的連線不會放回連線池。
+        
+        Args:
+            response: aiohttp 回應物件
+            decoder: 內容解碼器 (同時統計傳輸位元組數)
+            
+        Returns:
+            tuple: (已讀取的解碼後內容, 略過的傳輸位元組數, 是否提前停止)。
+            未提供 Content-Length 時，略過的位元組數為 None。
+            
+        Raises:
+            ContentDecodingError: 內容解碼失敗
+        """
+        tracker = _EssentialContentTracker()
+        chunks: List[bytes] = []
+        bytes_read = 0
+        truncated = False
+        
+        async for raw_chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+            chunk = decoder.decompress(raw_chunk)
+            if not chunk:
+                continue
+            remaining = self.max_content_bytes - bytes_read
+            if len(chunk) > remaining:
+                chunks.append(chunk[:remaining])
+                bytes_read += remaining
+                truncated = True
+                break
+            chunks.append(chunk)
+            bytes_read += len(chunk)
+            if tracker.feed(chunk):
+                truncated = True
+                break
         else:
-            result['word_count'] = 0
-            result['paragraph_count'] = 0
+            tail = decoder.flush()
+            remaining = self.max_content_bytes - bytes_read
+            if len(tail) > remaining:
+                tail = tail[:remaining]
+                truncated = True
+            chunks.append(tail)
+            bytes_read += len(tail)
         
-        return result
+        bytes_skipped: Optional[int] = 0
+        if truncated:
+            bytes_skipped = None
+            if response.content_length is not None:
+                bytes_skipped = max(response.content_length - decoder.wire_bytes, 0)
+        
+        return b''.join(chunks), bytes_skipped, truncated
+    
+    async def _extract_with_cache(
+        self,
+        html: Union[str, bytes],
+        url: str,
+        encoding: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], float, bool]:
+        """提取 SEO 元素，內容雜湊未變更時重用快取結果。
+        
+        Args:
+            html: HTML 原始內容 (字串或位元組)
+            url: 原始 URL
+            encoding: 位元組內容的已知編碼 (可選)
+            
+        Returns:
+            tuple: (SEO 元素字典, 解析耗用的 CPU 時間秒數, 是否命中快取)
+            
+        Raises:
+            ScraperParsingException: HTML 解析失敗
+        """
+        if self.parse_cache is None:
+            page_data, parse_cpu_time = await self._extract_seo_elements(html, url, encoding)
+            return page_data, parse_cpu_time, False
+        
+        content_hash = ParseCache.content_hash(html, encoding)
+        page_data = self.parse_cache.get(url, content_hash)
+        if page_data is not None:
+            return page_data, 0.0, True
+        
+        page_data, parse_cpu_time = await self._extract_seo_elements(html, url, encoding)
+        self.parse_cache.put(url, content_hash, page_data)
+        return page_data, parse_cpu_time, False
+    
+    async def _extract_seo_elements(
+        self,
+        html: Union[str, bytes],
+        _original_url: str,
+        encoding: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], float]:
+        """透過解析工作池從 HTML 內容中提取 SEO 相關元素。
+        
+        解析在工作池中執行，避免大型頁面阻塞事件迴圈。
+        
+        Args:
+            html: HTML 原始內容 (字串或位元組)
+            original_url: 原始 URL (用於相對連結處理)
+            encoding: 位元組內容的已知編碼 (可選)
+            
+        Returns:
+            tuple: (SEO 元素字典, 解析耗用的 CPU 時間秒數)
+            
+        Raises:
+            ScraperParsingException: HTML 解析失敗
+        """
+        try:
+            return await self.parser_pool.parse(html, encoding)
+        except HTMLExtractionError as e:
+            raise ScraperParsingException(str(e)) from e
 
 
 
@@ -0,0 +1,223 @@
+"""SERP 搜尋結果快取模組。
+
+每次 SerpAPI 搜尋都需付費且耗時數秒，而關鍵字重複的比例很高。
+此模組以正規化後的搜尋參數（不含 api_key）作為鍵值，快取通過
+驗證的 SerpAPI 回應：
+
+- 記憶體層：行程內 LRU，命中時不需任何 I/O
+- 磁碟層：每個鍵值一個 JSON 檔，重新啟動後仍可命中；磁碟命中
+  會回填記憶體層
+
+兩層共用同一個 TTL（預設 24 小時），過期項目於讀取時移除。
+快取的是原始回應而非 SerpResult，命中時仍以呼叫端的關鍵字解析。
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+# 不納入快取鍵值的參數（憑證與輸出格式不影響搜尋結果）
+_IGNORED_PARAMS = frozenset({'api_key', 'output', 'source'})
+
+
+class SerpCache:
+    """記憶體 LRU 與本機磁碟兩層的 SERP 回應快取。
+
+    Example:
+        >>> cache = SerpCache(ttl=86400, directory="/tmp/serp-cache")
+        >>> data = await cache.get(params)
+        >>> if data is None:
+        ...     data = await fetch(params)
+        ...     await cache.put(params, data)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 24 * 3600,
+        max_entries: int = 512,
+        directory: Optional[str] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """初始化 SERP 快取。
+
+        Args:
+            ttl: 快取存活時間（秒），預設 24 小時
+            max_entries: 記憶體層最大項目數
+            directory: 磁碟層目錄，None 表示只使用記憶體層
+            clock: 取得目前 Unix 時間的函式 (測試可注入假時鐘)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.directory = directory
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+        # 統計資訊
+        self._stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'refreshes': 0,
+            'stored': 0,
+            'evicted': 0,
+            'disk_errors': 0,
+        }
+
+    @staticmethod
+    def cache_key(params: Dict[str, Any]) -> str:
+        """取得搜尋參數的快取鍵值。
+
+        參數名稱轉為小寫、字串值去除前後空白並合併連續空白，查詢字詞
+        不分大小寫；api_key 等不影響結果的參數不納入。
+
+        Args:
+            params: SerpAPI 搜尋參數
+
+        Returns:
+            str: SHA-256 十六進位鍵值
+        """
+        normalized = {}
+        for name, value in params.items():
+            name = str(name).lower()
+            if name in _IGNORED_PARAMS or value is None:
+                continue
+            if isinstance(value, str):
+                value = ' '.join(value.split())
+                if name == 'q':
+                    value = value.lower()
+            normalized[name] = value
+        payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    async def get(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """取得未過期的快取回應。
+
+        Args:
+            params: SerpAPI 搜尋參數
+
+        Returns:
+            Optional[Dict[str, Any]]: 回應資料的副本，未命中時為 None
+        """
+        key = self.cache_key(params)
+        now = self._clock()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, data = entry
+            if now - stored_at <= self.ttl:
+                self._entries.move_to_end(key)
+                self._stats['memory_hits'] += 1
+                return copy.deepcopy(data)
+            del self._entries[key]
+            self._stats['expired'] += 1
+
+        if self.directory:
+            entry = await asyncio.to_thread(self._read_file, key)
+            if entry is not None:
+                stored_at, data = entry
+                if now - stored_at <= self.ttl:
+                    self._remember(key, stored_at, data)
+                    self._stats['disk_hits'] += 1
+                    return copy.deepcopy(data)
+                self._stats['expired'] += 1
+                await asyncio.to_thread(self._remove_file, key)
+
+        self._stats['misses'] += 1
+        return None
+
+    async def put(self, params: Dict[str, Any], data: Dict[str, Any], refresh: bool = False) -> None:
+        """儲存搜尋回應至兩層快取。
+
+        Args:
+            params: SerpAPI 搜尋參數
+            data: 已通過驗證的 SerpAPI 回應
+            refresh: 是否為強制重新整理後的寫入 (僅影響統計)
+        """
+        key = self.cache_key(params)
+        stored_at = self._clock()
+        self._remember(key, stored_at, copy.deepcopy(data))
+        self._stats['stored'] += 1
+        if refresh:
+            self._stats['refreshes'] += 1
+
+        if self.directory:
+            try:
+                await asyncio.to_thread(self._write_file, key, stored_at, data)
+            except OSError as e:
+                # 磁碟層失敗不影響搜尋結果
+                self._stats['disk_errors'] += 1
+                print(f"⚠️ SERP 快取寫入失敗: {str(e)}")
+
+    def _remember(self, key: str, stored_at: float, data: Dict[str, Any]) -> None:
+        """寫入記憶體層並淘汰最久未使用的項目。"""
+        self._entries.pop(key, None)
+        self._entries[key] = (stored_at, data)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evicted'] += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read_file(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """讀取磁碟層項目，不存在或格式錯誤時為 None。"""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            return float(payload['stored_at']), payload['data']
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            self._stats['disk_errors'] += 1
+            return None
+
+    def _write_file(self, key: str, stored_at: float, data: Dict[str, Any]) -> None:
+        """以暫存檔加上 rename 寫入磁碟層項目，避免讀到寫一半的檔案。"""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'stored_at': stored_at, 'data': data}, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _remove_file(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """清除記憶體層項目（磁碟層依 TTL 自然失效）。"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得快取統計資訊。
+
+        Returns:
+            dict: 包含兩層命中數、未命中數、命中率與過期、淘汰次數的字典
+        """
+        hits = self._stats['memory_hits'] + self._stats['disk_hits']
+        lookups = hits + self._stats['misses']
+        return {
+            'ttl': self.ttl,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'persistent': bool(self.directory),
+            **self._stats,
+            'hits': hits,
+            'hit_rate': round(hits / lookups, 3) if lookups else 0.0,
+        }
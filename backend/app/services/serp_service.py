@@ -2,15 +2,21 @@
 
 此模組提供 SerpAPI 整合功能，包括關鍵字搜尋、結果解析、
 錯誤處理和重試機制。用於取得真實的搜尋引擎結果頁面資料。
+
+搜尋請求透過服務持有的長效 httpx.AsyncClient 直接以非同步方式
+送出，重用連線池中的 keep-alive 連線，不佔用預設執行緒池。
 """
 
 import asyncio
+import os
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
-from serpapi import GoogleSearch
 import httpx
 
 from ..config import get_config
+from .rate_limiter import RateLimitError, SerpRateLimiter
+from .retry_budget import RetryBudget
+from .serp_cache import SerpCache
 
 
 # 自定義例外類別
@@ -30,6 +36,20 @@ class SearchFailedException(SerpAPIException):
     """搜尋失敗時的例外。"""
 
 
+# SerpAPI 搜尋端點
+SERPAPI_SEARCH_URL = "https://serpapi.com/search"
+
+# 分頁搜尋最多取得的結果數
+MAX_DEEP_RESULTS = 100
+
+
+@dataclass
+class _Flight:
+    """進行中的上游搜尋與等待其結果的呼叫數。"""
+    task: asyncio.Task
+    waiters: int = 0
+
+
 # 資料結構定義
 @dataclass
 class OrganicResult:
@@ -91,24 +111,115 @@ class SerpService:
         self.search_engine = self.config.get_serp_search_engine()
         self.location = self.config.get_serp_location()
         self.language = self.config.get_serp_language()
+        # 每頁結果數，要求的結果數超過一頁時以 start 分頁並行取得
+        self.page_size = max(self.config.get_serp_page_size(), 1)
+
+        # 共用 HTTP 客戶端（首次搜尋時建立，應用程式關閉時釋放）
+        self.timeout = self.config.get_serp_timeout()
+        self.pool_limit = self.config.get_serp_pool_limit()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 快取與配額紀錄預設放在使用者快取目錄，不寫入原始碼目錄
+        cache_dir = self.config.get_serp_cache_dir() or os.path.join(
+            os.path.expanduser("~"), ".cache", "seo-analyzer", "serp"
+        )
+
+        # SERP 回應快取（記憶體 LRU + 本機磁碟，鍵值不含 api_key）
+        self.cache: Optional[SerpCache] = None
+        if self.config.get_serp_cache_enabled():
+            self.cache = SerpCache(
+                ttl=self.config.get_serp_cache_ttl(),
+                max_entries=self.config.get_serp_cache_max_entries(),
+                directory=cache_dir
+            )
+
+        # 進行中的搜尋（相同參數的並行呼叫共用同一個上游請求）
+        self._inflight: Dict[str, _Flight] = {}
+        self._inflight_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._coalescing_stats = {
+            'upstream': 0,
+            'coalesced': 0,
+        }
 
         # 重試設定
         self.max_retries = 3
         self.retry_delay = 1.0  # 秒
-        self.backoff_multiplier = 2.0
+        # 重試預算（SerpAPI 故障時限制重試量，退避加入 jitter）
+        self.retry_budget = RetryBudget(
+            "serpapi",
+            ratio=self.config.get_retry_budget_ratio(),
+            reserve=self.config.get_retry_budget_reserve(),
+            max_delay=self.config.get_retry_max_delay()
+        )
+        # 用戶端速率限制與月配額（同一行程內所有分析工作共用）
+        # 設定月配額時，本月用量保存在快取目錄，重新啟動後沿用
+        monthly_quota = self.config.get_serp_monthly_quota()
+        self.rate_limiter = SerpRateLimiter(
+            rate=self.config.get_serp_rate_limit(),
+            burst=self.config.get_serp_rate_burst(),
+            monthly_quota=monthly_quota,
+            max_wait=self.config.get_serp_queue_timeout(),
+            state_path=os.path.join(cache_dir, "quota.json") if monthly_quota > 0 else None
+        )
+
+    async def startup(self) -> None:
+        """建立共用的 httpx.AsyncClient 連線池。
+
+        應於應用程式啟動時呼叫，重複呼叫不會建立新的連線池。
+        """
+        self._get_client()
+
+    async def close(self) -> None:
+        """關閉共用的 httpx.AsyncClient，釋放所有連線。
+
+        應於應用程式關閉時呼叫。
+        """
+        client = self._client
+        self._client = None
+        self._client_loop = None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """取得共用的 httpx.AsyncClient，必要時延遲建立。
+
+        若客戶端尚未建立、已關閉或屬於其他事件迴圈（例如測試或
+        腳本多次呼叫 asyncio.run），則重新建立。
+
+        Returns:
+            httpx.AsyncClient: 共用的 HTTP 客戶端
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.pool_limit,
+                    max_keepalive_connections=self.pool_limit
+                ),
+            )
+            self._client_loop = loop
+        return self._client
 
     async def search_keyword(
         self,
         keyword: str,
         num_results: int = 10,
-        location: Optional[str] = None
+        location: Optional[str] = None,
+        force_refresh: bool = False
     ) -> SerpResult:
         """執行關鍵字搜尋並回傳結構化結果。
 
+        相同搜尋參數在快取有效期間內直接使用快取的回應，不呼叫 SerpAPI。
+        要求的結果數超過一頁時，以 start 位移並行取得各頁（受速率限制
+        排隊）並合併為單一結果。
+
         Args:
             keyword: 要搜尋的關鍵字
-            num_results: 要取得的結果數量 (預設 10)
+            num_results: 要取得的結果數量 (預設 10，分頁時最多 100)
             location: 搜尋地理位置 (可選，預設使用配置中的設定)
+            force_refresh: 略過快取重新搜尋，並以新結果更新快取
 
         Returns:
             SerpResult: 包含搜尋結果的結構化資料
@@ -118,23 +229,191 @@ class SerpService:
             RateLimitException: 超過 API 呼叫限制
             SearchFailedException: 搜尋執行失敗
         """
+        location = location or self.location
+        if num_results > self.page_size:
+            return await self._search_pages(keyword, num_results, location, force_refresh)
+
         search_params = self._build_search_params(
             keyword=keyword,
             num_results=num_results,
-            location=location or self.location
+            location=location
         )
-
-        # 執行帶重試的搜尋
-        search_data = await self._execute_search_with_retry(search_params)
+        search_data = await self._get_search_data(search_params, force_refresh)
 
         # 解析搜尋結果
         return self._parse_search_results(keyword, search_data)
 
+    async def _search_pages(
+        self,
+        keyword: str,
+        num_results: int,
+        location: Optional[str],
+        force_refresh: bool = False
+    ) -> SerpResult:
+        """並行取得多頁搜尋結果並合併。
+
+        各頁各自經過快取、相同搜尋合併與速率限制。第一頁失敗時拋出
+        例外；之後的頁面失敗時只保留失敗頁之前的結果，維持排名連續。
+        合併時依頁面順序保留結果，略過重複的排名與 URL。
+
+        Args:
+            keyword: 搜尋關鍵字
+            num_results: 要取得的結果數量
+            location: 搜尋地理位置
+            force_refresh: 略過快取重新搜尋
+
+        Returns:
+            SerpResult: 合併後的搜尋結果，總結果數與相關搜尋取自第一頁
+
+        Raises:
+            SerpAPIException: 第一頁搜尋失敗
+        """
+        num_results = min(num_results, MAX_DEEP_RESULTS)
+        offsets = list(range(0, num_results, self.page_size))
+        pages = await asyncio.gather(*(
+            self._get_search_data(
+                self._build_search_params(
+                    keyword=keyword,
+                    num_results=self.page_size,
+                    location=location,
+                    start=offset
+                ),
+                force_refresh
+            )
+            for offset in offsets
+        ), return_exceptions=True)
+
+        if isinstance(pages[0], BaseException):
+            raise pages[0]
+
+        merged: Optional[SerpResult] = None
+        organic_results: List[OrganicResult] = []
+        seen_positions = set()
+        seen_links = set()
+        fetched = 0
+        for offset, page in zip(offsets, pages):
+            if isinstance(page, BaseException):
+                print(f"⚠️ SERP 第 {offset // self.page_size + 1} 頁取得失敗，"
+                      f"只保留前 {len(organic_results)} 筆結果: {str(page)}")
+                break
+            fetched += 1
+            result = self._parse_search_results(keyword, page, position_offset=offset)
+            if merged is None:
+                merged = result
+            for organic in result.organic_results:
+                if organic.position in seen_positions or (organic.link and organic.link in seen_links):
+                    continue
+                seen_positions.add(organic.position)
+                if organic.link:
+                    seen_links.add(organic.link)
+                organic_results.append(organic)
+
+        merged.organic_results = organic_results[:num_results]
+        merged.search_metadata = {
+            **(merged.search_metadata or {}),
+            "pages_requested": len(offsets),
+            "pages_fetched": fetched
+        }
+        return merged
+
+    async def _get_search_data(
+        self, search_params: Dict[str, Any], force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """取得單次搜尋的回應資料，優先使用快取。
+
+        Args:
+            search_params: 搜尋參數
+            force_refresh: 略過快取重新搜尋
+
+        Returns:
+            dict: SerpAPI 回應資料
+        """
+        search_data = None
+        if self.cache is not None and not force_refresh:
+            search_data = await self.cache.get(search_params)
+
+        if search_data is None:
+            search_data = await self._search_coalesced(search_params, force_refresh)
+        return search_data
+
+    async def _search_coalesced(
+        self, search_params: Dict[str, Any], force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """執行上游搜尋，相同參數的並行呼叫共用同一個請求。
+
+        第一個呼叫建立搜尋工作，之後的呼叫等待同一個工作並取得相同
+        的結果或例外。單一呼叫端取消不影響其他等待者；所有等待者都
+        取消時才中止上游請求。
+
+        Args:
+            search_params: 搜尋參數
+            force_refresh: 是否為強制重新整理 (寫入快取時計入統計)
+
+        Returns:
+            dict: SerpAPI 回應資料
+
+        Raises:
+            SerpAPIException: 上游搜尋失敗
+        """
+        loop = asyncio.get_running_loop()
+        if self._inflight_loop is not loop:
+            # 進行中的工作綁定事件迴圈，切換迴圈時重建
+            self._inflight = {}
+            self._inflight_loop = loop
+
+        key = SerpCache.cache_key(search_params)
+        flight = self._inflight.get(key)
+        if flight is None:
+            task = loop.create_task(self._fetch_and_store(search_params, force_refresh))
+            flight = self._inflight[key] = _Flight(task)
+            task.add_done_callback(lambda done, key=key: self._finish_flight(key, done))
+            self._coalescing_stats['upstream'] += 1
+        else:
+            self._coalescing_stats['coalesced'] += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finish_flight(self, key: str, task: asyncio.Task) -> None:
+        """上游搜尋結束時移除進行中項目。"""
+        flight = self._inflight.get(key)
+        if flight is not None and flight.task is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # 所有等待者都已離開時，避免「例外未被讀取」的警告
+            task.exception()
+
+    async def _fetch_and_store(self, search_params: Dict[str, Any], force_refresh: bool) -> Dict[str, Any]:
+        """執行帶重試的搜尋並寫入快取。"""
+        search_data = await self._execute_search_with_retry(search_params)
+        if self.cache is not None:
+            await self.cache.put(search_params, search_data, refresh=force_refresh)
+        return search_data
+
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """取得並行搜尋合併的統計資訊。
+
+        Returns:
+            dict: 包含進行中的上游搜尋數、實際上游搜尋數與合併的呼叫數
+        """
+        return {
+            'in_flight': len(self._inflight),
+            **self._coalescing_stats,
+        }
+
     def _build_search_params(
         self,
         keyword: str,
         num_results: int = 10,
-        location: Optional[str] = None
+        location: Optional[str] = None,
+        start: int = 0
     ) -> Dict[str, Any]:
         """建立 SerpAPI 搜尋參數。
 
@@ -142,6 +421,7 @@ class SerpService:
             keyword: 搜尋關鍵字
             num_results: 結果數量
             location: 搜尋位置
+            start: 結果位移 (分頁時使用，0 表示第一頁)
 
         Returns:
             dict: SerpAPI 搜尋參數字典
@@ -157,6 +437,8 @@ class SerpService:
 
         if location:
             params["location"] = location
+        if start:
+            params["start"] = start
 
         return params
 
@@ -173,14 +455,13 @@ class SerpService:
             SerpAPIException: 重試耗盡後仍失敗
         """
         last_exception = None
+        self.retry_budget.record_attempt()
 
         for attempt in range(self.max_retries):
+            # 送出前依速率限制排隊；配額用盡或排隊過久時直接失敗，不重試
+            await self._acquire_rate_limit()
             try:
-                # 在非同步環境中執行同步的 SerpAPI 呼叫
-                search = GoogleSearch(search_params)
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None, search.get_dict
-                )
+                result = await self._fetch_search_data(search_params)
 
                 # 檢查 API 回應中的錯誤
                 self._validate_api_response(result)
@@ -194,9 +475,15 @@ class SerpService:
                 if not self._should_retry(e):
                     raise self._handle_api_error(e)
 
-                # 等待後重試 (指數退避)
+                # 等待後重試 (指數退避加 jitter，受重試預算限制)
                 if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (self.backoff_multiplier ** attempt)
+                    delay = self.retry_budget.retry_delay(attempt, self.retry_delay)
+                    if delay is None:
+                        print("⚠️ SerpAPI 重試預算已用盡，不再重試")
+                        break
+                    if isinstance(e, RateLimitException):
+                        # 上游仍回報超過限制時，所有排隊中的搜尋一併放慢
+                        self.rate_limiter.penalize(delay)
                     print(f"搜尋失敗，{delay:.1f} 秒後重試... (嘗試 {attempt + 1}/{self.max_retries})")
                     await asyncio.sleep(delay)
 
@@ -205,6 +492,82 @@ class SerpService:
             raise self._handle_api_error(last_exception)
         raise SearchFailedException("未知錯誤")
 
+    async def _acquire_rate_limit(self) -> None:
+        """取得一次 SerpAPI 搜尋的速率限制名額。
+
+        Raises:
+            RateLimitException: 本月配額已用盡或排隊時間超過上限
+        """
+        try:
+            waited = await self.rate_limiter.acquire()
+        except RateLimitError as e:
+            raise RateLimitException(f"API 呼叫超過限制: {str(e)}") from e
+        if waited > 0:
+            print(f"⏳ SerpAPI 速率限制，排隊 {waited:.1f} 秒")
+
+    async def _fetch_search_data(self, search_params: Dict[str, Any]) -> Dict[str, Any]:
+        """以共用連線池向 SerpAPI 發送一次搜尋請求。
+
+        SerpAPI 的錯誤回應同樣以 JSON 的 error 欄位描述，交由
+        _validate_api_response 判斷；無法解析為 JSON 時依狀態碼拋出例外。
+        呼叫端取消時請求立即中止並釋放連線。
+
+        Args:
+            search_params: 搜尋參數
+
+        Returns:
+            dict: SerpAPI 回應資料
+
+        Raises:
+            RateLimitException: HTTP 429 且回應不是 JSON
+            InvalidAPIKeyException: HTTP 401 且回應不是 JSON
+            SearchFailedException: 其他無法解析的回應
+            httpx.TransportError: 連線或逾時錯誤
+        """
+        response = await self._get_client().get(
+            SERPAPI_SEARCH_URL,
+            params={**search_params, "output": "json"}
+        )
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+
+        if isinstance(data, dict):
+            return data
+        if response.status_code == 429:
+            raise RateLimitException(f"API 呼叫超過限制: HTTP {response.status_code}")
+        if response.status_code == 401:
+            raise InvalidAPIKeyException(f"API 密鑰無效: HTTP {response.status_code}")
+        raise SearchFailedException(f"SerpAPI 回應無法解析: HTTP {response.status_code}")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """取得 SERP 快取的統計資訊。
+
+        Returns:
+            dict: 包含記憶體與磁碟命中數、未命中數與命中率的統計，
+            未啟用時僅包含 enabled=False
+        """
+        if self.cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.cache.get_stats()}
+
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """取得重試預算的統計資訊。
+
+        Returns:
+            dict: 包含首次嘗試數、重試數與預算用盡次數的統計
+        """
+        return self.retry_budget.get_stats()
+
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """取得速率限制與月配額的統計資訊。
+
+        Returns:
+            dict: 包含剩餘配額、目前排隊等待秒數與累計等待時間的統計
+        """
+        return self.rate_limiter.get_stats()
+
     def _validate_api_response(self, response: Dict[str, Any]) -> None:
         """驗證 SerpAPI 回應的有效性。
 
@@ -233,11 +596,11 @@ class SerpService:
             bool: 是否應該重試
         """
         # 網路相關錯誤可以重試
-        if isinstance(exception, (ConnectionError, TimeoutError)):
+        if isinstance(exception, (ConnectionError, TimeoutError, httpx.TransportError)):
             return True
 
-        # API 密鑰錯誤和速率限制不重試
-        if isinstance(exception, (InvalidAPIKeyException, RateLimitException)):
+        # API 密鑰錯誤不重試；速率限制退避後重試（受重試預算限制）
+        if isinstance(exception, InvalidAPIKeyException):
             return False
 
         # 其他錯誤預設可以重試
@@ -261,17 +624,20 @@ class SerpService:
             return InvalidAPIKeyException(f"API 密鑰無效: {error_message}")
         elif "rate limit" in error_message.lower():
             return RateLimitException(f"API 呼叫超過限制: {error_message}")
-        elif isinstance(exception, (ConnectionError, TimeoutError)):
-            return SearchFailedException(f"網路連線錯誤: {error_message}")
+        elif isinstance(exception, (ConnectionError, TimeoutError, httpx.TransportError)):
+            return SearchFailedException(f"網路連線錯誤: {error_message or type(exception).__name__}")
         else:
             return SearchFailedException(f"搜尋執行失敗: {error_message}")
 
-    def _parse_search_results(self, keyword: str, search_data: Dict[str, Any]) -> SerpResult:
+    def _parse_search_results(
+        self, keyword: str, search_data: Dict[str, Any], position_offset: int = 0
+    ) -> SerpResult:
         """解析 SerpAPI 搜尋結果。
 
         Args:
             keyword: 原始搜尋關鍵字
             search_data: SerpAPI 回應資料
+            position_offset: 結果缺少排名時的排名位移 (分頁的 start)
 
         Returns:
             SerpResult: 結構化的搜尋結果
@@ -282,7 +648,7 @@ class SerpService:
 
         for i, result in enumerate(raw_organic, 1):
             organic_result = OrganicResult(
-                position=result.get("position", i),
+                position=result.get("position", position_offset + i),
                 title=result.get("title", ""),
                 link=result.get("link", ""),
                 snippet=result.get("snippet", ""),
@@ -360,19 +726,19 @@ class SerpService:
             if not self.api_key:
                 raise SerpAPIException("SerpAPI key not configured")
                 
-            # 使用 SerpAPI 帳戶資訊端點測試連線
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    "https://serpapi.com/account",
-                    params={"api_key": self.api_key}
-                )
-                
-                if response.status_code == 200:
-                    return True
-                elif response.status_code == 401:
-                    raise SerpAPIException("Invalid API key")
-                else:
-                    raise SerpAPIException(f"API request failed: {response.status_code}")
+            # 使用 SerpAPI 帳戶資訊端點測試連線（共用搜尋的連線池）
+            response = await self._get_client().get(
+                "https://serpapi.com/account",
+                params={"api_key": self.api_key},
+                timeout=10.0
+            )
+            
+            if response.status_code == 200:
+                return True
+            elif response.status_code == 401:
+                raise SerpAPIException("Invalid API key")
+            else:
+                raise SerpAPIException(f"API request failed: {response.status_code}")
                     
         except httpx.TimeoutException:
             raise SerpAPIException("Connection timeout")
@@ -405,3 +771,12 @@ def get_serp_service() -> SerpService:
         _serp_service_instance = SerpService()
 
     return _serp_service_instance
+
+
+async def close_serp_service() -> None:
+    """釋放 SerpAPI 服務的共用連線池（應用程式關閉時呼叫）。
+
+    服務尚未建立時不做任何事，不會因缺少 API 密鑰而拋出例外。
+    """
+    if _serp_service_instance is not None:
+        await _serp_service_instance.close()
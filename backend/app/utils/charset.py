@@ -0,0 +1,119 @@
+"""HTML 位元組內容的編碼判定工具模組。
+
+依 HTML 規範的順序快速決定編碼，不對整份文件做統計猜測：
+1. BOM (UTF-8 / UTF-16)
+2. HTTP Content-Type 標頭的 charset
+3. 文件前 1024 位元組內的 <meta charset> 或 http-equiv 宣告
+4. 以上皆無時預設 UTF-8
+
+判定結果無法解碼時，由呼叫端依 charset_candidates() 的順序改用
+UTF-8 或 windows-1252 (可解碼任何位元組) 重試。
+"""
+
+import codecs
+import re
+from typing import List, Optional, Tuple
+
+
+# 只掃描文件開頭的位元組數（與瀏覽器的 meta 預掃描相同）
+PRESCAN_BYTES = 1024
+
+DEFAULT_CHARSET = 'utf-8'
+FALLBACK_CHARSET = 'windows-1252'
+
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+)
+
+# 同時涵蓋 <meta charset="x"> 與 <meta http-equiv content="text/html; charset=x">
+_META_CHARSET = re.compile(
+    rb'<meta[^>]*?charset\s*=\s*["\']?\s*([a-z0-9_:.\-]+)', re.IGNORECASE
+)
+
+# 瀏覽器將這些標籤視為 windows-1252
+_WINDOWS_1252_ALIASES = {'ascii', 'us-ascii', 'iso-8859-1', 'iso8859-1', 'latin1', 'latin-1'}
+
+
+def _normalize(label: Optional[str], from_meta: bool = False) -> Optional[str]:
+    """正規化編碼名稱，無法辨識時回傳 None。"""
+    if not label:
+        return None
+    label = label.strip().strip('"\'').lower()
+    if label in _WINDOWS_1252_ALIASES:
+        return FALLBACK_CHARSET
+    try:
+        codec = codecs.lookup(label)
+    except LookupError:
+        return None
+    # 以 ASCII 寫成的 meta 不可能真的是 UTF-16
+    if from_meta and codec.name.startswith('utf-16'):
+        return DEFAULT_CHARSET
+    return label
+
+
+def bom_length(body: bytes) -> int:
+    """取得內容開頭 BOM 的位元組數。
+
+    Args:
+        body: HTML 位元組內容
+
+    Returns:
+        int: BOM 長度，沒有 BOM 時為 0
+    """
+    for bom, _ in _BOMS:
+        if body.startswith(bom):
+            return len(bom)
+    return 0
+
+
+def resolve_charset(body: bytes, declared: Optional[str] = None) -> Tuple[str, str]:
+    """決定 HTML 位元組內容的編碼。
+
+    Args:
+        body: HTML 位元組內容
+        declared: HTTP 標頭宣告的 charset (可選)
+
+    Returns:
+        tuple: (編碼名稱, 判定來源 'bom' / 'header' / 'meta' / 'default')
+
+    Example:
+        >>> resolve_charset(b'<meta charset="big5"><title>...</title>')
+        ('big5', 'meta')
+    """
+    for bom, charset in _BOMS:
+        if body.startswith(bom):
+            return charset, 'bom'
+
+    charset = _normalize(declared)
+    if charset:
+        return charset, 'header'
+
+    match = _META_CHARSET.search(body, 0, PRESCAN_BYTES)
+    if match:
+        charset = _normalize(match.group(1).decode('ascii', 'ignore'), from_meta=True)
+        if charset:
+            return charset, 'meta'
+
+    return DEFAULT_CHARSET, 'default'
+
+
+def charset_candidates(body: bytes, declared: Optional[str] = None) -> List[str]:
+    """取得解碼時依序嘗試的編碼清單。
+
+    Args:
+        body: HTML 位元組內容
+        declared: HTTP 標頭宣告的 charset (可選)
+
+    Returns:
+        List[str]: 判定的編碼，之後為 UTF-8 與 windows-1252 備援
+    """
+    candidates: List[str] = []
+    seen = set()
+    for charset in (resolve_charset(body, declared)[0], DEFAULT_CHARSET, FALLBACK_CHARSET):
+        name = codecs.lookup(charset).name
+        if name not in seen:
+            seen.add(name)
+            candidates.append(charset)
+    return candidates
@@ -0,0 +1,137 @@
+"""文字統計工具模組。
+
+此模組提供支援中日文 (CJK) 的文字統計，一次計算 CJK 字元數、
+拉丁語系單字數、段落數與句數。
+
+所有逐字元的工作都交給預先編譯的正規表達式與轉換表 (translate table)
+在 C 層完成，避免 Python 逐字元迴圈：
+1. CJK 字元整段替換為標記並由長度差計算字數（純 ASCII 文字直接略過）
+2. 句尾標點轉為句尾標記，其餘標點轉為空白
+3. 以 split() 計算單字數，並依空行切分段落
+"""
+
+import re
+from dataclasses import dataclass
+
+
+# 以字元計數的 CJK 範圍（韓文以空白分詞，歸入單字計數）
+_CJK_RANGES = (
+    '\u3040-\u30ff'          # 平假名、片假名
+    '\u3100-\u312f'          # 注音符號
+    '\u31a0-\u31bf'          # 注音符號擴充
+    '\u31f0-\u31ff'          # 片假名語音擴充
+    '\u3400-\u4dbf'          # CJK 擴充 A
+    '\u4e00-\u9fff'          # CJK 統一表意文字
+    '\uf900-\ufaff'          # CJK 相容表意文字
+    '\U00020000-\U0003134f'  # CJK 擴充 B–G 與相容補充
+)
+
+# 句尾標點（半形與全形）
+_TERMINATORS = '.!?\u3002\uff01\uff1f\uff0e\uff61\u203c\u2047-\u2049\ufe12\ufe52\ufe56\ufe57'
+
+# 視為分隔符號的標點：ASCII 標點、Latin-1 標點、一般標點、
+# CJK 符號與標點、直排與小寫形式、全形與半形標點
+_ASCII_PUNCTUATION = '"#$%&()*+,-/:;<=>@[\\]^_`{|}~'
+_WIDE_PUNCTUATION = (
+    '\u00a1-\u00bf'
+    '\u2000-\u206f'
+    '\u3000-\u303f'
+    '\ufe10-\ufe1f'
+    '\ufe30-\ufe6f'
+    '\uff01-\uff0f\uff1a-\uff20\uff3b-\uff40\uff5b-\uff65'
+)
+
+# 內部標記：句尾與 CJK 字串段（HTML 文字中不會出現的控制字元）
+_SENTENCE_MARK = '\x00'
+_CJK_MARK = ' \x01 '
+
+_CJK_RUN = re.compile(f'[{_CJK_RANGES}]+')
+_TERMINATOR_RUN = re.compile(f'[{_TERMINATORS}]+')
+_PUNCTUATION_RUN = re.compile(f'[{re.escape(_ASCII_PUNCTUATION)}{_WIDE_PUNCTUATION}]+')
+_SENTENCE_END = re.compile(f'{_SENTENCE_MARK}+(?=\\s|$)')
+_BLANK_LINE = re.compile(r'\n[^\S\n]*\n')
+_APOSTROPHES = ("'", '\u2019')
+
+# 純 ASCII 文字的快速路徑：translate 以 C 迴圈一次完成所有標點轉換
+_ASCII_TABLE = str.maketrans({
+    **{char: ' ' for char in _ASCII_PUNCTUATION},
+    **{char: _SENTENCE_MARK for char in '.!?'},
+    "'": None,
+})
+
+
+@dataclass
+class TextStats:
+    """文字統計結果。
+
+    Attributes:
+        cjk_chars: CJK 字元數（漢字、假名、注音，不含標點）
+        latin_words: 以空白分隔的單字數（拉丁語系、韓文、數字等）
+        paragraph_count: 以空行分隔且含內容的段落數
+        sentence_count: 句數（句尾標點，或段落結尾未加標點的句子）
+    """
+    cjk_chars: int = 0
+    latin_words: int = 0
+    paragraph_count: int = 0
+    sentence_count: int = 0
+
+    @property
+    def word_count(self) -> int:
+        """內文字數（CJK 字元數 + 單字數）。"""
+        return self.cjk_chars + self.latin_words
+
+
+def analyze_text(text: str) -> TextStats:
+    """計算文字的 CJK 字元數、單字數、段落數與句數。
+
+    撇號（' 與 ’）視為單字的一部分；連字號與其他標點視為分隔符號，
+    因此 well-known 計為兩個單字。
+
+    Args:
+        text: 要統計的文字
+
+    Returns:
+        TextStats: 文字統計結果
+
+    Example:
+        >>> stats = analyze_text("SEO 教學。第二句 English words!")
+        >>> (stats.cjk_chars, stats.latin_words, stats.sentence_count)
+        (5, 3, 2)
+    """
+    if not text or text.isspace():
+        return TextStats()
+
+    marked = text
+    cjk_chars = cjk_runs = 0
+    if not marked.isascii():
+        # 每段 CJK 字元替換為獨立的標記 token，由長度差得出字元數
+        marked, cjk_runs = _CJK_RUN.subn(_CJK_MARK, marked)
+        cjk_chars = len(text) + cjk_runs * len(_CJK_MARK) - len(marked)
+
+    if marked.isascii():
+        marked = marked.translate(_ASCII_TABLE)
+    else:
+        for apostrophe in _APOSTROPHES:
+            marked = marked.replace(apostrophe, '')
+        marked = _TERMINATOR_RUN.sub(_SENTENCE_MARK, marked)
+        marked = _PUNCTUATION_RUN.sub(' ', marked)
+
+    sentence_count = len(_SENTENCE_END.findall(marked))
+    # 移除句尾標記後計數，3.14 之類的數字仍為單一單字
+    latin_words = len(marked.replace(_SENTENCE_MARK, '').split()) - cjk_runs
+
+    paragraph_count = 0
+    for block in _BLANK_LINE.split(marked):
+        block = block.rstrip()
+        if block:
+            paragraph_count += 1
+            # 段落結尾沒有句尾標點時，最後一段文字也算一句
+            if not block.endswith(_SENTENCE_MARK):
+                sentence_count += 1
+
+    return TextStats(
+        cjk_chars=cjk_chars,
+        latin_words=latin_words,
+        paragraph_count=paragraph_count,
+        sentence_count=sentence_count,
+    )
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""HTML 解析工作池效能基準測試
+
+以本機 HTTP 伺服器提供大型頁面，模擬多個分析同時進行爬取，
+比較 inline / thread / process 三種解析模式：
+1. 總處理時間
+2. 事件迴圈最大延遲（反映 WebSocket、狀態查詢等請求的卡頓程度）
+3. 每次解析 CPU 時間
+
+使用方式：
+    python benchmark_parser_pool.py [並行分析數] [每個分析的 URL 數]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+from aiohttp import web
+
+# 添加 backend 路徑
+backend_path = os.path.dirname(os.path.abspath(__file__))
+if backend_path not in sys.path:
+    sys.path.insert(0, backend_path)
+
+from app.config import Config
+from app.services.scraper_service import ScraperService
+
+BENCHMARK_CONFIG = """
+[server]
+port = 8000
+[api]
+timeout = 60
+[serp]
+api_key = benchmark
+[openai]
+api_key = benchmark
+[scraper]
+max_concurrent = 10
+max_retries = 1
+timeout = 30
+parser_mode = {mode}
+"""
+
+
+def build_large_page(index: int) -> str:
+    """建立約 450KB 的測試頁面。"""
+    sections = "".join(
+        f"<section><h2>章節 {i}</h2><p>{'繁體中文內容與 English words 混合的段落。' * 20}</p></section>"
+        for i in range(400)
+    )
+    return (
+        f"<html><head><title>基準測試頁面 {index}</title>"
+        f"<meta name='description' content='頁面 {index} 描述'></head>"
+        f"<body><nav>導覽</nav><h1>主標題 {index}</h1><main>{sections}</main>"
+        f"<footer>頁尾</footer></body></html>"
+    )
+
+
+async def start_server(page_count: int) -> tuple:
+    """啟動本機測試伺服器（頁面預先產生，避免干擾量測）。"""
+    pages = {i: build_large_page(i).encode('utf-8') for i in range(page_count + 1)}
+
+    async def handler(request: web.Request) -> web.Response:
+        index = int(request.match_info['index'])
+        return web.Response(body=pages[index], content_type="text/html", charset="utf-8")
+
+    app = web.Application()
+    app.router.add_get('/page/{index}', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{runner.addresses[0][1]}"
+
+
+async def measure_loop_lag(stop: asyncio.Event, samples: list) -> None:
+    """每 10ms 檢查一次事件迴圈延遲。"""
+    interval = 0.01
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(time.perf_counter() - expected, 0.0))
+
+
+async def run_mode(mode: str, base_url: str, analyses: int, urls_per_analysis: int) -> dict:
+    """以指定解析模式執行並行分析。"""
+    with tempfile.NamedTemporaryFile('w', suffix='.ini', delete=False, encoding='utf-8') as f:
+        f.write(BENCHMARK_CONFIG.format(mode=mode))
+        config_path = f.name
+
+    try:
+        with patch('app.services.scraper_service.get_config', return_value=Config(config_path)):
+            service = ScraperService()
+    finally:
+        os.unlink(config_path)
+
+    await service.startup()
+    # 預熱工作池（行程池需啟動工作者）
+    await service.scrape_single_url(f"{base_url}/page/0")
+
+    stop = asyncio.Event()
+    lag_samples: list = []
+    lag_task = asyncio.create_task(measure_loop_lag(stop, lag_samples))
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        service.scrape_urls([
+            f"{base_url}/page/{a * urls_per_analysis + u + 1}" for u in range(urls_per_analysis)
+        ])
+        for a in range(analyses)
+    ])
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await lag_task
+    parser_stats = service.get_parser_stats()
+    await service.close()
+
+    return {
+        'mode': mode,
+        'elapsed': elapsed,
+        'successful': sum(r.successful_scrapes for r in results),
+        'total': sum(r.total_results for r in results),
+        'max_loop_lag_ms': max(lag_samples, default=0.0) * 1000,
+        'avg_parse_cpu_ms': parser_stats['cpu_time_avg'] * 1000,
+        'workers': parser_stats['max_workers'],
+    }
+
+
+async def main_async(analyses: int, urls_per_analysis: int) -> None:
+    """執行所有模式的基準測試並輸出比較表。"""
+    runner, base_url = await start_server(analyses * urls_per_analysis)
+    try:
+        results = []
+        for mode in ('inline', 'thread', 'process'):
+            print(f"🧪 執行 {mode} 模式：{analyses} 個並行分析 × {urls_per_analysis} 個 URL")
+            results.append(await run_mode(mode, base_url, analyses, urls_per_analysis))
+    finally:
+        await runner.cleanup()
+
+    print()
+    print(f"{'模式':<10}{'總時間(s)':>12}{'成功/總數':>12}{'最大迴圈延遲(ms)':>20}{'平均解析CPU(ms)':>20}{'工作者':>8}")
+    print("-" * 82)
+    for r in results:
+        print(f"{r['mode']:<10}{r['elapsed']:>12.2f}{r['successful']:>7}/{r['total']:<4}"
+              f"{r['max_loop_lag_ms']:>20.1f}{r['avg_parse_cpu_ms']:>20.1f}{r['workers']:>8}")
+
+
+def main():
+    """主函數"""
+    analyses = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    urls_per_analysis = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    asyncio.run(main_async(analyses, urls_per_analysis))
+
+
+if __name__ == "__main__":
+    main()
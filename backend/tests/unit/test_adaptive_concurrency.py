@@ -0,0 +1,162 @@
+"""自適應並行限制器單元測試。
+
+測試 AIMD 上限調整、名額等待與取消，以及上限的執行期查詢。
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+
+async def fill(limiter, count):
+    """佔用 count 個名額。"""
+    for _ in range(count):
+        await limiter.acquire()
+
+
+class TestAIMD:
+    """AIMD 上限調整測試類別。"""
+
+    @pytest.mark.asyncio
+    async def test_additive_increase_when_saturated_and_healthy(self):
+        """測試上限用滿且請求健康時每個視窗加一。"""
+        limiter = AdaptiveConcurrencyLimiter(initial=5, max_limit=10)
+        await fill(limiter, 5)
+
+        for _ in range(5):
+            limiter.record(True, 0.5)
+
+        stats = limiter.get_stats()
+        assert limiter.limit == 6
+        assert stats['increases'] == 1
+        assert stats['baseline_latency'] == 0.5
+
+    def test_no_increase_without_load(self):
+        """測試上限未用滿時不增加。"""
+        limiter = AdaptiveConcurrencyLimiter(initial=5)
+
+        for _ in range(20):
+            limiter.record(True, 0.5)
+
+        assert limiter.limit == 5
+        assert limiter.get_stats()['increases'] == 0
+
+    @pytest.mark.asyncio
+    async def test_increase_capped_at_max_limit(self):
+        """測試上限不超過 max_limit。"""
+        limiter = AdaptiveConcurrencyLimiter(initial=5, max_limit=6)
+        await fill(limiter, 5)
+
+        for _ in range(30):
+            limiter.record(True, 0.5)
+
+        assert limiter.limit == 6
+
+    def test_multiplicative_decrease_on_errors(self):
+        """測試逾時與連線錯誤比例超過門檻時上限減半，且不低於下限。"""
+        limiter = AdaptiveConcurrencyLimiter(initial=16, min_limit=3, min_window=4)
+
+        for _ in range(3):
+            for _ in range(limiter.limit):
+                limiter.record(False)
+
+        stats = limiter.get_stats()
+        assert limiter.limit == 3
+        assert stats['decreases'] == 3
+        assert stats['last_error_rate'] == 1.0
+
+    def test_decrease_on_latency_spike(self):
+        """測試平均延遲超過基準延遲倍數時上限減半。"""
+        limiter = AdaptiveConcurrencyLimiter(initial=8, latency_tolerance=2.0)
+        for _ in range(8):
+            limiter.record(True, 0.5)
+
+        for _ in range(8):
+            limiter.record(True, 1.5)
+
+        assert limiter.limit == 4
+
+    def test_isolated_error_does_not_cut(self):
+        """測試錯誤比例未超過門檻時不降低上限。"""
+        limiter = AdaptiveConcurrencyLimiter(initial=10, error_threshold=0.2)
+
+        limiter.record(False)
+        for _ in range(9):
+            limiter.record(True, 0.5)
+
+        assert limiter.limit == 10
+        assert limiter.get_stats()['decreases'] == 0
+
+
+class TestAcquire:
+    """名額取得與釋放測試類別。"""
+
+    @pytest.mark.asyncio
+    async def test_waits_at_limit_and_wakes_on_release(self):
+        """測試達到上限時等待，釋放名額後放行。"""
+        limiter = AdaptiveConcurrencyLimiter(initial=2)
+        await fill(limiter, 2)
+
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        assert limiter.get_stats()['waiting'] == 1
+
+        limiter.release()
+        await asyncio.wait_for(waiter, 1)
+        assert limiter.in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_limit_increase_wakes_waiters(self):
+        """測試上限提高時立即放行等待中的請求。"""
+        limiter = AdaptiveConcurrencyLimiter(initial=5, max_limit=10)
+        await fill(limiter, 5)
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        for _ in range(5):
+            limiter.record(True, 0.5)
+
+        await asyncio.wait_for(waiter, 1)
+        assert limiter.in_flight == 6
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak(self):
+        """測試取消等待中的請求不佔用名額。"""
+        limiter = AdaptiveConcurrencyLimiter(initial=1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        limiter.release()
+
+        await asyncio.wait_for(limiter.acquire(), 1)
+        assert limiter.in_flight == 1
+        assert limiter.get_stats()['waiting'] == 0
+
+    @pytest.mark.asyncio
+    async def test_locked_reflects_free_slots(self):
+        """測試 locked() 在名額用盡時為 True，與 asyncio.Semaphore 相容。"""
+        limiter = AdaptiveConcurrencyLimiter(initial=1)
+        assert not limiter.locked()
+
+        await limiter.acquire()
+        assert limiter.locked()
+
+        limiter.release()
+        assert not limiter.locked()
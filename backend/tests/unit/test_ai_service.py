@@ -53,6 +53,9 @@ class TestAIService:
         config_mock.get_openai_model.return_value = "gpt-4o"
         config_mock.get_openai_max_tokens.return_value = 8000
         config_mock.get_openai_temperature.return_value = 0.7
+        config_mock.get_retry_budget_ratio.return_value = 0.2
+        config_mock.get_retry_budget_reserve.return_value = 10.0
+        config_mock.get_retry_max_delay.return_value = 30.0
         return config_mock
 
     @pytest.fixture
@@ -0,0 +1,73 @@
+"""HTML 編碼判定工具單元測試。
+
+測試 BOM、HTTP 標頭、meta 預掃描的優先順序與備援編碼。
+"""
+
+import codecs
+import sys
+from pathlib import Path
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.utils.charset import (
+    PRESCAN_BYTES,
+    bom_length,
+    charset_candidates,
+    resolve_charset,
+)
+
+
+class TestResolveCharset:
+    """編碼判定測試類別。"""
+
+    def test_bom_wins_over_header_and_meta(self):
+        """測試 BOM 優先於標頭與 meta 宣告。"""
+        body = codecs.BOM_UTF8 + b'<meta charset="big5"><title>t</title>'
+
+        assert resolve_charset(body, "iso-8859-1") == ('utf-8', 'bom')
+        assert bom_length(body) == 3
+
+    def test_header_wins_over_meta(self):
+        """測試 HTTP 標頭的 charset 優先於 meta 宣告。"""
+        body = b'<meta charset="big5"><title>t</title>'
+
+        assert resolve_charset(body, "Shift_JIS") == ('shift_jis', 'header')
+
+    def test_meta_charset_and_http_equiv(self):
+        """測試 <meta charset> 與 http-equiv 兩種宣告。"""
+        html5 = b'<html><head><meta charset="Big5"></head>'
+        legacy = b'<meta http-equiv="Content-Type" content="text/html; charset=gb2312">'
+
+        assert resolve_charset(html5) == ('big5', 'meta')
+        assert resolve_charset(legacy) == ('gb2312', 'meta')
+
+    def test_meta_beyond_prescan_ignored(self):
+        """測試超過預掃描範圍的 meta 宣告不會被讀取。"""
+        body = b'<!--' + b'x' * PRESCAN_BYTES + b'--><meta charset="big5">'
+
+        assert resolve_charset(body) == ('utf-8', 'default')
+
+    def test_invalid_labels_fall_through(self):
+        """測試無法辨識的編碼名稱改用下一個來源。"""
+        body = b'<meta charset="big5">'
+
+        assert resolve_charset(body, "no-such-charset") == ('big5', 'meta')
+        assert resolve_charset(b'<meta charset="bogus">') == ('utf-8', 'default')
+
+    def test_browser_aliases(self):
+        """測試 latin1 視為 windows-1252，meta 宣告的 UTF-16 視為 UTF-8。"""
+        assert resolve_charset(b'', "ISO-8859-1") == ('windows-1252', 'header')
+        assert resolve_charset(b'<meta charset="utf-16">') == ('utf-8', 'meta')
+
+    def test_candidates_deduplicated(self):
+        """測試備援編碼清單不重複。"""
+        assert charset_candidates(b'') == ['utf-8', 'windows-1252']
+        assert charset_candidates(b'<meta charset="big5">') == ['big5', 'utf-8', 'windows-1252']
+        assert charset_candidates(b'', 'UTF8') == ['utf8', 'windows-1252']
@@ -0,0 +1,119 @@
+"""網域斷路器單元測試。
+
+測試依失敗率開啟、冷卻後半開探測、探測結果與狀態統計。
+"""
+
+import sys
+from pathlib import Path
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    """可手動推進的假時鐘。"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """網域斷路器測試類別。"""
+
+    URL = "https://down.example.com/page"
+
+    def test_opens_after_failure_rate_exceeded(self):
+        """測試失敗數與失敗率皆達門檻時開啟。"""
+        breaker = CircuitBreaker(failure_threshold=0.5, min_failures=3, clock=FakeClock())
+        breaker.record(self.URL, success=True)
+        breaker.record(self.URL, success=False)
+        breaker.record(self.URL, success=False)
+        assert breaker.allow(self.URL) is True
+
+        breaker.record(self.URL, success=False)
+
+        assert breaker.is_open(self.URL) is True
+        assert breaker.allow(self.URL) is False
+        assert breaker.allow("https://ok.example.com/") is True
+
+    def test_stays_closed_when_failure_rate_low(self):
+        """測試失敗數達門檻但失敗率偏低時維持關閉。"""
+        breaker = CircuitBreaker(failure_threshold=0.5, min_failures=3, window=20)
+        for _ in range(10):
+            breaker.record(self.URL, success=True)
+        for _ in range(3):
+            breaker.record(self.URL, success=False)
+
+        assert breaker.is_open(self.URL) is False
+
+    def test_half_open_probe_success_closes(self):
+        """測試冷卻後只放行一個探測請求，成功即關閉。"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_failures=1, cooldown=30, clock=clock)
+        breaker.record(self.URL, success=False)
+
+        clock.now += 10
+        assert breaker.allow(self.URL) is False
+        assert breaker.retry_after(self.URL) == 20
+
+        clock.now += 20
+        assert breaker.allow(self.URL) is True
+        assert breaker.allow(self.URL) is False
+        assert breaker.get_stats()['domains']['down.example.com']['state'] == HALF_OPEN
+
+        breaker.record(self.URL, success=True)
+
+        assert breaker.allow(self.URL) is True
+        assert breaker.get_stats()['domains']['down.example.com']['state'] == CLOSED
+
+    def test_half_open_probe_failure_reopens(self):
+        """測試探測請求失敗時重新開啟並重新計算冷卻時間。"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_failures=1, cooldown=30, clock=clock)
+        breaker.record(self.URL, success=False)
+        clock.now += 30
+        assert breaker.allow(self.URL) is True
+
+        breaker.record(self.URL, success=False)
+
+        stats = breaker.get_stats()
+        assert stats['domains']['down.example.com']['state'] == OPEN
+        assert stats['domains']['down.example.com']['opens'] == 2
+        assert breaker.retry_after(self.URL) == 30
+
+    def test_lost_probe_released_after_cooldown(self):
+        """測試探測請求沒有回報結果（例如被取消）時，冷卻後放行下一個。"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_failures=1, cooldown=30, clock=clock)
+        breaker.record(self.URL, success=False)
+        clock.now += 30
+        assert breaker.allow(self.URL) is True
+
+        clock.now += 30
+
+        assert breaker.allow(self.URL) is True
+
+    def test_stats_list_only_troubled_domains(self):
+        """測試統計只列出有失敗紀錄或曾開啟的網域。"""
+        breaker = CircuitBreaker(min_failures=2)
+        breaker.record("https://ok.example.com/", success=True)
+        breaker.record(self.URL, success=False)
+        breaker.record(self.URL, success=False)
+        breaker.allow(self.URL)
+
+        stats = breaker.get_stats()
+        assert list(stats['domains']) == ['down.example.com']
+        assert stats['open'] == 1
+        assert stats['domains']['down.example.com']['rejected'] == 1
+        assert stats['domains']['down.example.com']['failure_rate'] == 1.0
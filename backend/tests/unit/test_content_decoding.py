@@ -0,0 +1,90 @@
+"""內容編碼解碼單元測試。
+
+測試 gzip / deflate 逐段解碼、多層編碼、位元組統計與
+Accept-Encoding 協商。
+"""
+
+import gzip
+import sys
+import zlib
+from pathlib import Path
+
+import pytest
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services import content_decoding
+from app.services.content_decoding import (
+    ContentDecoder,
+    ContentDecodingError,
+    accept_encoding_header,
+)
+
+
+BODY = ("<html><body>" + "<p>內容段落 content</p>" * 500 + "</body></html>").encode('utf-8')
+
+
+def decode_in_chunks(decoder, data, size=1000):
+    """以固定大小分段送入解碼器。"""
+    parts = [decoder.decompress(data[i:i + size]) for i in range(0, len(data), size)]
+    parts.append(decoder.flush())
+    return b''.join(parts)
+
+
+class TestContentDecoding:
+    """內容編碼解碼測試類別。"""
+
+    @pytest.mark.parametrize("encoding,payload", [
+        ("gzip", gzip.compress(BODY)),
+        ("deflate", zlib.compress(BODY)),
+    ])
+    def test_chunked_decoding(self, encoding, payload):
+        """測試逐段解碼並統計傳輸與解碼後位元組數。"""
+        decoder = ContentDecoder(encoding)
+
+        assert decode_in_chunks(decoder, payload) == BODY
+        assert decoder.wire_bytes == len(payload)
+        assert decoder.decoded_bytes == len(BODY)
+        assert not decoder.is_identity
+
+    def test_raw_deflate_fallback(self):
+        """測試不含 zlib 標頭的 raw deflate。"""
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        payload = compressor.compress(BODY) + compressor.flush()
+
+        assert decode_in_chunks(ContentDecoder("deflate"), payload) == BODY
+
+    def test_identity_and_multiple_codings(self):
+        """測試未壓縮內容與多層編碼 (依相反順序解碼)。"""
+        identity = ContentDecoder(None)
+        assert identity.is_identity
+        assert identity.decompress(BODY) == BODY
+
+        payload = gzip.compress(zlib.compress(BODY))
+        assert decode_in_chunks(ContentDecoder("deflate, gzip"), payload) == BODY
+
+    def test_unsupported_and_corrupt_content(self, monkeypatch):
+        """測試不支援的編碼與損毀內容拋出 ContentDecodingError。"""
+        monkeypatch.setattr(content_decoding, 'HAS_BROTLI', False)
+
+        with pytest.raises(ContentDecodingError):
+            ContentDecoder("br")
+        with pytest.raises(ContentDecodingError):
+            ContentDecoder("gzip").decompress(b"not gzip data")
+
+    def test_accept_encoding_follows_available_libraries(self, monkeypatch):
+        """測試 Accept-Encoding 只宣告可解碼的編碼。"""
+        monkeypatch.setattr(content_decoding, 'HAS_BROTLI', False)
+        monkeypatch.setattr(content_decoding, 'HAS_ZSTD', False)
+        assert accept_encoding_header() == "gzip, deflate"
+
+        monkeypatch.setattr(content_decoding, 'HAS_BROTLI', True)
+        monkeypatch.setattr(content_decoding, 'HAS_ZSTD', True)
+        assert accept_encoding_header() == "zstd, br, gzip, deflate"
@@ -0,0 +1,122 @@
+"""DNS 快取解析器單元測試。
+
+測試 TTL 快取、負向快取、並行查詢合併與統計資訊。
+"""
+
+import asyncio
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services import dns_resolver
+from app.services.dns_resolver import CachingResolver
+
+
+class FakeResolver:
+    """模擬底層解析器，記錄實際查詢次數。"""
+
+    calls = []
+    delay = 0.02
+
+    async def resolve(self, host, port=0, family=socket.AF_INET):
+        FakeResolver.calls.append(host)
+        await asyncio.sleep(FakeResolver.delay)
+        if host.endswith('.invalid'):
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return [{
+            'hostname': host, 'host': '192.0.2.1', 'port': port,
+            'family': family, 'proto': 0, 'flags': 0,
+        }]
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_resolver(monkeypatch):
+    """以 FakeResolver 取代底層解析器。"""
+    FakeResolver.calls = []
+    monkeypatch.setattr(dns_resolver, 'DefaultResolver', FakeResolver)
+    return FakeResolver
+
+
+class TestCachingResolver:
+    """DNS 快取解析器測試類別。"""
+
+    @pytest.mark.asyncio
+    async def test_results_are_cached(self, fake_resolver):
+        """測試 TTL 內重複查詢直接使用快取。"""
+        resolver = CachingResolver(ttl=60)
+
+        first = await resolver.resolve("Example.com", 443)
+        second = await resolver.resolve("example.com", 443)
+
+        assert first == second
+        assert fake_resolver.calls == ["Example.com"]
+        stats = resolver.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+        assert stats['avg_latency'] > 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_are_coalesced(self, fake_resolver):
+        """測試同一主機的並行查詢只送出一次。"""
+        resolver = CachingResolver()
+
+        results = await asyncio.gather(*(resolver.resolve("example.com", 80) for _ in range(5)))
+
+        assert len(fake_resolver.calls) == 1
+        assert all(result == results[0] for result in results)
+        assert resolver.get_stats()['coalesced'] == 4
+
+    @pytest.mark.asyncio
+    async def test_negative_caching(self, fake_resolver):
+        """測試解析失敗在負向 TTL 內不重新查詢。"""
+        resolver = CachingResolver(negative_ttl=60)
+
+        for _ in range(2):
+            with pytest.raises(OSError):
+                await resolver.resolve("missing.invalid", 80)
+
+        assert fake_resolver.calls == ["missing.invalid"]
+        stats = resolver.get_stats()
+        assert stats['failures'] == 1
+        assert stats['negative_hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refreshed(self, fake_resolver):
+        """測試超過 TTL 後重新查詢。"""
+        now = [1000.0]
+        resolver = CachingResolver(ttl=10, clock=lambda: now[0])
+
+        await resolver.resolve("example.com", 80)
+        now[0] += 11
+        await resolver.resolve("example.com", 80)
+
+        assert len(fake_resolver.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_lookup(self, fake_resolver):
+        """測試單一呼叫端取消時，合併中的其他查詢仍取得結果。"""
+        resolver = CachingResolver()
+
+        first = asyncio.ensure_future(resolver.resolve("example.com", 80))
+        second = asyncio.ensure_future(resolver.resolve("example.com", 80))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        result = await second
+        assert result[0]['host'] == '192.0.2.1'
+        assert len(fake_resolver.calls) == 1
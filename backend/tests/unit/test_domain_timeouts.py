@@ -0,0 +1,125 @@
+"""網域自適應逾時單元測試。
+
+測試依延遲直方圖推算逾時、上下限、逾時樣本與延遲歷史保存。
+"""
+
+import sys
+from pathlib import Path
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.domain_timeouts import DomainTimeoutTracker
+
+
+class TestDomainTimeoutTracker:
+    """網域逾時追蹤器測試類別。"""
+
+    def test_default_until_enough_samples(self):
+        """測試樣本不足的網域使用預設逾時。"""
+        tracker = DomainTimeoutTracker(default=10.0, min_samples=3)
+        tracker.record("https://example.com/a", 0.1)
+        tracker.record("https://example.com/b", 0.1)
+
+        assert tracker.timeout_for("https://example.com/c") == 10.0
+        assert tracker.timeout_for("https://other.com/") == 10.0
+
+    def test_fast_domain_clamped_to_floor(self):
+        """測試快速網域的逾時收緊至下限。"""
+        tracker = DomainTimeoutTracker(default=10.0, floor=2.0, cap=30.0, min_samples=3)
+        for _ in range(5):
+            tracker.record("https://fast.com/", 0.2)
+
+        assert tracker.timeout_for("https://FAST.com/page") == 2.0
+
+    def test_slow_domain_gets_generous_timeout(self):
+        """測試已知較慢的網域放寬逾時，且不超過上限。"""
+        tracker = DomainTimeoutTracker(default=10.0, floor=2.0, cap=30.0, min_samples=3)
+        for _ in range(5):
+            tracker.record("https://slow.com/", 8.0)
+            tracker.record("https://very-slow.com/", 25.0)
+
+        assert 16.0 <= tracker.timeout_for("https://slow.com/") <= 20.0
+        assert tracker.timeout_for("https://very-slow.com/") == 30.0
+
+    def test_hanging_domain_never_widens(self):
+        """測試持續逾時的網域不會放寬逾時，而是收緊至下限。"""
+        tracker = DomainTimeoutTracker(default=10.0, floor=2.0, cap=30.0)
+        timeouts = []
+        for _ in range(10):
+            timeout = tracker.timeout_for("https://hang.com/")
+            timeouts.append(timeout)
+            tracker.record("https://hang.com/", timeout, timed_out=True)
+
+        assert max(timeouts) == 10.0
+        assert timeouts[-1] == 2.0
+        stats = tracker.get_stats()['domains']['hang.com']
+        assert stats['timeouts'] == 10
+        assert stats['samples'] == 0
+
+    def test_fast_domain_timeouts_do_not_inflate(self):
+        """測試平常快速的網域發生逾時後，逾時不會放寬。"""
+        tracker = DomainTimeoutTracker(default=10.0, floor=2.0, cap=30.0)
+        for _ in range(20):
+            tracker.record("https://fast.com/", 0.3)
+
+        timeouts = []
+        for _ in range(3):
+            timeout = tracker.timeout_for("https://fast.com/")
+            timeouts.append(timeout)
+            tracker.record("https://fast.com/", timeout, timed_out=True)
+
+        assert timeouts == [2.0, 2.0, 2.0]
+        assert tracker.timeout_for("https://fast.com/") == 2.0
+
+    def test_slow_domain_recovers_after_timeouts(self):
+        """測試逾時比例隨成功請求下降後，恢復依成功延遲推算的逾時。"""
+        tracker = DomainTimeoutTracker(default=10.0, floor=2.0, cap=30.0)
+        for _ in range(5):
+            tracker.record("https://slow.com/", 8.0)
+        for _ in range(3):
+            tracker.record("https://slow.com/", 20.0, timed_out=True)
+        assert tracker.timeout_for("https://slow.com/") <= 10.0
+
+        for _ in range(5):
+            tracker.record("https://slow.com/", 8.0)
+        assert 16.0 <= tracker.timeout_for("https://slow.com/") <= 20.0
+
+    def test_decay_keeps_recent_latency(self):
+        """測試樣本超過上限時減半，近期延遲逐步主導。"""
+        tracker = DomainTimeoutTracker(floor=0.1, cap=60.0, percentile=50, min_samples=1, max_samples=20)
+        for _ in range(20):
+            tracker.record("https://example.com/", 10.0)
+        for _ in range(40):
+            tracker.record("https://example.com/", 0.5)
+
+        assert tracker.timeout_for("https://example.com/") < 2.0
+        assert tracker.get_stats()['domains']['example.com']['samples'] <= 20
+
+    def test_history_persisted(self, tmp_path):
+        """測試延遲歷史寫入檔案後可由新實例載入。"""
+        path = tmp_path / "history" / "latency.json"
+        tracker = DomainTimeoutTracker(floor=1.0, cap=30.0, min_samples=3, history_path=str(path))
+        for _ in range(5):
+            tracker.record("https://example.com/", 4.0)
+        tracker.save()
+
+        restored = DomainTimeoutTracker(floor=1.0, cap=30.0, min_samples=3, history_path=str(path))
+
+        assert restored.timeout_for("https://example.com/") == tracker.timeout_for("https://example.com/")
+        assert not list(path.parent.glob("*.tmp"))
+
+    def test_corrupt_history_ignored(self, tmp_path):
+        """測試延遲歷史檔損毀時以空白歷史啟動。"""
+        path = tmp_path / "latency.json"
+        path.write_text("{not json", encoding='utf-8')
+
+        tracker = DomainTimeoutTracker(default=7.0, history_path=str(path))
+
+        assert tracker.timeout_for("https://example.com/") == 7.0
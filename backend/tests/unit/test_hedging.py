@@ -0,0 +1,63 @@
+"""對沖請求策略單元測試。
+
+測試延遲百分位數觸發條件、最少樣本數與對沖預算。
+"""
+
+import sys
+from pathlib import Path
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.hedging import HedgePolicy
+
+
+class TestHedgePolicy:
+    """對沖策略測試類別。"""
+
+    def test_no_hedge_before_min_samples(self):
+        """測試樣本數不足時不觸發對沖。"""
+        policy = HedgePolicy(min_samples=5)
+        for _ in range(4):
+            policy.record(0.1)
+
+        assert policy.hedge_delay() is None
+        assert policy.get_stats()['trigger_delay'] is None
+
+    def test_delay_follows_percentile(self):
+        """測試觸發延遲為近期延遲的指定百分位數。"""
+        policy = HedgePolicy(percentile=90, min_samples=10)
+        for i in range(1, 11):
+            policy.record(i / 10)
+
+        assert policy.hedge_delay() == 0.9
+
+    def test_window_drops_old_samples(self):
+        """測試只保留最近 window 筆延遲樣本。"""
+        policy = HedgePolicy(percentile=100, min_samples=1, window=3)
+        for latency in (5.0, 0.1, 0.2, 0.3):
+            policy.record(latency)
+
+        assert policy.hedge_delay() == 0.3
+
+    def test_budget_limits_hedges(self):
+        """測試對沖數不超過主要請求數的預算比例。"""
+        policy = HedgePolicy(budget=0.1, min_samples=1)
+        policy.record(0.1)
+
+        granted = 0
+        for _ in range(30):
+            policy.hedge_delay()
+            granted += policy.try_acquire()
+
+        stats = policy.get_stats()
+        assert granted == 3
+        assert stats['hedged'] == 3
+        assert stats['denied'] == 27
+        assert stats['hedge_ratio'] == 0.1
@@ -0,0 +1,158 @@
+"""主機禮貌性排程單元測試。
+
+測試同主機並行上限、請求間隔與不同主機互不影響的排程行為。
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.host_scheduler import HostScheduler
+
+
+async def run_requests(scheduler, urls, hold=0.02):
+    """透過排程器執行模擬請求，記錄各主機的最大並行數與開始時間。"""
+    loop = asyncio.get_running_loop()
+    active = {}
+    peak = {}
+    starts = {}
+
+    async def request(url):
+        host = HostScheduler.host_key(url)
+        async with scheduler.slot(url):
+            starts.setdefault(host, []).append(loop.time())
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+            await asyncio.sleep(hold)
+            active[host] -= 1
+
+    await asyncio.gather(*(request(url) for url in urls))
+    return peak, starts
+
+
+class TestHostScheduler:
+    """主機排程器測試類別。"""
+
+    @pytest.mark.asyncio
+    async def test_per_host_concurrency_limit(self):
+        """測試同一主機的並行請求數不超過上限。"""
+        scheduler = HostScheduler(per_host_limit=2, min_delay=0.0)
+        urls = [f"https://same.example.com/page/{i}" for i in range(6)]
+
+        peak, _ = await run_requests(scheduler, urls)
+
+        assert peak["same.example.com"] == 2
+        assert scheduler.get_stats()['requests'] == 6
+
+    @pytest.mark.asyncio
+    async def test_min_delay_between_same_host_requests(self):
+        """測試同一主機的請求開始時間至少間隔 min_delay。"""
+        scheduler = HostScheduler(per_host_limit=0, min_delay=0.05)
+        urls = [f"https://slow.example.com/{i}" for i in range(4)]
+
+        _, starts = await run_requests(scheduler, urls, hold=0.0)
+
+        times = sorted(starts["slow.example.com"])
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+        stats = scheduler.get_stats()
+        assert stats['delayed_requests'] == 3
+        assert stats['total_delay'] >= 0.29
+
+    @pytest.mark.asyncio
+    async def test_different_hosts_are_independent(self):
+        """測試不同主機之間不互相等待。"""
+        scheduler = HostScheduler(per_host_limit=1, min_delay=0.5)
+        urls = [f"https://host{i}.example.com/" for i in range(5)]
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        peak, _ = await run_requests(scheduler, urls, hold=0.0)
+
+        assert loop.time() - started < 0.3
+        assert all(count == 1 for count in peak.values())
+        assert scheduler.get_stats()['delayed_requests'] == 0
+
+    def test_host_key_normalization(self):
+        """測試主機鍵值忽略大小寫並保留連接埠。"""
+        assert HostScheduler.host_key("https://Example.COM/a") == "example.com"
+        assert HostScheduler.host_key("http://example.com:8080/b") == "example.com:8080"
+        assert HostScheduler.host_key("not a url") == ""
+
+    @pytest.mark.asyncio
+    async def test_min_delay_enforced_behind_global_gate(self):
+        """測試在全域 Semaphore 前等待的同主機請求仍保持最小間隔。"""
+        scheduler = HostScheduler(per_host_limit=0, min_delay=0.1)
+        gate = asyncio.Semaphore(1)
+        loop = asyncio.get_running_loop()
+        starts = []
+
+        async def request(url, hold):
+            async with scheduler.slot(url, gate=gate):
+                if url.startswith("https://a."):
+                    starts.append(loop.time())
+                await asyncio.sleep(hold)
+
+        # b 佔用全域名額期間，兩個 a 的請求都在 gate 前等待
+        await asyncio.gather(
+            request("https://b.example.com/", 0.3),
+            request("https://a.example.com/1", 0.0),
+            request("https://a.example.com/2", 0.0),
+        )
+
+        assert len(starts) == 2
+        assert starts[1] - starts[0] >= 0.095
+
+    @pytest.mark.asyncio
+    async def test_same_host_delay_does_not_hold_global_gate(self):
+        """測試等待同主機間隔的請求不佔用全域名額，其他主機的請求不受阻擋。"""
+        scheduler = HostScheduler(per_host_limit=0, min_delay=0.5)
+        gate = asyncio.Semaphore(1)
+        loop = asyncio.get_running_loop()
+        starts = {}
+
+        async def request(url):
+            async with scheduler.slot(url, gate=gate):
+                starts[url] = loop.time()
+
+        began = loop.time()
+        await asyncio.gather(
+            request("https://a.example.com/1"),
+            request("https://a.example.com/2"),
+            request("https://b.example.com/1"),
+        )
+
+        assert starts["https://b.example.com/1"] - began < 0.1
+        assert starts["https://a.example.com/2"] - starts["https://a.example.com/1"] >= 0.495
+        assert not gate.locked()
+
+    @pytest.mark.asyncio
+    async def test_try_acquire_never_waits(self):
+        """測試主機名額已滿、gate 已滿或間隔未到時 try_acquire 立即放棄。"""
+        scheduler = HostScheduler(per_host_limit=1, min_delay=0.0)
+        gate = asyncio.Semaphore(1)
+
+        async with scheduler.slot("https://a.example.com/1"):
+            assert await scheduler.try_acquire("https://a.example.com/2") is False
+        assert await scheduler.try_acquire("https://a.example.com/2", gate=gate) is True
+        assert await scheduler.try_acquire("https://b.example.com/", gate=gate) is False
+        scheduler.release("https://a.example.com/2", gate=gate)
+        assert not gate.locked()
+
+        spaced = HostScheduler(per_host_limit=0, min_delay=1.0)
+        assert await spaced.try_acquire("https://c.example.com/") is True
+        spaced.release("https://c.example.com/")
+        assert await spaced.try_acquire("https://c.example.com/") is False
+        assert spaced.get_stats()['skipped_requests'] == 1
+        assert scheduler.get_stats()['skipped_requests'] == 2
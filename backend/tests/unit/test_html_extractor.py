@@ -0,0 +1,121 @@
+"""HTML SEO 元素擷取單元測試。
+
+以 tests/fixtures/html 下的頁面語料與隨機組合的片段，驗證 lxml
+單次走訪引擎與 BeautifulSoup 引擎產生完全相同的擷取結果。
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.html_extractor import extract_seo_elements, extract_with_cpu_time
+
+
+FIXTURE_DIR = test_dir.parent / "fixtures" / "html"
+FIXTURE_FILES = sorted(FIXTURE_DIR.glob("*.html"))
+
+# 隨機語料使用的 HTML 片段，涵蓋容易造成結果差異的情況
+FRAGMENTS = [
+    '<p>', '</p>', '<main>', '</main>', '<article>', '</article>',
+    '<div class="content">', '<div class="x content">', '<div class="contents">', '</div>',
+    '<h1>', '</h1>', '<h2>', '</h2>', '<title>', '</title>',
+    '<nav>', '</nav>', '<header>', '</header>', '<aside>', '</aside>', '<footer>', '</footer>',
+    '<script>var s = "<p>x</p>";</script>', '<style>p{}</style>', '<template>模板<p>t</p></template>',
+    '<ruby>漢<rt>han</rt><rp>(</rp></ruby>', '<pre>  \n\n  </pre>', '<textarea> \n </textarea>',
+    '<!-- 註解 -->', '<?pi data?>', '<br>', '\n\n', '\n', '  ', '\t', '&nbsp;', '&amp;',
+    '中文內容', 'hello world', 'word', '<span>', '</span>', '<b>', '</b>',
+    '<meta name="description" content="  描述  ">', '<meta property="og:description" content="og">',
+    '<meta name="description" content="">', '<body>', '</body>', '<li>項目', '<ul>', '</ul>',
+    '<h2> </h2>', '<h1><h2>巢狀</h2></h1>', '<table><tr><td>格</td></tr></table>',
+]
+
+
+def _fixture_text(path: Path) -> str:
+    """以頁面宣告的編碼讀取語料為字串。"""
+    raw = path.read_bytes()
+    encoding = 'big5' if 'big5' in path.name else 'utf-8'
+    return raw.decode(encoding)
+
+
+class TestHTMLExtractor:
+    """HTML 擷取引擎一致性測試類別。"""
+
+    @pytest.mark.parametrize("path", FIXTURE_FILES, ids=lambda p: p.stem)
+    def test_engines_match_on_fixture_bytes(self, path):
+        """測試位元組輸入（含編碼偵測）時兩種引擎結果相同。"""
+        raw = path.read_bytes()
+
+        assert extract_seo_elements(raw, engine="lxml") == extract_seo_elements(raw, engine="bs4")
+
+    @pytest.mark.parametrize("path", FIXTURE_FILES, ids=lambda p: p.stem)
+    def test_engines_match_on_fixture_text(self, path):
+        """測試字串輸入時兩種引擎結果相同。"""
+        html = _fixture_text(path)
+
+        assert extract_seo_elements(html, engine="lxml") == extract_seo_elements(html, engine="bs4")
+
+    def test_engines_match_on_generated_corpus(self):
+        """測試隨機組合的片段（含不完整與錯誤巢狀的標記）兩種引擎結果相同。"""
+        rng = random.Random(20240601)
+
+        for _ in range(300):
+            html = ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 40)))
+            for markup in (html, html.encode('utf-8')):
+                assert extract_seo_elements(markup, engine="lxml") == \
+                    extract_seo_elements(markup, engine="bs4"), html
+
+    def test_lxml_engine_extracts_expected_fields(self):
+        """測試 lxml 引擎的實際擷取內容。"""
+        # Arrange
+        raw = (FIXTURE_DIR / "blog_article_zh.html").read_bytes()
+
+        # Act
+        result = extract_seo_elements(raw, engine="lxml")
+
+        # Assert
+        assert result['title'] == "SEO 關鍵字研究完整指南 | 範例部落格"
+        assert result['meta_description'] == "從零開始學會關鍵字研究，包含工具、流程與實戰案例。"
+        assert result['h1'] == "SEO 關鍵字研究完整指南"
+        assert result['h2_list'] == ["網站公告：新功能上線", "為什麼關鍵字研究很重要", "常用工具", "結論"]
+        assert result['paragraph_count'] == 5
+        assert result['word_count'] > 0
+
+    def test_big5_bytes_with_known_encoding(self):
+        """測試提供已知編碼時可正確解碼舊式網頁。"""
+        raw = (FIXTURE_DIR / "legacy_big5.html").read_bytes()
+
+        result = extract_seo_elements(raw, encoding="big5", engine="lxml")
+
+        assert result == extract_seo_elements(raw, encoding="big5", engine="bs4")
+        assert result['title'] == "繁體中文 Big5 編碼頁面"
+        assert result['h2_list'] == ["最新消息"]
+
+    def test_empty_document(self):
+        """測試空白文件。"""
+        for html in ("", b"", "   "):
+            assert extract_seo_elements(html, engine="lxml") == extract_seo_elements(html, engine="bs4")
+
+    def test_extract_with_cpu_time_uses_engine(self):
+        """測試 CPU 時間量測包裝函式可指定擷取引擎。"""
+        html = "<html><body><main><h1>標題</h1><p>內容</p></main></body></html>"
+
+        result, cpu_time = extract_with_cpu_time(html, None, "lxml")
+
+        assert result == extract_seo_elements(html, engine="bs4")
+        assert cpu_time >= 0.0
+
+    def test_unknown_engine(self):
+        """測試不支援的擷取引擎。"""
+        with pytest.raises(ValueError):
+            extract_seo_elements("<p>x</p>", engine="regex")
@@ -0,0 +1,117 @@
+"""HTML 磁碟儲存單元測試。
+
+測試驗證器儲存、條件式請求標頭、容量上限淘汰與索引重建。
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.html_store import HTMLStore
+
+
+class TestHTMLStore:
+    """HTML 磁碟儲存測試類別。"""
+
+    @pytest.mark.asyncio
+    async def test_save_lookup_and_load(self, tmp_path):
+        """測試儲存後可查詢驗證器並讀回內容。"""
+        store = HTMLStore(str(tmp_path))
+        body = "<html><title>測試</title></html>".encode('utf-8')
+
+        saved = await store.save(
+            "https://example.com/a", body,
+            etag='"abc"', last_modified="Wed, 01 May 2024 00:00:00 GMT", charset="utf-8"
+        )
+        page = await store.lookup("https://example.com/a")
+
+        assert saved is True
+        assert page.conditional_headers() == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': "Wed, 01 May 2024 00:00:00 GMT",
+        }
+        assert page.charset == "utf-8"
+        assert await store.load_body("https://example.com/a") == body
+        assert store.get_stats()['revalidated'] == 1
+
+    @pytest.mark.asyncio
+    async def test_skip_without_validators(self, tmp_path):
+        """測試沒有 ETag 與 Last-Modified 的回應不會儲存。"""
+        store = HTMLStore(str(tmp_path))
+
+        assert await store.save("https://example.com/a", b"<html></html>") is False
+        assert await store.lookup("https://example.com/a") is None
+        assert store.get_stats()['entries'] == 0
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path):
+        """測試超過容量上限時淘汰最久未使用的項目。"""
+        store = HTMLStore(str(tmp_path), max_bytes=250)
+
+        await store.save("https://example.com/1", b"1" * 100, etag='"1"')
+        await store.save("https://example.com/2", b"2" * 100, etag='"2"')
+        # 讀取第一個項目，使第二個成為最久未使用
+        await store.load_body("https://example.com/1")
+        await store.save("https://example.com/3", b"3" * 100, etag='"3"')
+
+        stats = store.get_stats()
+        assert await store.lookup("https://example.com/2") is None
+        assert await store.lookup("https://example.com/1") is not None
+        assert await store.lookup("https://example.com/3") is not None
+        assert stats['evicted'] == 1
+        assert stats['total_bytes'] == 200
+        assert len(list(tmp_path.iterdir())) == 4
+
+    @pytest.mark.asyncio
+    async def test_index_reloaded_from_disk(self, tmp_path):
+        """測試新的儲存實例可從磁碟重建索引。"""
+        await HTMLStore(str(tmp_path)).save("https://example.com/a", b"body", etag='"x"')
+
+        store = HTMLStore(str(tmp_path))
+        page = await store.lookup("https://example.com/a")
+
+        assert page is not None and page.etag == '"x"'
+        assert await store.load_body("https://example.com/a") == b"body"
+        assert store.get_stats()['total_bytes'] == 4
+
+    @pytest.mark.asyncio
+    async def test_missing_body_file_is_forgotten(self, tmp_path):
+        """測試內容檔案遺失時回傳 None 並移出索引。"""
+        store = HTMLStore(str(tmp_path))
+        await store.save("https://example.com/a", b"body", etag='"x"')
+        for path in tmp_path.glob("*.html"):
+            path.unlink()
+
+        assert await store.load_body("https://example.com/a") is None
+        assert await store.lookup("https://example.com/a") is None
+        assert store.get_stats()['total_bytes'] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_keep_body_and_meta_consistent(self, tmp_path):
+        """測試同一 URL 並行寫入時，內容與驗證器來自同一個回應。"""
+        store = HTMLStore(str(tmp_path))
+        url = "https://example.com/popular"
+
+        results = await asyncio.gather(*(
+            store.save(url, f"version-{i}".encode('utf-8'), etag=f'"v{i}"')
+            for i in range(10)
+        ))
+
+        assert all(results)
+        body = (await store.load_body(url)).decode('utf-8')
+        meta = json.loads(next(tmp_path.glob("*.json")).read_text(encoding='utf-8'))
+        assert meta['etag'] == f'"v{body.split("-")[1]}"'
+        assert not list(tmp_path.glob("*.tmp"))
+        assert store.get_stats()['entries'] == 1
@@ -0,0 +1,80 @@
+"""解析結果快取單元測試。
+
+測試以 URL 與內容雜湊命中、內容變更、過期與容量淘汰的行為。
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.parse_cache import ParseCache
+
+
+PAGE_DATA = {'title': '標題', 'h2_list': ['副標題'], 'word_count': 10}
+
+
+class TestParseCache:
+    """解析結果快取測試類別。"""
+
+    def test_hit_when_content_unchanged(self):
+        """測試內容雜湊相同時命中並回傳獨立副本。"""
+        cache = ParseCache()
+        content_hash = ParseCache.content_hash("<html>內容</html>")
+        cache.put("https://example.com/a", content_hash, PAGE_DATA)
+
+        cached = cache.get("https://example.com/a", content_hash)
+        cached['h2_list'].append('被修改')
+
+        assert cached['title'] == '標題'
+        assert cache.get("https://example.com/a", content_hash)['h2_list'] == ['副標題']
+        assert cache.get_stats()['hits'] == 2
+
+    def test_miss_when_content_changed(self):
+        """測試內容變更或不同 URL 時不命中。"""
+        cache = ParseCache()
+        cache.put("https://example.com/a", ParseCache.content_hash("v1"), PAGE_DATA)
+
+        assert cache.get("https://example.com/a", ParseCache.content_hash("v2")) is None
+        assert cache.get("https://example.com/b", ParseCache.content_hash("v1")) is None
+        assert cache.get_stats()['misses'] == 2
+
+    def test_content_hash_includes_encoding(self):
+        """測試位元組內容的雜湊包含編碼，字串與其 UTF-8 位元組一致。"""
+        body = "中文".encode('utf-8')
+
+        assert ParseCache.content_hash(body) == ParseCache.content_hash("中文")
+        assert ParseCache.content_hash(body, "utf-8") != ParseCache.content_hash(body, "big5")
+
+    def test_expired_entry(self):
+        """測試超過存活時間的項目失效。"""
+        cache = ParseCache(ttl=60)
+        content_hash = ParseCache.content_hash("v1")
+        with patch('app.services.parse_cache.time.time', return_value=1000.0):
+            cache.put("https://example.com/a", content_hash, PAGE_DATA)
+        with patch('app.services.parse_cache.time.time', return_value=1061.0):
+            assert cache.get("https://example.com/a", content_hash) is None
+
+        stats = cache.get_stats()
+        assert stats['expired'] == 1
+        assert stats['entries'] == 0
+
+    def test_evicts_least_recently_used(self):
+        """測試超過最大項目數時淘汰最久未使用的項目。"""
+        cache = ParseCache(max_entries=2)
+        for name in ('a', 'b'):
+            cache.put(f"https://example.com/{name}", name, PAGE_DATA)
+        cache.get("https://example.com/a", 'a')
+        cache.put("https://example.com/c", 'c', PAGE_DATA)
+
+        assert cache.get("https://example.com/b", 'b') is None
+        assert cache.get("https://example.com/a", 'a') is not None
+        assert cache.get_stats()['evicted'] == 1
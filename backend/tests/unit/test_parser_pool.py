@@ -0,0 +1,118 @@
+"""HTML 解析工作池單元測試。
+
+測試解析工作池的各種模式、統計資訊與錯誤處理。
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.html_extractor import HTMLExtractionError
+from app.services.parser_pool import ParserPool
+
+
+SAMPLE_HTML = '''
+<html>
+<head><title>工作池測試</title><meta name="description" content="解析工作池"></head>
+<body>
+    <h1>主標題</h1>
+    <h2>第一節</h2><p>第一段內容。</p>
+    <h2>第二節</h2><p>第二段內容。</p>
+</body>
+</html>
+'''
+
+
+class TestParserPool:
+    """HTML 解析工作池測試類別。"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+    async def test_parse_in_each_mode(self, mode):
+        """測試各模式皆產生相同的解析結果。
+        
+        驗證：
+        - 接收位元組內容並回傳精簡字典
+        - 回報每次解析的 CPU 時間
+        """
+        # Arrange
+        pool = ParserPool(mode=mode, max_workers=1)
+        
+        try:
+            # Act
+            result, cpu_time = await pool.parse(SAMPLE_HTML.encode('utf-8'), 'utf-8')
+            
+            # Assert
+            assert result['title'] == "工作池測試"
+            assert result['meta_description'] == "解析工作池"
+            assert result['h1'] == "主標題"
+            assert result['h2_list'] == ["第一節", "第二節"]
+            assert result['paragraph_count'] >= 2
+            assert cpu_time >= 0.0
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_stats_tracking(self):
+        """測試工作池統計資訊。
+        
+        驗證：
+        - 完成數量與 CPU 時間累計
+        - 工作池大小與佇列深度
+        """
+        # Arrange
+        pool = ParserPool(mode="thread", max_workers=2)
+        
+        try:
+            # Act
+            for _ in range(3):
+                await pool.parse(SAMPLE_HTML)
+            stats = pool.get_stats()
+            
+            # Assert
+            assert stats['mode'] == "thread"
+            assert stats['max_workers'] == 2
+            assert stats['completed'] == 3
+            assert stats['failed'] == 0
+            assert stats['in_flight'] == 0
+            assert stats['queue_depth'] == 0
+            assert stats['cpu_time_total'] >= stats['cpu_time_max'] >= 0.0
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_parse_error_is_counted(self):
+        """測試解析失敗時的例外傳遞與統計。"""
+        # Arrange
+        pool = ParserPool(mode="thread", max_workers=1, engine="bs4")
+        
+        try:
+            with patch('app.services.html_extractor.BeautifulSoup', side_effect=RuntimeError("boom")):
+                # Act & Assert
+                with pytest.raises(HTMLExtractionError):
+                    await pool.parse(SAMPLE_HTML)
+            
+            assert pool.get_stats()['failed'] == 1
+        finally:
+            pool.shutdown()
+
+    def test_invalid_mode(self):
+        """測試不支援的模式。"""
+        with pytest.raises(ValueError):
+            ParserPool(mode="gpu")
+
+    def test_invalid_engine(self):
+        """測試不支援的擷取引擎。"""
+        with pytest.raises(ValueError):
+            ParserPool(mode="inline", engine="regex")
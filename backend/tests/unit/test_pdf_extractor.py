@@ -0,0 +1,56 @@
+"""PDF 文字擷取單元測試。
+
+pypdf 為選用相依套件，未安裝時只驗證錯誤處理。
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.pdf_extractor import HAS_PDF, PDFExtractionError, extract_pdf_elements
+
+
+class TestPDFExtractor:
+    """PDF 文字擷取測試類別。"""
+
+    @pytest.mark.skipif(HAS_PDF, reason="已安裝 pypdf")
+    def test_missing_dependency_raises(self):
+        """測試未安裝 pypdf 時拋出 PDFExtractionError。"""
+        with pytest.raises(PDFExtractionError):
+            extract_pdf_elements(b"%PDF-1.4")
+
+    @pytest.mark.skipif(not HAS_PDF, reason="未安裝 pypdf")
+    def test_corrupt_pdf_raises(self):
+        """測試損毀的 PDF 拋出 PDFExtractionError。"""
+        with pytest.raises(PDFExtractionError):
+            extract_pdf_elements(b"%PDF-1.4 not really a pdf")
+
+    @pytest.mark.skipif(not HAS_PDF, reason="未安裝 pypdf")
+    def test_metadata_title(self):
+        """測試由文件資訊取得標題，且欄位與 HTML 擷取結果一致。"""
+        from pypdf import PdfWriter  # pylint: disable=import-outside-toplevel
+
+        writer = PdfWriter()
+        writer.add_blank_page(width=200, height=200)
+        writer.add_metadata({'/Title': 'SEO 白皮書', '/Subject': '摘要'})
+        buffer = io.BytesIO()
+        writer.write(buffer)
+
+        result = extract_pdf_elements(buffer.getvalue())
+
+        assert result['title'] == 'SEO 白皮書'
+        assert result['meta_description'] == '摘要'
+        assert result['h1'] is None
+        assert result['h2_list'] == []
+        assert result['word_count'] == 0
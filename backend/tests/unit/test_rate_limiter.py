@@ -0,0 +1,273 @@
+"""SerpAPI 速率限制器單元測試。
+
+測試權杖桶排隊、等待上限、月配額計算與跨月重設，以及
+SerpService 於速率限制下排隊、重試 429 與配額用盡時的行為。
+"""
+
+import asyncio
+import calendar
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.rate_limiter import QuotaExhaustedError, RateLimitError, SerpRateLimiter
+from app.services.serp_service import RateLimitException, SerpService
+
+
+class FakeClock:
+    """可手動推進的假時鐘，sleep 只記錄等待秒數。"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+
+
+def make_limiter(clock, **kwargs):
+    """以假時鐘建立速率限制器。"""
+    return SerpRateLimiter(clock=clock, wall_clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestTokenBucket:
+    """權杖桶排隊測試類別。"""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_queue_in_order(self):
+        """測試 burst 內立即放行，之後依速率排隊。"""
+        clock = FakeClock()
+        limiter = make_limiter(clock, rate=2.0, burst=3)
+
+        waits = await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+
+        assert waits == [0.0, 0.0, 0.0, 0.5, 1.0, 1.5]
+        assert clock.sleeps == [0.5, 1.0, 1.5]
+        stats = limiter.get_stats()
+        assert stats['delayed'] == 3
+        assert stats['avg_wait'] == 1.0
+        assert stats['queue_wait'] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_tokens_refill_over_time(self):
+        """測試時間經過後權杖回補。"""
+        clock = FakeClock()
+        limiter = make_limiter(clock, rate=1.0, burst=2)
+        await limiter.acquire()
+        await limiter.acquire()
+        assert limiter.queue_wait == 1.0
+
+        clock.now += 2.0
+        assert limiter.queue_wait == 0.0
+        assert await limiter.acquire() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_wait_exceeds_max(self):
+        """測試預估等待超過上限時拒絕且不佔用時段與配額。"""
+        clock = FakeClock()
+        limiter = make_limiter(clock, rate=1.0, burst=1, monthly_quota=10, max_wait=1.5)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await limiter.acquire()
+
+        assert exc_info.value.retry_after == 2.0
+        stats = limiter.get_stats()
+        assert stats['rejected'] == 1
+        assert stats['used_quota'] == 2
+        assert stats['queue_wait'] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_penalize_delays_next_request(self):
+        """測試上游回報超過限制後，之後的請求至少等待指定秒數。"""
+        clock = FakeClock()
+        limiter = make_limiter(clock, rate=1.0, burst=5)
+
+        limiter.penalize(3.0)
+
+        assert await limiter.acquire() == 3.0
+        assert limiter.get_stats()['penalties'] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_wait_refunds_quota(self):
+        """測試取消排隊中的請求時退回配額。"""
+        limiter = SerpRateLimiter(rate=1.0, burst=1, monthly_quota=5)
+        await limiter.acquire()
+
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.get_stats()['waiting'] == 1
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        assert limiter.remaining_quota == 4
+        assert limiter.get_stats()['waiting'] == 0
+
+
+class TestMonthlyQuota:
+    """月配額測試類別。"""
+
+    @pytest.mark.asyncio
+    async def test_quota_exhausted(self):
+        """測試配額用盡時立即拒絕而不排隊。"""
+        clock = FakeClock()
+        limiter = make_limiter(clock, rate=0, monthly_quota=2)
+        await limiter.acquire()
+        assert limiter.remaining_quota == 1
+        await limiter.acquire()
+
+        with pytest.raises(QuotaExhaustedError):
+            await limiter.acquire()
+
+        stats = limiter.get_stats()
+        assert stats['remaining_quota'] == 0
+        assert stats['quota_rejected'] == 1
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_quota_resets_in_new_month(self):
+        """測試進入新的 UTC 月份時重設配額。"""
+        clock = FakeClock(calendar.timegm((2026, 1, 31, 23, 59, 0)))
+        limiter = make_limiter(clock, rate=0, monthly_quota=1)
+        await limiter.acquire()
+        assert limiter.remaining_quota == 0
+
+        clock.now += 120
+        assert limiter.remaining_quota == 1
+        await limiter.acquire()
+
+    @pytest.mark.asyncio
+    async def test_quota_persisted_across_instances(self, tmp_path):
+        """測試新的限制器實例由保存的檔案接續本月用量。"""
+        clock = FakeClock(calendar.timegm((2026, 3, 10, 12, 0, 0)))
+        path = tmp_path / "serp" / "quota.json"
+        limiter = make_limiter(clock, rate=0, monthly_quota=3, state_path=str(path))
+        await limiter.acquire()
+        await limiter.acquire()
+
+        restarted = make_limiter(clock, rate=0, monthly_quota=3, state_path=str(path))
+
+        assert restarted.used_quota == 2
+        assert restarted.remaining_quota == 1
+        await restarted.acquire()
+        with pytest.raises(QuotaExhaustedError):
+            await restarted.acquire()
+        assert not list(path.parent.glob("*.tmp"))
+
+    @pytest.mark.asyncio
+    async def test_persisted_quota_from_previous_month_ignored(self, tmp_path):
+        """測試保存的用量屬於上個月時，新實例從 0 開始。"""
+        clock = FakeClock(calendar.timegm((2026, 3, 31, 23, 59, 0)))
+        path = tmp_path / "quota.json"
+        await make_limiter(clock, rate=0, monthly_quota=3, state_path=str(path)).acquire()
+
+        clock.now += 120
+        restarted = make_limiter(clock, rate=0, monthly_quota=3, state_path=str(path))
+
+        assert restarted.used_quota == 0
+
+    def test_corrupt_quota_file_ignored(self, tmp_path):
+        """測試配額紀錄損毀時以 0 開始。"""
+        path = tmp_path / "quota.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        limiter = SerpRateLimiter(monthly_quota=3, state_path=str(path))
+
+        assert limiter.remaining_quota == 3
+
+    def test_unlimited_quota(self):
+        """測試未設定配額時剩餘配額為 None。"""
+        assert SerpRateLimiter(monthly_quota=0).remaining_quota is None
+
+
+class TestSerpServiceRateLimit:
+    """SerpService 速率限制整合測試類別。"""
+
+    RESPONSE = {"organic_results": [{"position": 1, "title": "T", "link": "https://a.com", "snippet": "S"}]}
+
+    @pytest.fixture
+    def serp_service(self, tmp_path):
+        """每秒 1 次、burst 1、每月 2 次配額的 SerpService 實例。"""
+        config_mock = Mock()
+        config_mock.get_serp_api_key.return_value = "test_api_key"
+        config_mock.get_serp_search_engine.return_value = "google"
+        config_mock.get_serp_location.return_value = "Taiwan"
+        config_mock.get_serp_language.return_value = "zh-tw"
+        config_mock.get_serp_page_size.return_value = 10
+        config_mock.get_serp_timeout.return_value = 30.0
+        config_mock.get_serp_pool_limit.return_value = 20
+        config_mock.get_serp_cache_enabled.return_value = False
+        config_mock.get_serp_cache_ttl.return_value = 86400.0
+        config_mock.get_serp_cache_max_entries.return_value = 512
+        config_mock.get_serp_cache_dir.return_value = str(tmp_path)
+        config_mock.get_serp_rate_limit.return_value = 1.0
+        config_mock.get_serp_rate_burst.return_value = 1
+        config_mock.get_serp_monthly_quota.return_value = 2
+        config_mock.get_serp_queue_timeout.return_value = 30.0
+        config_mock.get_retry_budget_ratio.return_value = 0.2
+        config_mock.get_retry_budget_reserve.return_value = 10.0
+        config_mock.get_retry_max_delay.return_value = 30.0
+        with patch('app.services.serp_service.get_config', return_value=config_mock):
+            service = SerpService()
+        clock = FakeClock()
+        service.rate_limiter = make_limiter(clock, rate=1.0, burst=1, monthly_quota=2)
+        return service
+
+    def test_quota_saved_in_cache_dir(self, serp_service, tmp_path):
+        """測試設定月配額時，本月用量保存在 SERP 快取目錄。"""
+        with patch('app.services.serp_service.get_config', return_value=serp_service.config):
+            service = SerpService()
+
+        assert service.rate_limiter.state_path == str(tmp_path / "quota.json")
+        assert service.get_rate_limit_stats()['persistent'] is True
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_queue(self, serp_service):
+        """測試超過速率的並行搜尋排隊而非失敗。"""
+        with patch.object(SerpService, '_fetch_search_data', return_value=self.RESPONSE) as fetch:
+            results = await asyncio.gather(
+                serp_service.search_keyword("a"), serp_service.search_keyword("b")
+            )
+
+        assert fetch.await_count == 2
+        assert all(r.organic_results for r in results)
+        assert serp_service.get_rate_limit_stats()['delayed'] == 1
+
+    @pytest.mark.asyncio
+    async def test_upstream_rate_limit_is_retried(self, serp_service):
+        """測試上游回報超過限制時退避後重試。"""
+        responses = [{"error": "Rate limit exceeded"}, self.RESPONSE]
+        with patch.object(SerpService, '_fetch_search_data', side_effect=responses) as fetch:
+            with patch('app.services.serp_service.asyncio.sleep', new=AsyncMock()):
+                result = await serp_service.search_keyword("a")
+
+        assert fetch.await_count == 2
+        assert result.organic_results[0].link == "https://a.com"
+        assert serp_service.get_rate_limit_stats()['penalties'] == 1
+
+    @pytest.mark.asyncio
+    async def test_quota_exhausted_fails_without_request(self, serp_service):
+        """測試配額用盡時不送出請求並拋出 RateLimitException。"""
+        with patch.object(SerpService, '_fetch_search_data', return_value=self.RESPONSE) as fetch:
+            await serp_service.search_keyword("a")
+            await serp_service.search_keyword("b")
+            with pytest.raises(RateLimitException, match="配額"):
+                await serp_service.search_keyword("c")
+
+        assert fetch.await_count == 2
+        assert serp_service.get_rate_limit_stats()['remaining_quota'] == 0
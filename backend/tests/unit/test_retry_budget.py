@@ -0,0 +1,189 @@
+"""重試預算單元測試。
+
+測試重試比例上限、jitter 退避、Retry-After 解析，以及爬蟲依
+Retry-After 重試 429 回應。
+"""
+
+import asyncio
+import sys
+from email.utils import formatdate
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.host_scheduler import HostScheduler
+from app.services.retry_budget import RetryBudget, parse_retry_after
+from app.services.scraper_service import PageContent
+
+
+def upper_bound(_low, high):
+    """固定取 jitter 範圍上限的亂數函式。"""
+    return high
+
+
+class TestRetryBudget:
+    """重試預算測試類別。"""
+
+    def test_reserve_allows_retries_when_idle(self):
+        """測試低流量時可使用保留的重試數，用完即拒絕。"""
+        budget = RetryBudget("test", ratio=0.1, reserve=3, rng=upper_bound)
+
+        delays = [budget.retry_delay(0, 1.0) for _ in range(4)]
+
+        assert delays[:3] == [1.0, 1.0, 1.0]
+        assert delays[3] is None
+        assert budget.get_stats()['exhausted'] == 1
+
+    def test_retries_capped_by_ratio(self):
+        """測試持續故障時重試數約為首次嘗試數的 ratio 比例。"""
+        budget = RetryBudget("test", ratio=0.2, reserve=1, rng=upper_bound)
+        budget.retry_delay(0, 1.0)  # 用掉初始保留
+
+        granted = 0
+        for _ in range(100):
+            budget.record_attempt()
+            granted += budget.retry_delay(0, 1.0) is not None
+
+        stats = budget.get_stats()
+        assert 19 <= granted <= 20
+        assert stats['attempts'] == 100
+        assert stats['exhausted'] == 100 - granted
+
+    def test_backoff_grows_and_is_capped(self):
+        """測試退避上限依嘗試次數倍增且不超過 max_delay。"""
+        budget = RetryBudget("test", reserve=10, max_delay=5.0, rng=upper_bound)
+
+        assert [budget.retry_delay(i, 1.0) for i in range(4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_jitter_range(self):
+        """測試 jitter 在 0 到退避上限之間取值。"""
+        calls = []
+        budget = RetryBudget("test", rng=lambda low, high: calls.append((low, high)) or low)
+
+        assert budget.retry_delay(2, 0.5) == 0.0
+        assert calls == [(0.0, 2.0)]
+
+    def test_retry_after_sets_minimum_delay(self):
+        """測試 Retry-After 為退避下限，超過 max_delay 時放棄重試。"""
+        budget = RetryBudget("test", max_delay=10.0, rng=upper_bound)
+
+        assert budget.retry_delay(0, 1.0, retry_after=3.0) == 3.0
+        assert budget.retry_delay(0, 1.0, retry_after=60.0) is None
+
+        stats = budget.get_stats()
+        assert stats['retries'] == 1
+        assert stats['retry_after_honored'] == 1
+        assert stats['retry_after_too_long'] == 1
+
+
+class TestParseRetryAfter:
+    """Retry-After 標頭解析測試類別。"""
+
+    def test_seconds(self):
+        """測試秒數格式。"""
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_http_date(self):
+        """測試 HTTP 日期格式以目前時間換算秒數。"""
+        now = 1_700_000_000
+        assert parse_retry_after(formatdate(now + 30, usegmt=True), now=now) == 30.0
+        assert parse_retry_after(formatdate(now - 30, usegmt=True), now=now) == 0.0
+
+    def test_invalid_values(self):
+        """測試空值與無法解析的值。"""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+
+
+class TestScraperRetryAfter:
+    """爬蟲依 Retry-After 重試的測試類別。"""
+
+    @pytest.fixture
+    def scraper_service(self):
+        """僅設定重試相關屬性的 ScraperService 實例。"""
+        from app.services.scraper_service import ScraperService
+
+        service = ScraperService.__new__(ScraperService)
+        service.max_retries = 3
+        service.retry_delay = 1.0
+        service.retry_budget = RetryBudget("scraper", max_delay=10.0, rng=upper_bound)
+        service.circuit_breaker = None
+        service.concurrency = None
+        service.host_scheduler = HostScheduler(per_host_limit=1, min_delay=0.0)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_429_with_retry_after_is_retried(self, scraper_service):
+        """測試帶 Retry-After 的 429 依指示等待後重試。"""
+        throttled = PageContent(url="u", h2_list=[], status_code=429, retry_after=4.0)
+        ok = PageContent(url="u", h2_list=[], status_code=200, success=True)
+        scraper_service._execute_hedged = AsyncMock(side_effect=[throttled, ok])
+
+        with patch('app.services.scraper_service.asyncio.sleep', new=AsyncMock()) as sleep:
+            page = await scraper_service.scrape_single_url("u")
+
+        assert page.success is True
+        sleep.assert_awaited_once_with(4.0)
+        assert scraper_service.get_retry_stats()['retry_after_honored'] == 1
+
+    @pytest.mark.asyncio
+    async def test_long_retry_after_returns_page(self, scraper_service):
+        """測試 Retry-After 過長時不重試，直接回傳 429 結果。"""
+        throttled = PageContent(
+            url="u", h2_list=[], status_code=429, error="HTTP 429 錯誤", retry_after=3600.0
+        )
+        scraper_service._execute_hedged = AsyncMock(return_value=throttled)
+
+        with patch('app.services.scraper_service.asyncio.sleep', new=AsyncMock()) as sleep:
+            page = await scraper_service.scrape_single_url("u")
+
+        assert page is throttled
+        sleep.assert_not_awaited()
+        assert scraper_service._execute_hedged.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_stops_retries(self, scraper_service):
+        """測試重試預算用盡時逾時不再重試並計入 exhausted。"""
+        scraper_service.retry_budget = RetryBudget("scraper", ratio=0.0, reserve=1)
+        scraper_service._execute_hedged = AsyncMock(side_effect=asyncio.TimeoutError)
+
+        with patch('app.services.scraper_service.asyncio.sleep', new=AsyncMock()):
+            page = await scraper_service.scrape_single_url("u")
+
+        stats = scraper_service.get_retry_stats()
+        assert page.success is False
+        assert "逾時" in page.error
+        assert scraper_service._execute_hedged.await_count == 2
+        assert stats['retries'] == 1
+        assert stats['exhausted'] == 1
+
+    @pytest.mark.asyncio
+    async def test_backoff_releases_slots(self, scraper_service):
+        """測試 Retry-After 退避期間歸還主機與全域名額，其他請求可使用。"""
+        throttled = PageContent(url="u", h2_list=[], status_code=429, retry_after=4.0)
+        ok = PageContent(url="u", h2_list=[], status_code=200, success=True)
+        scraper_service._execute_hedged = AsyncMock(side_effect=[throttled, ok])
+        gate = asyncio.Semaphore(1)
+        during_sleep = []
+
+        async def fake_sleep(_delay):
+            during_sleep.append((gate.locked(), scraper_service.host_scheduler.get_stats()['busy_hosts']))
+
+        with patch('app.services.scraper_service.asyncio.sleep', new=AsyncMock(side_effect=fake_sleep)):
+            page = await scraper_service.scrape_single_url("https://a.example.com/", gate=gate)
+
+        assert page.success is True
+        assert during_sleep == [(False, {})]
+        assert scraper_service.host_scheduler.get_stats()['requests'] == 2
@@ -0,0 +1,166 @@
+"""robots.txt 快取單元測試。
+
+測試規則比對、單次取得合併、TTL 到期重新取得與取得失敗的處理。
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.robots import RobotsCache
+
+
+ROBOTS_TXT = """
+User-agent: SEOAnalyzer
+Disallow: /private
+
+User-agent: *
+Disallow: /
+"""
+
+
+class FakeClock:
+    """可手動推進的假時鐘。"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+async def start_robots_server(status=200, body=ROBOTS_TXT, delay=0.0):
+    """啟動回應 /robots.txt 的本機伺服器。
+
+    Returns:
+        tuple: (AppRunner, 伺服器基礎 URL, 請求次數清單)
+    """
+    calls = []
+
+    async def handler(_request):
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return web.Response(status=status, text=body)
+
+    app = web.Application()
+    app.router.add_get('/robots.txt', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}", calls
+
+
+class TestRobotsCache:
+    """robots.txt 快取測試類別。"""
+
+    @pytest.mark.asyncio
+    async def test_rules_for_own_user_agent(self):
+        """測試依自身 User-agent 群組判斷允許與拒絕。"""
+        runner, base_url, calls = await start_robots_server()
+        robots = RobotsCache(user_agent="SEOAnalyzer")
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                assert await robots.allowed(session, f"{base_url}/public/page") is True
+                assert await robots.allowed(session, f"{base_url}/private/page") is False
+
+            stats = robots.get_stats()
+            assert len(calls) == 1
+            assert stats['fetches'] == 1
+            assert stats['hits'] == 1
+            assert stats['disallowed'] == 1
+        finally:
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_fetch(self):
+        """測試同一來源的並行檢查只取得一次 robots.txt。"""
+        runner, base_url, calls = await start_robots_server(delay=0.1)
+        robots = RobotsCache()
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                results = await asyncio.gather(*(
+                    robots.allowed(session, f"{base_url}/page/{i}") for i in range(5)
+                ))
+
+            assert results == [True] * 5
+            assert len(calls) == 1
+            assert robots.get_stats()['coalesced'] == 4
+        finally:
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_refetch_after_ttl(self):
+        """測試快取到期後重新取得 robots.txt。"""
+        clock = FakeClock()
+        runner, base_url, calls = await start_robots_server()
+        robots = RobotsCache(ttl=60, clock=clock)
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                await robots.allowed(session, f"{base_url}/a")
+                clock.now += 59
+                await robots.allowed(session, f"{base_url}/b")
+                clock.now += 2
+                await robots.allowed(session, f"{base_url}/c")
+
+            assert len(calls) == 2
+        finally:
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_missing_robots_allows_everything(self):
+        """測試 robots.txt 不存在 (404) 時視為沒有限制。"""
+        runner, base_url, _calls = await start_robots_server(status=404, body="not found")
+        robots = RobotsCache()
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                assert await robots.allowed(session, f"{base_url}/private") is True
+            assert robots.get_stats()['fetch_errors'] == 0
+        finally:
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_server_error_allows_with_short_ttl(self):
+        """測試伺服器錯誤時暫時放行，並在 error_ttl 後重新取得。"""
+        clock = FakeClock()
+        runner, base_url, calls = await start_robots_server(status=503, body="down")
+        robots = RobotsCache(ttl=3600, error_ttl=10, clock=clock)
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                assert await robots.allowed(session, f"{base_url}/a") is True
+                clock.now += 11
+                assert await robots.allowed(session, f"{base_url}/a") is True
+
+            assert len(calls) == 2
+            assert robots.get_stats()['fetch_errors'] == 2
+        finally:
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_non_http_urls_skip_check(self):
+        """測試非 HTTP(S) 的 URL 不做檢查。"""
+        robots = RobotsCache()
+
+        async with aiohttp.ClientSession() as session:
+            assert await robots.allowed(session, "ftp://example.com/file") is True
+
+        assert robots.get_stats()['checks'] == 0
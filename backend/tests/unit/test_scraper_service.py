@@ -5,13 +5,14 @@ SEO 元素提取、錯誤處理和資源管理。
 """
 
 import asyncio
+import gzip
 import sys
 import time
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch
 
 import pytest
-from aiohttp import ClientResponse, ClientTimeout
+from aiohttp import ClientResponse, ClientTimeout, web
 
 # 確保可以從不同的工作目錄執行測試
 # 動態添加 backend 目錄到 Python 路徑
@@ -22,16 +23,64 @@ if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
 # pylint: disable=import-error,wrong-import-position
+from app.services.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.dns_resolver import CachingResolver
+from app.services.domain_timeouts import DomainTimeoutTracker
+from app.services.hedging import HedgePolicy
+from app.services.host_scheduler import HostScheduler
+from app.services.robots import RobotsCache
 from app.services.scraper_service import (
     ScraperService,
     ScraperException, 
     ScraperTimeoutException,
     ScraperParsingException,
     PageContent,
+    ScrapeProgress,
     ScrapingResult
 )
 
 
+async def start_local_server(routes):
+    """啟動本機 aiohttp 測試伺服器。
+    
+    Args:
+        routes: 路徑對應處理函式的字典
+        
+    Returns:
+        tuple: (AppRunner, 伺服器基礎 URL)
+    """
+    app = web.Application()
+    for path, handler in routes.items():
+        app.router.add_get(path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def make_mock_response(status, html):
+    """建立模擬的 aiohttp 回應物件。
+    
+    爬蟲自行解碼內容，因此模擬 read() 回傳未壓縮的 UTF-8 位元組。
+    
+    Args:
+        status: HTTP 狀態碼
+        html: HTML 內容
+        
+    Returns:
+        AsyncMock: 模擬回應
+    """
+    mock_response = AsyncMock()
+    mock_response.status = status
+    mock_response.headers = {}
+    mock_response.charset = 'utf-8'
+    mock_response.read.return_value = html.encode('utf-8')
+    return mock_response
+
+
 class TestScraperService:
     """網頁爬蟲服務測試類別。"""
 
@@ -40,9 +89,52 @@ class TestScraperService:
         """Mock 配置物件 fixture。"""
         config_mock = Mock()
         config_mock.get_scraper_max_concurrent.return_value = 10
+        config_mock.get_scraper_adaptive_concurrency_enabled.return_value = True
+        config_mock.get_scraper_concurrency_min.return_value = 1
+        config_mock.get_scraper_concurrency_max.return_value = 32
         config_mock.get_scraper_timeout.return_value = 10.0
         config_mock.get_scraper_retry_count.return_value = 3
         config_mock.get_scraper_retry_delay.return_value = 1.0
+        config_mock.get_scraper_min_success.return_value = 0
+        config_mock.get_scraper_deadline.return_value = 0.0
+        config_mock.get_scraper_adaptive_timeout_enabled.return_value = True
+        config_mock.get_scraper_timeout_floor.return_value = 2.0
+        config_mock.get_scraper_timeout_cap.return_value = 30.0
+        config_mock.get_scraper_timeout_percentile.return_value = 99.0
+        config_mock.get_scraper_timeout_history_path.return_value = ""
+        config_mock.get_scraper_hedge_enabled.return_value = True
+        config_mock.get_scraper_hedge_percentile.return_value = 95.0
+        config_mock.get_scraper_hedge_budget.return_value = 0.1
+        config_mock.get_scraper_hedge_min_samples.return_value = 20
+        config_mock.get_scraper_circuit_breaker_enabled.return_value = True
+        config_mock.get_scraper_circuit_failure_threshold.return_value = 0.5
+        config_mock.get_scraper_circuit_min_failures.return_value = 5
+        config_mock.get_scraper_circuit_cooldown.return_value = 30.0
+        config_mock.get_scraper_robots_enabled.return_value = False
+        config_mock.get_scraper_robots_user_agent.return_value = "SEOAnalyzer"
+        config_mock.get_scraper_robots_ttl.return_value = 86400.0
+        config_mock.get_scraper_pool_limit.return_value = 100
+        config_mock.get_scraper_pool_limit_per_host.return_value = 10
+        config_mock.get_scraper_keepalive_timeout.return_value = 30.0
+        config_mock.get_scraper_stream_read.return_value = False
+        config_mock.get_scraper_max_content_bytes.return_value = 2 * 1024 * 1024
+        config_mock.get_scraper_pdf_enabled.return_value = True
+        config_mock.get_scraper_pdf_max_bytes.return_value = 10 * 1024 * 1024
+        config_mock.get_scraper_parser_mode.return_value = "thread"
+        config_mock.get_scraper_parser_workers.return_value = 2
+        config_mock.get_scraper_parser_engine.return_value = "lxml"
+        config_mock.get_scraper_per_host_concurrent.return_value = 2
+        config_mock.get_scraper_host_delay.return_value = 0.0
+        config_mock.get_scraper_html_store_enabled.return_value = False
+        config_mock.get_scraper_dns_cache_enabled.return_value = True
+        config_mock.get_scraper_dns_cache_ttl.return_value = 300.0
+        config_mock.get_scraper_dns_negative_ttl.return_value = 30.0
+        config_mock.get_scraper_parse_cache_enabled.return_value = True
+        config_mock.get_scraper_parse_cache_ttl.return_value = 7 * 24 * 3600
+        config_mock.get_scraper_parse_cache_max_entries.return_value = 2048
+        config_mock.get_retry_budget_ratio.return_value = 0.2
+        config_mock.get_retry_budget_reserve.return_value = 10.0
+        config_mock.get_retry_max_delay.return_value = 30.0
         return config_mock
 
     @pytest.fixture
@@ -90,9 +182,7 @@ class TestScraperService:
         url = "https://example.com/seo-guide"
         
         with patch('aiohttp.ClientSession.get') as mock_get:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.text.return_value = mock_html_content
+            mock_response = make_mock_response(200, mock_html_content)
             mock_get.return_value.__aenter__.return_value = mock_response
             
             # Act
@@ -134,11 +224,9 @@ class TestScraperService:
         urls = [f"https://example.com/page-{i}" for i in range(1, 11)]
         
         def mock_response_factory(url):
-            mock_response = AsyncMock()
-            mock_response.status = 200
             # 根據 URL 返回不同內容
             page_num = int(url.split('-')[-1])
-            mock_response.text.return_value = f'''
+            html = f'''
             <html>
                 <head>
                     <title>頁面 {page_num} 標題</title>
@@ -152,7 +240,7 @@ class TestScraperService:
                 </body>
             </html>
             '''
-            return mock_response
+            return make_mock_response(200, html)
 
         with patch('aiohttp.ClientSession.get') as mock_get:
             # 修正 mock 設定
@@ -213,9 +301,7 @@ class TestScraperService:
         url = "https://example.com/chinese-content"
         
         with patch('aiohttp.ClientSession.get') as mock_get:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.text.return_value = chinese_html
+            mock_response = make_mock_response(200, chinese_html)
             mock_get.return_value.__aenter__.return_value = mock_response
             
             # Act
@@ -268,9 +354,7 @@ class TestScraperService:
         url = "https://example.com/invalid"
         
         with patch('aiohttp.ClientSession.get') as mock_get:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.text.return_value = invalid_html
+            mock_response = make_mock_response(200, invalid_html)
             mock_get.return_value.__aenter__.return_value = mock_response
             
             # Act
@@ -296,9 +380,7 @@ class TestScraperService:
         url = "https://non-existent-site.com/page"
         
         with patch('aiohttp.ClientSession.get') as mock_get:
-            mock_response = AsyncMock()
-            mock_response.status = 404
-            mock_response.text.return_value = "<html><body>Not Found</body></html>"
+            mock_response = make_mock_response(404, "<html><body>Not Found</body></html>")
             mock_get.return_value.__aenter__.return_value = mock_response
             
             # Act
@@ -334,9 +416,7 @@ class TestScraperService:
         url = "https://example.com/large-page"
         
         with patch('aiohttp.ClientSession.get') as mock_get:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.text.return_value = large_html
+            mock_response = make_mock_response(200, large_html)
             mock_get.return_value.__aenter__.return_value = mock_response
             
             # Act
@@ -375,4 +455,976 @@ class TestScraperService:
         assert content.title == "測試標題"
         assert len(content.h2_list) == 2
         assert content.success is True
-        assert content.error is None  # 預設值
\ No newline at end of file
+        assert content.error is None  # 預設值
+
+    @pytest.mark.asyncio
+    async def test_shared_session_lifecycle(self, scraper_service):
+        """測試共用 ClientSession 的生命週期。
+        
+        驗證：
+        - 多次取得的是同一個 Session
+        - close() 後重新建立新的 Session
+        """
+        # Act
+        await scraper_service.startup()
+        first_session = scraper_service._get_session()
+        second_session = scraper_service._get_session()
+        
+        # Assert
+        assert first_session is second_session
+        assert scraper_service.get_pool_stats()['active'] is True
+        
+        await scraper_service.close()
+        assert first_session.closed
+        assert scraper_service.get_pool_stats()['active'] is False
+        
+        new_session = scraper_service._get_session()
+        assert new_session is not first_session
+        await scraper_service.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_reuse_across_requests(self, scraper_service):
+        """測試連線池跨請求重用 keep-alive 連線。
+        
+        驗證：
+        - 對同一主機的連續請求只建立一條連線
+        - 連線重用率統計正確
+        """
+        # Arrange - 啟動本機測試伺服器
+        async def handler(_request):
+            return web.Response(
+                text="<html><head><title>連線池測試</title></head><body><p>內容</p></body></html>",
+                content_type="text/html"
+            )
+        
+        runner, base_url = await start_local_server({'/page': handler})
+        
+        try:
+            # Act
+            for _ in range(3):
+                result = await scraper_service.scrape_single_url(f"{base_url}/page")
+                assert result.success is True
+            stats = scraper_service.get_pool_stats()
+            
+            # Assert
+            assert stats['requests'] == 3
+            assert stats['connections_created'] == 1
+            assert stats['connections_reused'] == 2
+            assert stats['reuse_ratio'] == pytest.approx(2 / 3, rel=1e-3)
+            assert stats['open_sockets'] == 1
+            assert stats['waiters'] == 0
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_pool_waiters_drop_when_queued_request_cancelled(self, scraper_service):
+        """測試在連線池排隊中被取消的請求不會殘留在等待者統計。"""
+        # Arrange - 連線池只有一條連線，伺服器回應緩慢
+        release = asyncio.Event()
+
+        async def handler(_request):
+            await release.wait()
+            return web.Response(text="<html><title>慢</title></html>", content_type="text/html")
+
+        runner, base_url = await start_local_server({'/slow': handler})
+        scraper_service.pool_limit = 1
+
+        try:
+            # Act - 第二個請求在連線池排隊時取消
+            first = asyncio.ensure_future(scraper_service.scrape_single_url(f"{base_url}/slow"))
+            await asyncio.sleep(0.1)
+            queued = asyncio.ensure_future(scraper_service.scrape_single_url(f"{base_url}/slow"))
+            await asyncio.sleep(0.1)
+            waiting = scraper_service.get_pool_stats()['waiters']
+            queued.cancel()
+            await asyncio.gather(queued, return_exceptions=True)
+            release.set()
+            await first
+
+            # Assert
+            assert waiting == 1
+            assert scraper_service.get_pool_stats()['waiters'] == 0
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_adaptive_concurrency_limits_in_flight(self, scraper_service):
+        """測試自適應並行限制器為全域名額，且上限可於執行期查詢。"""
+        # Arrange
+        in_flight = 0
+        peak = 0
+
+        async def handler(_request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.05)
+                return web.Response(text="<html><title>並行</title></html>", content_type="text/html")
+            finally:
+                in_flight -= 1
+
+        runner, base_url = await start_local_server({'/item/{index}': handler})
+        scraper_service.concurrency = AdaptiveConcurrencyLimiter(initial=1, max_limit=1)
+
+        try:
+            # Act
+            result = await scraper_service.scrape_urls([f"{base_url}/item/{i}" for i in range(4)])
+            stats = scraper_service.get_concurrency_stats()
+
+            # Assert
+            assert result.successful_scrapes == 4
+            assert peak == 1
+            assert stats['enabled'] is True
+            assert stats['limit'] == 1
+            assert stats['in_flight'] == 0
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_per_host_scheduling_avoids_throttling(self, scraper_service):
+        """測試同主機排程避免觸發伺服器限流。
+        
+        驗證：
+        - 同主機的並行請求不超過 per_host_concurrent
+        - 伺服器限制同時 2 個請求時不會回傳 429
+        """
+        # Arrange - 同時超過 2 個請求即回傳 429 的伺服器
+        in_flight = 0
+        peak = 0
+        
+        async def handler(_request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                if in_flight > 2:
+                    return web.Response(status=429, text="Too Many Requests")
+                await asyncio.sleep(0.05)
+                return web.Response(
+                    text="<html><head><title>限流測試</title></head><body><p>內容</p></body></html>",
+                    content_type="text/html"
+                )
+            finally:
+                in_flight -= 1
+        
+        runner, base_url = await start_local_server({'/item/{index}': handler})
+        
+        try:
+            # Act
+            result = await scraper_service.scrape_urls([f"{base_url}/item/{i}" for i in range(6)])
+            stats = scraper_service.get_scheduler_stats()
+            
+            # Assert
+            assert result.successful_scrapes == 6
+            assert result.errors == []
+            assert peak <= 2
+            assert stats['requests'] == 6
+            assert stats['busy_hosts'] == {}
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_parse_cache_skips_unchanged_pages(self, scraper_service):
+        """測試內容未變更的頁面重用解析結果。
+
+        驗證：
+        - 第二次分析中未變更的頁面命中快取並略過解析
+        - 內容變更的頁面重新解析
+        - 每次分析回報各自的命中與未命中數
+        """
+        # Arrange - /changing 每次回傳不同內容
+        versions = {'changing': 0}
+
+        async def static_handler(_request):
+            return web.Response(
+                text="<html><head><title>固定頁面</title></head><body><p>內容</p></body></html>",
+                content_type="text/html"
+            )
+
+        async def changing_handler(_request):
+            versions['changing'] += 1
+            return web.Response(
+                text=f"<html><head><title>版本 {versions['changing']}</title></head><body></body></html>",
+                content_type="text/html"
+            )
+
+        runner, base_url = await start_local_server({
+            '/static': static_handler,
+            '/changing': changing_handler,
+        })
+        urls = [f"{base_url}/static", f"{base_url}/changing"]
+
+        try:
+            with patch.object(
+                scraper_service, '_extract_seo_elements', wraps=scraper_service._extract_seo_elements
+            ) as extract_spy:
+                # Act
+                first = await scraper_service.scrape_urls(urls)
+                second = await scraper_service.scrape_urls(urls)
+
+            # Assert
+            assert (first.parse_cache_hits, first.parse_cache_misses) == (0, 2)
+            assert (second.parse_cache_hits, second.parse_cache_misses) == (1, 1)
+            assert extract_spy.call_count == 3
+            pages = {page.url: page for page in second.pages}
+            assert pages[f"{base_url}/static"].parse_cached
+            assert pages[f"{base_url}/static"].title == "固定頁面"
+            assert pages[f"{base_url}/changing"].title == "版本 2"
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_html_store_revalidates_with_etag(self, mock_config, tmp_path):
+        """測試以 ETag 重新驗證並在 304 時重用儲存的 HTML。
+
+        驗證：
+        - 第二次請求帶 If-None-Match
+        - 伺服器回應 304 時仍能提取 SEO 元素
+        - 結果標記為 revalidated
+        """
+        # Arrange - 支援 ETag 的伺服器
+        mock_config.get_scraper_html_store_enabled.return_value = True
+        mock_config.get_scraper_html_store_dir.return_value = str(tmp_path)
+        mock_config.get_scraper_html_store_max_bytes.return_value = 1024 * 1024
+        with patch('app.services.scraper_service.get_config', return_value=mock_config):
+            service = ScraperService()
+
+        etag = '"v1"'
+        conditional_headers = []
+
+        async def handler(request):
+            conditional_headers.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == etag:
+                return web.Response(status=304, headers={'ETag': etag})
+            return web.Response(
+                text="<html><head><title>快取頁面</title></head><body><h1>標題</h1><p>內容</p></body></html>",
+                content_type="text/html",
+                headers={'ETag': etag}
+            )
+
+        runner, base_url = await start_local_server({'/page': handler})
+
+        try:
+            # Act
+            first = await service.scrape_single_url(f"{base_url}/page")
+            second = await service.scrape_single_url(f"{base_url}/page")
+            stats = service.get_html_store_stats()
+
+            # Assert
+            assert conditional_headers == [None, etag]
+            assert first.success and not first.revalidated
+            assert second.success and second.revalidated
+            assert second.status_code == 304
+            assert second.title == first.title == "快取頁面"
+            assert second.h1 == "標題"
+            assert stats['stored'] == 1
+            assert stats['revalidated'] == 1
+        finally:
+            await service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_streaming_read_stops_after_essential_content(self, scraper_service):
+        """測試串流模式在取得所需區塊後提前停止讀取。
+        
+        驗證：
+        - 取得 head、h1 與 main 後停止讀取
+        - SEO 元素仍正確提取
+        - 記錄略過的位元組數
+        """
+        # Arrange - main 之後附加大量頁尾內容
+        trailing = "<div>頁尾雜訊內容</div>" * 50000
+        html = (
+            "<html><head><title>串流測試</title>"
+            "<meta name='description' content='串流描述'></head>"
+            "<body><h1>主標題</h1><main><h2>副標題</h2><p>主要內容段落。</p></main>"
+            f"{trailing}</body></html>"
+        )
+        total_size = len(html.encode('utf-8'))
+        
+        async def handler(_request):
+            return web.Response(text=html, content_type="text/html")
+        
+        runner, base_url = await start_local_server({'/large': handler})
+        scraper_service.stream_read = True
+        
+        try:
+            # Act
+            result = await scraper_service.scrape_single_url(f"{base_url}/large")
+            
+            # Assert
+            assert result.success is True
+            assert result.title == "串流測試"
+            assert result.meta_description == "串流描述"
+            assert result.h1 == "主標題"
+            assert result.h2_list == ["副標題"]
+            assert result.truncated is True
+            assert result.bytes_read < total_size // 2
+            assert result.bytes_skipped == total_size - result.bytes_read
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_streaming_read_respects_byte_cap(self, scraper_service):
+        """測試串流模式的位元組上限。
+        
+        驗證：
+        - 讀取量不超過 max_content_bytes
+        - 無主要內容區時讀取至上限為止
+        """
+        # Arrange
+        html = "<html><head><title>上限測試</title></head><body>" + "<p>段落</p>" * 20000 + "</body></html>"
+        
+        async def handler(_request):
+            return web.Response(text=html, content_type="text/html")
+        
+        runner, base_url = await start_local_server({'/capped': handler})
+        scraper_service.stream_read = True
+        scraper_service.max_content_bytes = 10000
+        
+        try:
+            # Act
+            result = await scraper_service.scrape_single_url(f"{base_url}/capped")
+            
+            # Assert
+            assert result.success is True
+            assert result.title == "上限測試"
+            assert result.bytes_read == 10000
+            assert result.truncated is True
+            assert result.bytes_skipped == len(html.encode('utf-8')) - result.wire_bytes
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_compressed_response_records_wire_and_decoded_bytes(self, scraper_service):
+        """測試壓縮回應的解碼與位元組統計。
+
+        驗證：
+        - 請求標頭宣告可接受的內容編碼
+        - gzip 內容正確解碼並提取 SEO 元素
+        - 分別記錄傳輸與解碼後的位元組數
+        """
+        # Arrange
+        html = "<html><head><title>壓縮測試</title></head><body>" + "<p>重複段落</p>" * 2000 + "</body></html>"
+        raw = html.encode('utf-8')
+        compressed = gzip.compress(raw)
+        accept_encoding = []
+
+        async def handler(request):
+            accept_encoding.append(request.headers.get('Accept-Encoding', ''))
+            return web.Response(
+                body=compressed,
+                headers={'Content-Encoding': 'gzip', 'Content-Type': 'text/html; charset=utf-8'}
+            )
+
+        runner, base_url = await start_local_server({'/gzip': handler})
+
+        try:
+            # Act
+            result = await scraper_service.scrape_single_url(f"{base_url}/gzip")
+
+            # Assert
+            assert 'gzip' in accept_encoding[0]
+            assert result.success is True
+            assert result.title == "壓縮測試"
+            assert result.wire_bytes == len(compressed)
+            assert result.decoded_bytes == len(raw)
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_unsupported_content_encoding_fails_page(self, scraper_service):
+        """測試無法解碼的內容編碼回傳失敗結果而非錯誤內容。"""
+        # Arrange
+        async def handler(_request):
+            return web.Response(
+                body=b"\x00\x01binary",
+                headers={'Content-Encoding': 'x-unknown', 'Content-Type': 'text/html'}
+            )
+
+        runner, base_url = await start_local_server({'/unknown': handler})
+
+        try:
+            # Act
+            result = await scraper_service.scrape_single_url(f"{base_url}/unknown")
+
+            # Assert
+            assert result.success is False
+            assert "x-unknown" in result.error
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_dns_cache_shared_across_requests(self, scraper_service):
+        """測試連線器使用共用 DNS 快取。
+
+        驗證：
+        - 第一次連線實際查詢 DNS
+        - 新 Session 的連線重用快取的解析結果
+        """
+        # Arrange
+        async def handler(_request):
+            return web.Response(text="<html><title>DNS</title></html>", content_type="text/html")
+
+        runner, base_url = await start_local_server({'/dns': handler})
+        url = base_url.replace('127.0.0.1', 'localhost') + '/dns'
+        scraper_service.dns_resolver = CachingResolver(ttl=60)
+
+        try:
+            # Act - 每次關閉 Session，強制建立新連線
+            first = await scraper_service.scrape_single_url(url)
+            await scraper_service.close()
+            second = await scraper_service.scrape_single_url(url)
+            stats = scraper_service.get_dns_stats()
+
+            # Assert
+            assert first.success and second.success
+            assert stats['enabled'] is True
+            assert stats['misses'] == 1
+            assert stats['hits'] >= 1
+        finally:
+            await scraper_service.close()
+            await scraper_service.dns_resolver.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_html_store_refetches_when_stored_body_missing(self, mock_config, tmp_path):
+        """測試 304 時儲存內容已遺失，改發送一般請求重新取得。"""
+        # Arrange
+        mock_config.get_scraper_html_store_enabled.return_value = True
+        mock_config.get_scraper_html_store_dir.return_value = str(tmp_path)
+        mock_config.get_scraper_html_store_max_bytes.return_value = 1024 * 1024
+        with patch('app.services.scraper_service.get_config', return_value=mock_config):
+            service = ScraperService()
+
+        etag = '"v1"'
+        conditional_headers = []
+
+        async def handler(request):
+            conditional_headers.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == etag:
+                return web.Response(status=304, headers={'ETag': etag})
+            return web.Response(
+                text="<html><head><title>重新取得</title></head><body></body></html>",
+                content_type="text/html",
+                headers={'ETag': etag}
+            )
+
+        runner, base_url = await start_local_server({'/page': handler})
+
+        try:
+            # Act - 第一次取得後刪除儲存的內容檔
+            await service.scrape_single_url(f"{base_url}/page")
+            for path in tmp_path.glob("*.html"):
+                path.unlink()
+            result = await service.scrape_single_url(f"{base_url}/page")
+
+            # Assert
+            assert conditional_headers == [None, etag, None]
+            assert result.success is True
+            assert result.status_code == 200
+            assert result.title == "重新取得"
+            assert result.revalidated is False
+        finally:
+            await service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_unsolicited_304_is_reported_as_failure(self, scraper_service):
+        """測試未發送條件式請求卻收到 304 時回傳失敗而非空白內容。"""
+        # Arrange
+        async def handler(_request):
+            return web.Response(status=304)
+
+        runner, base_url = await start_local_server({'/not-modified': handler})
+
+        try:
+            # Act
+            result = await scraper_service.scrape_single_url(f"{base_url}/not-modified")
+
+            # Assert
+            assert result.success is False
+            assert result.status_code == 304
+            assert "304" in result.error
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_quorum_returns_without_waiting_for_slow_pages(self, scraper_service):
+        """測試達到成功頁數門檻後立即回傳。
+
+        驗證：
+        - 不等待緩慢的頁面
+        - 未完成的 URL 在 errors 中標記為 Skipped
+        """
+        # Arrange
+        async def fast_handler(_request):
+            return web.Response(text="<html><title>快</title></html>", content_type="text/html")
+
+        async def slow_handler(_request):
+            await asyncio.sleep(1.5)
+            return web.Response(text="<html><title>慢</title></html>", content_type="text/html")
+
+        runner, base_url = await start_local_server({
+            '/fast/{index}': fast_handler,
+            '/slow': slow_handler,
+        })
+        urls = [f"{base_url}/fast/1", f"{base_url}/slow", f"{base_url}/fast/2"]
+
+        try:
+            # Act
+            started = time.time()
+            result = await scraper_service.scrape_urls(urls, min_success=2)
+            elapsed = time.time() - started
+
+            # Assert
+            assert elapsed < 1.0
+            assert result.total_results == 3
+            assert result.successful_scrapes == 2
+            assert result.errors == [{
+                'url': f"{base_url}/slow",
+                'error': "已略過：已取得 2 個成功頁面",
+                'error_type': 'Skipped',
+            }]
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_remaining_fetches(self, scraper_service):
+        """測試超過截止時間時回傳已完成的頁面並取消其餘爬取。"""
+        # Arrange
+        async def fast_handler(_request):
+            return web.Response(text="<html><title>快</title></html>", content_type="text/html")
+
+        async def slow_handler(_request):
+            await asyncio.sleep(1.5)
+            return web.Response(text="<html><title>慢</title></html>", content_type="text/html")
+
+        runner, base_url = await start_local_server({'/fast': fast_handler, '/slow': slow_handler})
+
+        try:
+            # Act
+            started = time.time()
+            result = await scraper_service.scrape_urls(
+                [f"{base_url}/fast", f"{base_url}/slow"], deadline=0.3
+            )
+            elapsed = time.time() - started
+
+            # Assert - 被取消的爬取已釋放連線
+            assert elapsed < 1.0
+            assert scraper_service.get_pool_stats()['in_use'] == 0
+            assert result.successful_scrapes == 1
+            assert result.errors[0]['error_type'] == 'Skipped'
+            assert "截止時間" in result.errors[0]['error']
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_wins_over_stuck_primary(self, scraper_service):
+        """測試主要請求卡住時，對沖請求先完成並取消主要請求。"""
+        # Arrange - 第一個請求卡住，之後的請求立即回應
+        calls = []
+
+        async def handler(_request):
+            calls.append(time.time())
+            if len(calls) == 1:
+                await asyncio.sleep(1.5)
+            return web.Response(text="<html><title>對沖</title></html>", content_type="text/html")
+
+        runner, base_url = await start_local_server({'/page': handler})
+        scraper_service.hedge_policy = HedgePolicy(percentile=95, budget=1.0, min_samples=1)
+        scraper_service.hedge_policy.record(0.05)
+
+        try:
+            # Act
+            started = time.time()
+            result = await scraper_service.scrape_single_url(f"{base_url}/page")
+            elapsed = time.time() - started
+
+            # Assert
+            stats = scraper_service.get_hedge_stats()
+            assert result.success is True
+            assert result.title == "對沖"
+            assert elapsed < 1.0
+            assert len(calls) == 2
+            assert stats['hedged'] == 1
+            assert stats['won'] == 1
+            assert scraper_service.get_pool_stats()['in_use'] == 0
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_hedge_budget_exhausted_waits_for_primary(self, scraper_service):
+        """測試對沖預算用盡時只等待主要請求。"""
+        # Arrange
+        calls = []
+
+        async def handler(_request):
+            calls.append(time.time())
+            await asyncio.sleep(0.2)
+            return web.Response(text="<html><title>慢</title></html>", content_type="text/html")
+
+        runner, base_url = await start_local_server({'/page': handler})
+        scraper_service.hedge_policy = HedgePolicy(percentile=95, budget=0.0, min_samples=1)
+        scraper_service.hedge_policy.record(0.01)
+
+        try:
+            # Act
+            result = await scraper_service.scrape_single_url(f"{base_url}/page")
+
+            # Assert
+            stats = scraper_service.get_hedge_stats()
+            assert result.success is True
+            assert len(calls) == 1
+            assert stats['hedged'] == 0
+            assert stats['denied'] == 1
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_hedge_respects_per_host_limit(self, scraper_service):
+        """測試主機名額已滿時不發出對沖請求，也不消耗對沖預算。"""
+        # Arrange - 每主機只允許 1 個並行請求，主要請求已佔用
+        calls = []
+
+        async def handler(_request):
+            calls.append(time.time())
+            await asyncio.sleep(0.2)
+            return web.Response(text="<html><title>慢</title></html>", content_type="text/html")
+
+        runner, base_url = await start_local_server({'/page': handler})
+        scraper_service.host_scheduler = HostScheduler(per_host_limit=1, min_delay=0.0)
+        scraper_service.hedge_policy = HedgePolicy(percentile=95, budget=1.0, min_samples=1)
+        scraper_service.hedge_policy.record(0.01)
+        gate = asyncio.Semaphore(10)
+
+        try:
+            # Act
+            result = await scraper_service._scrape_single_url_with_semaphore(gate, f"{base_url}/page")
+
+            # Assert
+            stats = scraper_service.get_hedge_stats()
+            assert result.success is True
+            assert len(calls) == 1
+            assert stats['hedged'] == 0
+            assert stats['no_slot'] == 1
+            assert not gate.locked()
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_hedge_takes_host_and_global_slot(self, scraper_service):
+        """測試對沖請求佔用主機與全域名額，結束後歸還。"""
+        # Arrange
+        calls = []
+        peak_gate = []
+        gate = asyncio.Semaphore(2)
+
+        async def handler(_request):
+            calls.append(time.time())
+            peak_gate.append(gate.locked())
+            if len(calls) == 1:
+                await asyncio.sleep(1.0)
+            return web.Response(text="<html><title>對沖</title></html>", content_type="text/html")
+
+        runner, base_url = await start_local_server({'/page': handler})
+        scraper_service.host_scheduler = HostScheduler(per_host_limit=2, min_delay=0.0)
+        scraper_service.hedge_policy = HedgePolicy(percentile=95, budget=1.0, min_samples=1)
+        scraper_service.hedge_policy.record(0.05)
+
+        try:
+            # Act
+            result = await scraper_service._scrape_single_url_with_semaphore(gate, f"{base_url}/page")
+
+            # Assert - 對沖請求開始時兩個全域名額皆被佔用
+            assert result.success is True
+            assert len(calls) == 2
+            assert peak_gate == [False, True]
+            assert scraper_service.get_hedge_stats()['hedged'] == 1
+            assert not gate.locked()
+            assert scraper_service.host_scheduler.get_stats()['busy_hosts'] == {}
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_adaptive_timeout_learned_per_domain(self, scraper_service):
+        """測試平常很快的網域使用較緊的逾時，並記錄逾時的請求。"""
+        # Arrange - 先累積快速回應的延遲樣本，再讓同網域的請求卡住
+        async def fast_handler(_request):
+            return web.Response(text="<html><title>快</title></html>", content_type="text/html")
+
+        async def stuck_handler(_request):
+            await asyncio.sleep(1.5)
+            return web.Response(text="<html><title>慢</title></html>", content_type="text/html")
+
+        runner, base_url = await start_local_server({'/fast': fast_handler, '/stuck': stuck_handler})
+        scraper_service.max_retries = 1
+        scraper_service.domain_timeouts = DomainTimeoutTracker(
+            default=10.0, floor=0.3, cap=5.0, min_samples=3
+        )
+
+        try:
+            for _ in range(3):
+                assert (await scraper_service.scrape_single_url(f"{base_url}/fast")).success
+
+            # Act
+            started = time.time()
+            result = await scraper_service.scrape_single_url(f"{base_url}/stuck")
+            elapsed = time.time() - started
+
+            # Assert
+            domain = scraper_service.get_timeout_stats()['domains']['127.0.0.1']
+            assert result.success is False
+            assert "逾時" in result.error
+            assert elapsed < 1.0
+            assert domain['samples'] == 3
+            assert domain['timeouts'] == 1
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast_without_request(self, scraper_service):
+        """測試網域斷路器開啟後，該網域的 URL 不送出請求即失敗。"""
+        # Arrange
+        calls = []
+
+        async def down_handler(_request):
+            calls.append(time.time())
+            return web.Response(status=503, text="Service Unavailable")
+
+        runner, base_url = await start_local_server({'/a': down_handler, '/b': down_handler})
+        scraper_service.circuit_breaker = CircuitBreaker(min_failures=2, cooldown=60)
+
+        try:
+            first = await scraper_service.scrape_urls([f"{base_url}/a", f"{base_url}/b"])
+            assert [error['error_type'] for error in first.errors] == ['ScrapingError'] * 2
+
+            # Act
+            started = time.time()
+            result = await scraper_service.scrape_urls([f"{base_url}/a", f"{base_url}/b"])
+            elapsed = time.time() - started
+
+            # Assert
+            stats = scraper_service.get_circuit_stats()
+            assert len(calls) == 2
+            assert elapsed < 0.5
+            assert [error['error_type'] for error in result.errors] == ['CircuitOpen'] * 2
+            assert "斷路器" in result.errors[0]['error']
+            assert stats['open'] == 1
+            assert stats['domains']['127.0.0.1']['rejected'] == 2
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_scrape_urls_iter_yields_in_completion_order(self, scraper_service):
+        """測試串流爬取依完成順序產生頁面並附帶累計統計。"""
+        # Arrange
+        def make_handler(delay, body):
+            async def handler(_request):
+                await asyncio.sleep(delay)
+                return web.Response(text=body, content_type="text/html")
+            return handler
+
+        runner, base_url = await start_local_server({
+            '/slow': make_handler(0.4, "<html><body><p>一 二 三 四</p></body></html>"),
+            '/fast': make_handler(0.0, "<html><body><p>一 二</p></body></html>"),
+        })
+        urls = [f"{base_url}/slow", f"{base_url}/fast", f"{base_url}/nothing-here"]
+
+        try:
+            # Act
+            progress = [item async for item in scraper_service.scrape_urls_iter(urls)]
+
+            # Assert
+            assert all(isinstance(item, ScrapeProgress) for item in progress)
+            assert [item.page.url for item in progress][-1] == f"{base_url}/slow"
+            assert [item.completed for item in progress] == [1, 2, 3]
+            assert progress[-1].total_results == 3
+            assert progress[-1].successful_scrapes == 2
+            failed = [item for item in progress if item.error is not None]
+            assert len(failed) == 1
+            assert failed[0].page.success is False
+            assert failed[0].error['error_type'] == 'ScrapingError'
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_scrape_urls_iter_break_cancels_remaining(self, scraper_service):
+        """測試提前結束迭代時取消其餘爬取並釋放連線。"""
+        # Arrange
+        async def fast_handler(_request):
+            return web.Response(text="<html><title>快</title></html>", content_type="text/html")
+
+        async def slow_handler(_request):
+            await asyncio.sleep(1.5)
+            return web.Response(text="<html><title>慢</title></html>", content_type="text/html")
+
+        runner, base_url = await start_local_server({'/fast': fast_handler, '/slow': slow_handler})
+
+        try:
+            # Act
+            started = time.time()
+            iterator = scraper_service.scrape_urls_iter([f"{base_url}/slow", f"{base_url}/fast"])
+            async for progress in iterator:
+                first = progress
+                break
+            await iterator.aclose()
+            elapsed = time.time() - started
+
+            # Assert
+            assert first.page.title == "快"
+            assert elapsed < 1.0
+            assert scraper_service.get_pool_stats()['in_use'] == 0
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_charset_from_meta_without_header(self, scraper_service):
+        """測試標頭未宣告編碼時，以 meta 預掃描判定編碼並直接解析位元組。"""
+        # Arrange
+        body = '<html><head><meta charset="big5"><title>繁體中文頁面</title></head></html>'.encode('big5')
+
+        async def handler(_request):
+            return web.Response(body=body, headers={'Content-Type': 'text/html'})
+
+        runner, base_url = await start_local_server({'/big5': handler})
+
+        try:
+            # Act
+            result = await scraper_service.scrape_single_url(f"{base_url}/big5")
+
+            # Assert
+            assert result.success is True
+            assert result.charset == 'big5'
+            assert result.title == "繁體中文頁面"
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_robots_disallowed_url_not_requested(self, scraper_service):
+        """測試 robots.txt 不允許的 URL 不發出請求，並標記為 RobotsDisallowed。"""
+        # Arrange
+        calls = []
+
+        async def robots_handler(_request):
+            return web.Response(text="User-agent: *\nDisallow: /private\n")
+
+        async def page_handler(request):
+            calls.append(request.path)
+            return web.Response(text="<html><title>頁面</title></html>", content_type="text/html")
+
+        runner, base_url = await start_local_server({
+            '/robots.txt': robots_handler,
+            '/private/page': page_handler,
+            '/public/page': page_handler,
+        })
+        scraper_service.robots = RobotsCache()
+
+        try:
+            # Act
+            result = await scraper_service.scrape_urls([
+                f"{base_url}/private/page", f"{base_url}/public/page"
+            ])
+
+            # Assert
+            assert calls == ['/public/page']
+            assert result.successful_scrapes == 1
+            assert result.errors[0]['error_type'] == 'RobotsDisallowed'
+            assert scraper_service.get_robots_stats()['fetches'] == 1
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_non_html_response_not_downloaded(self, scraper_service):
+        """測試非 HTML 回應依 Content-Type 在讀取內容前即放棄。"""
+        # Arrange
+        async def image_handler(_request):
+            return web.Response(body=b"\x89PNG" + b"0" * 500_000, content_type="image/png")
+
+        runner, base_url = await start_local_server({'/logo.png': image_handler})
+
+        try:
+            # Act
+            result = await scraper_service.scrape_single_url(f"{base_url}/logo.png")
+
+            # Assert
+            assert result.success is False
+            assert result.status_code == 200
+            assert result.content_type == "image/png"
+            assert "非 HTML" in result.error
+            assert result.wire_bytes == 0
+            assert scraper_service.get_parser_stats()['completed'] == 0
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_oversized_html_read_truncated(self, scraper_service):
+        """測試 Content-Length 超過上限的 HTML 以串流截斷讀取。"""
+        # Arrange
+        body = "<html><head><title>大型頁面</title></head><body>" + "<p>段落</p>" * 20000 + "</body></html>"
+
+        async def handler(_request):
+            return web.Response(text=body, content_type="text/html")
+
+        runner, base_url = await start_local_server({'/big': handler})
+        scraper_service.max_content_bytes = 32 * 1024
+
+        try:
+            # Act
+            result = await scraper_service.scrape_single_url(f"{base_url}/big")
+
+            # Assert
+            assert result.success is True
+            assert result.title == "大型頁面"
+            assert result.truncated is True
+            assert result.decoded_bytes == 32 * 1024
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_pdf_over_cap_not_downloaded(self, scraper_service):
+        """測試 PDF 超過位元組上限時不下載也不解析。"""
+        # Arrange
+        async def pdf_handler(_request):
+            return web.Response(body=b"%PDF-1.4" + b"0" * 200_000, content_type="application/pdf")
+
+        runner, base_url = await start_local_server({'/doc.pdf': pdf_handler})
+        scraper_service.pdf_enabled = True
+        scraper_service.pdf_max_bytes = 100_000
+
+        try:
+            # Act
+            result = await scraper_service.scrape_single_url(f"{base_url}/doc.pdf")
+
+            # Assert
+            assert result.success is False
+            assert "PDF 超過" in result.error
+            assert result.content_type == "application/pdf"
+        finally:
+            await scraper_service.close()
+            await runner.cleanup()
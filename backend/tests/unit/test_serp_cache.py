@@ -0,0 +1,210 @@
+"""SERP 快取單元測試。
+
+測試快取鍵值正規化、記憶體與磁碟兩層命中、TTL 過期、LRU 淘汰，
+以及 SerpService 的快取命中與強制重新整理。
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.services.serp_cache import SerpCache
+from app.services.serp_service import InvalidAPIKeyException, SerpService
+
+
+class FakeClock:
+    """可手動推進的假時鐘。"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+PARAMS = {"q": "SEO 工具", "engine": "google", "num": 10, "hl": "zh-tw", "gl": "tw",
+          "location": "Taiwan", "api_key": "secret"}
+RESPONSE = {"organic_results": [{"position": 1, "title": "T", "link": "https://a.com", "snippet": "S"}]}
+
+
+class TestCacheKey:
+    """快取鍵值測試類別。"""
+
+    def test_ignores_api_key_and_output(self):
+        """測試 api_key 與輸出格式不影響鍵值。"""
+        other = {**PARAMS, "api_key": "another", "output": "json"}
+        assert SerpCache.cache_key(PARAMS) == SerpCache.cache_key(other)
+
+    def test_normalizes_query_and_order(self):
+        """測試查詢字詞的大小寫、空白與參數順序不影響鍵值。"""
+        reordered = dict(reversed(list({**PARAMS, "q": "  seo   工具 "}.items())))
+        assert SerpCache.cache_key(PARAMS) == SerpCache.cache_key(reordered)
+
+    def test_distinguishes_search_params(self):
+        """測試地點、語言與結果數不同時鍵值不同。"""
+        key = SerpCache.cache_key(PARAMS)
+        assert SerpCache.cache_key({**PARAMS, "location": "United States"}) != key
+        assert SerpCache.cache_key({**PARAMS, "hl": "en"}) != key
+        assert SerpCache.cache_key({**PARAMS, "num": 20}) != key
+
+
+class TestSerpCache:
+    """兩層快取測試類別。"""
+
+    @pytest.mark.asyncio
+    async def test_memory_hit_returns_copy(self):
+        """測試記憶體層命中回傳副本。"""
+        cache = SerpCache()
+        await cache.put(PARAMS, RESPONSE)
+
+        data = await cache.get(PARAMS)
+        data["organic_results"].clear()
+
+        assert (await cache.get(PARAMS)) == RESPONSE
+        stats = cache.get_stats()
+        assert stats['memory_hits'] == 2
+        assert stats['persistent'] is False
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        """測試超過 TTL 的項目視為未命中。"""
+        clock = FakeClock()
+        cache = SerpCache(ttl=60, clock=clock)
+        await cache.put(PARAMS, RESPONSE)
+
+        clock.now += 61
+        assert await cache.get(PARAMS) is None
+
+        stats = cache.get_stats()
+        assert stats['expired'] == 1
+        assert stats['misses'] == 1
+        assert stats['entries'] == 0
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        """測試新的快取實例由磁碟層命中並回填記憶體層。"""
+        await SerpCache(directory=str(tmp_path)).put(PARAMS, RESPONSE)
+        assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+        cache = SerpCache(directory=str(tmp_path))
+        assert await cache.get(PARAMS) == RESPONSE
+        assert await cache.get(PARAMS) == RESPONSE
+
+        stats = cache.get_stats()
+        assert stats['disk_hits'] == 1
+        assert stats['memory_hits'] == 1
+        assert stats['hit_rate'] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_expired_disk_entry_is_removed(self, tmp_path):
+        """測試過期的磁碟層項目於讀取時刪除。"""
+        clock = FakeClock()
+        await SerpCache(ttl=60, directory=str(tmp_path), clock=clock).put(PARAMS, RESPONSE)
+
+        clock.now += 61
+        cache = SerpCache(ttl=60, directory=str(tmp_path), clock=clock)
+        assert await cache.get(PARAMS) is None
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.asyncio
+    async def test_corrupt_disk_entry_is_miss(self, tmp_path):
+        """測試格式錯誤的磁碟層項目視為未命中。"""
+        key = SerpCache.cache_key(PARAMS)
+        (tmp_path / f"{key}.json").write_text("{not json", encoding="utf-8")
+
+        cache = SerpCache(directory=str(tmp_path))
+        assert await cache.get(PARAMS) is None
+        assert cache.get_stats()['disk_errors'] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """測試記憶體層超過上限時淘汰最久未使用的項目。"""
+        cache = SerpCache(max_entries=2)
+        first, second, third = ({**PARAMS, "q": q} for q in ("a", "b", "c"))
+        await cache.put(first, RESPONSE)
+        await cache.put(second, RESPONSE)
+        await cache.get(first)
+        await cache.put(third, RESPONSE)
+
+        assert await cache.get(second) is None
+        assert await cache.get(first) is not None
+        assert cache.get_stats()['evicted'] == 1
+
+
+class TestSerpServiceCache:
+    """SerpService 快取整合測試類別。"""
+
+    @pytest.fixture
+    def serp_service(self, tmp_path):
+        """啟用 SERP 快取的 SerpService 實例。"""
+        config_mock = Mock()
+        config_mock.get_serp_api_key.return_value = "test_api_key"
+        config_mock.get_serp_search_engine.return_value = "google"
+        config_mock.get_serp_location.return_value = "Taiwan"
+        config_mock.get_serp_language.return_value = "zh-tw"
+        config_mock.get_serp_page_size.return_value = 10
+        config_mock.get_serp_timeout.return_value = 30.0
+        config_mock.get_serp_pool_limit.return_value = 20
+        config_mock.get_serp_cache_enabled.return_value = True
+        config_mock.get_serp_cache_ttl.return_value = 86400.0
+        config_mock.get_serp_cache_max_entries.return_value = 512
+        config_mock.get_serp_cache_dir.return_value = str(tmp_path)
+        config_mock.get_serp_rate_limit.return_value = 0.0
+        config_mock.get_serp_rate_burst.return_value = 5
+        config_mock.get_serp_monthly_quota.return_value = 0
+        config_mock.get_serp_queue_timeout.return_value = 30.0
+        config_mock.get_retry_budget_ratio.return_value = 0.2
+        config_mock.get_retry_budget_reserve.return_value = 10.0
+        config_mock.get_retry_max_delay.return_value = 30.0
+        with patch('app.services.serp_service.get_config', return_value=config_mock):
+            return SerpService()
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_uses_cache(self, serp_service):
+        """測試相同搜尋只呼叫一次 SerpAPI，命中時以呼叫端關鍵字解析。"""
+        with patch.object(SerpService, '_fetch_search_data', return_value=RESPONSE) as fetch:
+            first = await serp_service.search_keyword("SEO 工具")
+            second = await serp_service.search_keyword("seo 工具")
+
+        assert fetch.await_count == 1
+        assert first.organic_results == second.organic_results
+        assert second.keyword == "seo 工具"
+        stats = serp_service.get_cache_stats()
+        assert stats['enabled'] is True
+        assert stats['memory_hits'] == 1
+        assert stats['misses'] == 1
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_bypasses_cache(self, serp_service):
+        """測試強制重新整理時重新搜尋並更新快取。"""
+        refreshed = {"organic_results": [{"position": 1, "title": "新", "link": "https://b.com", "snippet": "S"}]}
+        with patch.object(SerpService, '_fetch_search_data', side_effect=[RESPONSE, refreshed]) as fetch:
+            await serp_service.search_keyword("SEO 工具")
+            result = await serp_service.search_keyword("SEO 工具", force_refresh=True)
+            cached = await serp_service.search_keyword("SEO 工具")
+
+        assert fetch.await_count == 2
+        assert result.organic_results[0].link == "https://b.com"
+        assert cached.organic_results[0].link == "https://b.com"
+        assert serp_service.get_cache_stats()['refreshes'] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_search_is_not_cached(self, serp_service):
+        """測試 SerpAPI 回傳錯誤時不寫入快取。"""
+        with patch.object(SerpService, '_fetch_search_data', return_value={"error": "Invalid API key"}):
+            with pytest.raises(InvalidAPIKeyException):
+                await serp_service.search_keyword("SEO 工具")
+
+        assert serp_service.get_cache_stats()['stored'] == 0
@@ -9,8 +9,9 @@ import asyncio
 import time
 import sys
 from pathlib import Path
-from unittest.mock import Mock, patch
-from serpapi.google_search import GoogleSearch
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
 
 # 確保可以從不同的工作目錄執行測試
 # 動態添加 backend 目錄到 Python 路徑
@@ -43,6 +44,20 @@ class TestSerpService:
         config_mock.get_serp_search_engine.return_value = "google"
         config_mock.get_serp_location.return_value = "Taiwan"
         config_mock.get_serp_language.return_value = "zh-tw"
+        config_mock.get_serp_page_size.return_value = 10
+        config_mock.get_serp_timeout.return_value = 30.0
+        config_mock.get_serp_pool_limit.return_value = 20
+        config_mock.get_serp_cache_enabled.return_value = False
+        config_mock.get_serp_cache_ttl.return_value = 86400.0
+        config_mock.get_serp_cache_max_entries.return_value = 512
+        config_mock.get_serp_cache_dir.return_value = ""
+        config_mock.get_serp_rate_limit.return_value = 0.0
+        config_mock.get_serp_rate_burst.return_value = 5
+        config_mock.get_serp_monthly_quota.return_value = 0
+        config_mock.get_serp_queue_timeout.return_value = 30.0
+        config_mock.get_retry_budget_ratio.return_value = 0.2
+        config_mock.get_retry_budget_reserve.return_value = 10.0
+        config_mock.get_retry_max_delay.return_value = 30.0
         return config_mock
 
     @pytest.fixture
@@ -87,7 +102,7 @@ class TestSerpService:
         # Arrange
         keyword = "SEO 優化指南"
         
-        with patch.object(GoogleSearch, 'get_dict', return_value=mock_serp_response):
+        with patch.object(SerpService, '_fetch_search_data', return_value=mock_serp_response):
             start_time = time.time()
             
             # Act
@@ -130,7 +145,7 @@ class TestSerpService:
             "數位行銷策略",  # 繁體中文含數字
         ]
         
-        with patch.object(GoogleSearch, 'get_dict', return_value=mock_serp_response):
+        with patch.object(SerpService, '_fetch_search_data', return_value=mock_serp_response):
             for keyword in test_cases:
                 # Act
                 result = await serp_service.search_keyword(keyword)
@@ -155,7 +170,7 @@ class TestSerpService:
         def slow_api_call(*args, **kwargs):
             raise Exception("Connection timeout")
             
-        with patch.object(GoogleSearch, 'get_dict', side_effect=slow_api_call):
+        with patch.object(SerpService, '_fetch_search_data', side_effect=slow_api_call):
             # Act & Assert
             with pytest.raises(SearchFailedException) as exc_info:
                 await serp_service.search_keyword(keyword)
@@ -174,7 +189,7 @@ class TestSerpService:
         keyword = "test keyword"
         rate_limit_error = Exception("Rate limit exceeded")
         
-        with patch.object(GoogleSearch, 'get_dict', side_effect=rate_limit_error):
+        with patch.object(SerpService, '_fetch_search_data', side_effect=rate_limit_error):
             # Act & Assert
             with pytest.raises(RateLimitException) as exc_info:
                 await serp_service.search_keyword(keyword)
@@ -193,7 +208,7 @@ class TestSerpService:
         keyword = "test keyword" 
         auth_error = Exception("Invalid API key")
         
-        with patch.object(GoogleSearch, 'get_dict', side_effect=auth_error):
+        with patch.object(SerpService, '_fetch_search_data', side_effect=auth_error):
             # Act & Assert
             with pytest.raises(InvalidAPIKeyException) as exc_info:
                 await serp_service.search_keyword(keyword)
@@ -212,7 +227,7 @@ class TestSerpService:
         keyword = "極罕見關鍵字無結果"
         empty_response = {"organic_results": []}
         
-        with patch.object(GoogleSearch, 'get_dict', return_value=empty_response):
+        with patch.object(SerpService, '_fetch_search_data', return_value=empty_response):
             # Act
             result = await serp_service.search_keyword(keyword)
             
@@ -234,7 +249,7 @@ class TestSerpService:
         # Arrange
         keywords = [f"關鍵字{i}" for i in range(1, 6)]  # 5個關鍵字
         
-        with patch.object(GoogleSearch, 'get_dict', return_value=mock_serp_response):
+        with patch.object(SerpService, '_fetch_search_data', return_value=mock_serp_response):
             # Act
             tasks = [serp_service.search_keyword(kw) for kw in keywords]
             results = await asyncio.gather(*tasks)
@@ -301,7 +316,7 @@ class TestSerpService:
             }
         }
         
-        with patch.object(GoogleSearch, 'get_dict', return_value=response_with_metadata):
+        with patch.object(SerpService, '_fetch_search_data', return_value=response_with_metadata):
             # Act
             result = await serp_service.search_keyword(keyword)
             
@@ -309,4 +324,371 @@ class TestSerpService:
             # 檢查 search_metadata 中的處理時間
             assert result.search_metadata is not None
             assert result.search_metadata.get('total_time_taken') == 2.5
-            assert result.search_metadata.get('engine_used') == 'google'
\ No newline at end of file
+            assert result.search_metadata.get('engine_used') == 'google'
+
+class TestSerpHTTPClient:
+    """SerpAPI 原生非同步客戶端測試類別。"""
+
+    @pytest.fixture
+    def serp_service(self):
+        """SerpService 實例 fixture。"""
+        config_mock = Mock()
+        config_mock.get_serp_api_key.return_value = "test_api_key"
+        config_mock.get_serp_search_engine.return_value = "google"
+        config_mock.get_serp_location.return_value = "Taiwan"
+        config_mock.get_serp_language.return_value = "zh-tw"
+        config_mock.get_serp_page_size.return_value = 10
+        config_mock.get_serp_timeout.return_value = 30.0
+        config_mock.get_serp_pool_limit.return_value = 20
+        config_mock.get_serp_cache_enabled.return_value = False
+        config_mock.get_serp_cache_ttl.return_value = 86400.0
+        config_mock.get_serp_cache_max_entries.return_value = 512
+        config_mock.get_serp_cache_dir.return_value = ""
+        config_mock.get_serp_rate_limit.return_value = 0.0
+        config_mock.get_serp_rate_burst.return_value = 5
+        config_mock.get_serp_monthly_quota.return_value = 0
+        config_mock.get_serp_queue_timeout.return_value = 30.0
+        config_mock.get_retry_budget_ratio.return_value = 0.2
+        config_mock.get_retry_budget_reserve.return_value = 10.0
+        config_mock.get_retry_max_delay.return_value = 30.0
+        with patch('app.services.serp_service.get_config', return_value=config_mock):
+            return SerpService()
+
+    @staticmethod
+    def use_transport(service, handler):
+        """讓服務的共用客戶端改用模擬傳輸層。"""
+        service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service._client_loop = asyncio.get_running_loop()
+        return service._client
+
+    @pytest.mark.asyncio
+    async def test_search_uses_shared_client(self, serp_service):
+        """測試搜尋以共用客戶端送出 JSON 請求，並重用同一個客戶端。"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={
+                "organic_results": [
+                    {"position": 1, "title": "T", "link": "https://a.com", "snippet": "S"}
+                ],
+                "search_information": {"total_results": "1"}
+            })
+
+        client = self.use_transport(serp_service, handler)
+        try:
+            first = await serp_service.search_keyword("SEO 工具")
+            await serp_service.search_keyword("SEO 工具")
+
+            assert isinstance(first, SerpResult)
+            assert first.organic_results[0].link == "https://a.com"
+            assert serp_service._get_client() is client
+            assert len(requests) == 2
+            params = requests[0].url.params
+            assert requests[0].url.path == "/search"
+            assert params["q"] == "SEO 工具"
+            assert params["output"] == "json"
+            assert params["api_key"] == "test_api_key"
+        finally:
+            await serp_service.close()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_json_error_body_is_validated(self, serp_service):
+        """測試 HTTP 錯誤回應中的 JSON error 欄位轉為對應例外。"""
+        def handler(_request):
+            return httpx.Response(401, json={"error": "Invalid API key. Your API key should be here"})
+
+        self.use_transport(serp_service, handler)
+        try:
+            with pytest.raises(InvalidAPIKeyException):
+                await serp_service.search_keyword("test")
+        finally:
+            await serp_service.close()
+
+    @pytest.mark.asyncio
+    async def test_non_json_error_is_retried(self, serp_service):
+        """測試非 JSON 的伺服器錯誤會重試，耗盡後拋出 SearchFailedException。"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(502, text="Bad Gateway")
+
+        self.use_transport(serp_service, handler)
+        try:
+            with patch('app.services.serp_service.asyncio.sleep', new=AsyncMock()):
+                with pytest.raises(SearchFailedException) as exc_info:
+                    await serp_service.search_keyword("test")
+            assert "502" in str(exc_info.value)
+            assert len(calls) == serp_service.max_retries
+        finally:
+            await serp_service.close()
+
+    @pytest.mark.asyncio
+    async def test_search_is_cancellable(self, serp_service):
+        """測試取消搜尋時請求立即中止。"""
+        started = asyncio.Event()
+
+        async def handler(_request):
+            started.set()
+            await asyncio.sleep(30)
+            return httpx.Response(200, json={})
+
+        self.use_transport(serp_service, handler)
+        try:
+            task = asyncio.ensure_future(serp_service.search_keyword("test"))
+            await asyncio.wait_for(started.wait(), 1)
+            task.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(task, 1)
+        finally:
+            await serp_service.close()
+
+
+class TestSerpCoalescing:
+    """並行相同搜尋合併測試類別。"""
+
+    RESPONSE = {"organic_results": [{"position": 1, "title": "T", "link": "https://a.com", "snippet": "S"}]}
+
+    @pytest.fixture
+    def serp_service(self):
+        """SerpService 實例 fixture。"""
+        config_mock = Mock()
+        config_mock.get_serp_api_key.return_value = "test_api_key"
+        config_mock.get_serp_search_engine.return_value = "google"
+        config_mock.get_serp_location.return_value = "Taiwan"
+        config_mock.get_serp_language.return_value = "zh-tw"
+        config_mock.get_serp_page_size.return_value = 10
+        config_mock.get_serp_timeout.return_value = 30.0
+        config_mock.get_serp_pool_limit.return_value = 20
+        config_mock.get_serp_cache_enabled.return_value = False
+        config_mock.get_serp_cache_ttl.return_value = 86400.0
+        config_mock.get_serp_cache_max_entries.return_value = 512
+        config_mock.get_serp_cache_dir.return_value = ""
+        config_mock.get_serp_rate_limit.return_value = 0.0
+        config_mock.get_serp_rate_burst.return_value = 5
+        config_mock.get_serp_monthly_quota.return_value = 0
+        config_mock.get_serp_queue_timeout.return_value = 30.0
+        config_mock.get_retry_budget_ratio.return_value = 0.2
+        config_mock.get_retry_budget_reserve.return_value = 10.0
+        config_mock.get_retry_max_delay.return_value = 30.0
+        with patch('app.services.serp_service.get_config', return_value=config_mock):
+            return SerpService()
+
+    @staticmethod
+    def gated_fetch(release, result):
+        """等待 release 事件後才回傳的 SerpAPI 請求，確保呼叫彼此重疊。"""
+        async def fetch(_params):
+            await release.wait()
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return fetch
+
+    @pytest.mark.asyncio
+    async def test_identical_searches_share_one_request(self, serp_service):
+        """測試相同參數的並行搜尋只發出一次請求並取得相同結果。"""
+        release = asyncio.Event()
+        fetch = AsyncMock(side_effect=self.gated_fetch(release, self.RESPONSE))
+
+        with patch.object(SerpService, '_fetch_search_data', new=fetch):
+            tasks = [asyncio.ensure_future(serp_service.search_keyword(q))
+                     for q in ("SEO 工具", "seo 工具", "SEO  工具", "SEO 工具", "SEO 工具")]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert fetch.await_count == 1
+        assert all(r.organic_results == results[0].organic_results for r in results)
+        assert results[1].keyword == "seo 工具"
+        stats = serp_service.get_coalescing_stats()
+        assert stats['upstream'] == 1
+        assert stats['coalesced'] == 4
+        assert stats['in_flight'] == 0
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared(self, serp_service):
+        """測試上游錯誤傳遞給所有等待中的呼叫。"""
+        release = asyncio.Event()
+        fetch = AsyncMock(side_effect=self.gated_fetch(release, {"error": "Invalid API key"}))
+
+        with patch.object(SerpService, '_fetch_search_data', new=fetch):
+            tasks = [asyncio.ensure_future(serp_service.search_keyword("test")) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert fetch.await_count == 1
+        assert all(isinstance(r, InvalidAPIKeyException) for r in results)
+        assert serp_service.get_coalescing_stats()['in_flight'] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_params_not_coalesced(self, serp_service):
+        """測試不同關鍵字或地點的搜尋各自請求。"""
+        release = asyncio.Event()
+        fetch = AsyncMock(side_effect=self.gated_fetch(release, self.RESPONSE))
+
+        with patch.object(SerpService, '_fetch_search_data', new=fetch):
+            tasks = [
+                asyncio.ensure_future(serp_service.search_keyword("a")),
+                asyncio.ensure_future(serp_service.search_keyword("b")),
+                asyncio.ensure_future(serp_service.search_keyword("a", location="Japan")),
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(*tasks)
+
+        assert fetch.await_count == 3
+        assert serp_service.get_coalescing_stats()['coalesced'] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_keeps_request(self, serp_service):
+        """測試取消其中一個呼叫不影響其他等待者，全部取消時中止請求。"""
+        release = asyncio.Event()
+        fetch = AsyncMock(side_effect=self.gated_fetch(release, self.RESPONSE))
+
+        with patch.object(SerpService, '_fetch_search_data', new=fetch):
+            first = asyncio.ensure_future(serp_service.search_keyword("test"))
+            second = asyncio.ensure_future(serp_service.search_keyword("test"))
+            await asyncio.sleep(0)
+
+            first.cancel()
+            await asyncio.gather(first, return_exceptions=True)
+            release.set()
+            result = await asyncio.wait_for(second, 1)
+            assert result.organic_results[0].link == "https://a.com"
+
+            release.clear()
+            third = asyncio.ensure_future(serp_service.search_keyword("other"))
+            await asyncio.sleep(0)
+            upstream = next(iter(serp_service._inflight.values())).task
+            third.cancel()
+            await asyncio.gather(third, return_exceptions=True)
+            await asyncio.gather(upstream, return_exceptions=True)
+
+        assert first.cancelled()
+        assert upstream.cancelled()
+        assert serp_service.get_coalescing_stats()['in_flight'] == 0
+
+
+class TestSerpDeepResults:
+    """分頁取得深層 SERP 結果測試類別。"""
+
+    @pytest.fixture
+    def serp_service(self):
+        """SerpService 實例 fixture。"""
+        config_mock = Mock()
+        config_mock.get_serp_api_key.return_value = "test_api_key"
+        config_mock.get_serp_search_engine.return_value = "google"
+        config_mock.get_serp_location.return_value = "Taiwan"
+        config_mock.get_serp_language.return_value = "zh-tw"
+        config_mock.get_serp_page_size.return_value = 10
+        config_mock.get_serp_timeout.return_value = 30.0
+        config_mock.get_serp_pool_limit.return_value = 20
+        config_mock.get_serp_cache_enabled.return_value = False
+        config_mock.get_serp_cache_ttl.return_value = 86400.0
+        config_mock.get_serp_cache_max_entries.return_value = 512
+        config_mock.get_serp_cache_dir.return_value = ""
+        config_mock.get_serp_rate_limit.return_value = 0.0
+        config_mock.get_serp_rate_burst.return_value = 5
+        config_mock.get_serp_monthly_quota.return_value = 0
+        config_mock.get_serp_queue_timeout.return_value = 30.0
+        config_mock.get_retry_budget_ratio.return_value = 0.2
+        config_mock.get_retry_budget_reserve.return_value = 10.0
+        config_mock.get_retry_max_delay.return_value = 30.0
+        with patch('app.services.serp_service.get_config', return_value=config_mock):
+            return SerpService()
+
+    @staticmethod
+    def page(start, count=10, with_position=True):
+        """第 start 筆起的一頁 SerpAPI 回應。"""
+        results = []
+        for i in range(start + 1, start + count + 1):
+            result = {"title": f"T{i}", "link": f"https://site{i}.com", "snippet": "S"}
+            if with_position:
+                result["position"] = i
+            results.append(result)
+        return {"organic_results": results, "search_information": {"total_results": "1,000"}}
+
+    @pytest.mark.asyncio
+    async def test_pages_fetched_concurrently_and_merged(self, serp_service):
+        """測試超過一頁時以 start 位移並行取得各頁，依排名順序合併。"""
+        in_flight = []
+        peak = []
+
+        async def fetch(params):
+            in_flight.append(params)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(params)
+            return self.page(params.get("start", 0))
+
+        with patch.object(SerpService, '_fetch_search_data', side_effect=fetch) as mock_fetch:
+            result = await serp_service.search_keyword("SEO", num_results=25)
+
+        starts = sorted(call.args[0].get("start", 0) for call in mock_fetch.await_args_list)
+        assert starts == [0, 10, 20]
+        assert all(call.args[0]["num"] == 10 for call in mock_fetch.await_args_list)
+        assert max(peak) == 3
+        assert [r.position for r in result.organic_results] == list(range(1, 26))
+        assert result.total_results == 1000
+        assert result.search_metadata["pages_fetched"] == 3
+
+    @pytest.mark.asyncio
+    async def test_duplicates_removed_and_order_preserved(self, serp_service):
+        """測試跨頁重複的排名與 URL 只保留第一次出現的結果。"""
+        second = self.page(10)
+        second["organic_results"][0]["position"] = 10  # 與第一頁重複的排名
+        second["organic_results"][1]["link"] = "https://site3.com"  # 與第一頁重複的 URL
+
+        async def fetch(params):
+            return second if params.get("start") == 10 else self.page(0)
+
+        with patch.object(SerpService, '_fetch_search_data', side_effect=fetch):
+            result = await serp_service.search_keyword("SEO", num_results=20)
+
+        positions = [r.position for r in result.organic_results]
+        assert positions == list(range(1, 11)) + list(range(13, 21))
+        assert len({r.link for r in result.organic_results}) == len(result.organic_results)
+
+    @pytest.mark.asyncio
+    async def test_missing_positions_use_page_offset(self, serp_service):
+        """測試結果缺少排名時依頁面位移編號，不與前頁重複。"""
+        async def fetch(params):
+            return self.page(params.get("start", 0), with_position=False)
+
+        with patch.object(SerpService, '_fetch_search_data', side_effect=fetch):
+            result = await serp_service.search_keyword("SEO", num_results=20)
+
+        assert [r.position for r in result.organic_results] == list(range(1, 21))
+
+    @pytest.mark.asyncio
+    async def test_later_page_failure_keeps_earlier_pages(self, serp_service):
+        """測試後續頁面失敗時保留失敗頁之前的結果；第一頁失敗時拋出例外。"""
+        async def fetch(params):
+            if params.get("start") == 10:
+                return {"error": "Invalid API key"}
+            return self.page(params.get("start", 0))
+
+        with patch.object(SerpService, '_fetch_search_data', side_effect=fetch):
+            result = await serp_service.search_keyword("SEO", num_results=30)
+
+        assert [r.position for r in result.organic_results] == list(range(1, 11))
+        assert result.search_metadata["pages_fetched"] == 1
+        assert result.search_metadata["pages_requested"] == 3
+
+        with patch.object(SerpService, '_fetch_search_data', return_value={"error": "Invalid API key"}):
+            with pytest.raises(InvalidAPIKeyException):
+                await serp_service.search_keyword("SEO", num_results=30)
+
+    @pytest.mark.asyncio
+    async def test_single_page_request_unchanged(self, serp_service):
+        """測試不超過一頁時只發出一次不含 start 的請求。"""
+        with patch.object(SerpService, '_fetch_search_data', return_value=self.page(0)) as mock_fetch:
+            result = await serp_service.search_keyword("SEO", num_results=10)
+
+        assert mock_fetch.await_count == 1
+        assert "start" not in mock_fetch.await_args.args[0]
+        assert len(result.organic_results) == 10
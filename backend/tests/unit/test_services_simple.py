@@ -136,11 +136,60 @@ class TestServiceIntegration:
         """建立 Mock Config 物件。"""
         config_mock = Mock()
         config_mock.get_serp_api_key.return_value = "test_api_key"
+        config_mock.get_serp_page_size.return_value = 10
+        config_mock.get_serp_timeout.return_value = 30.0
+        config_mock.get_serp_pool_limit.return_value = 20
+        config_mock.get_serp_cache_enabled.return_value = False
+        config_mock.get_serp_cache_ttl.return_value = 86400.0
+        config_mock.get_serp_cache_max_entries.return_value = 512
+        config_mock.get_serp_cache_dir.return_value = ""
+        config_mock.get_serp_rate_limit.return_value = 0.0
+        config_mock.get_serp_rate_burst.return_value = 5
+        config_mock.get_serp_monthly_quota.return_value = 0
+        config_mock.get_serp_queue_timeout.return_value = 30.0
         config_mock.get_openai_api_key.return_value = "test_openai_key"
         config_mock.get_openai_endpoint.return_value = "https://test.openai.azure.com/"
         config_mock.get_openai_deployment_name.return_value = "gpt-4o"
         config_mock.get_scraper_timeout.return_value = 10.0
         config_mock.get_scraper_max_concurrent.return_value = 10
+        config_mock.get_scraper_adaptive_concurrency_enabled.return_value = True
+        config_mock.get_scraper_concurrency_min.return_value = 1
+        config_mock.get_scraper_concurrency_max.return_value = 32
+        config_mock.get_scraper_min_success.return_value = 0
+        config_mock.get_scraper_deadline.return_value = 0.0
+        config_mock.get_scraper_adaptive_timeout_enabled.return_value = True
+        config_mock.get_scraper_timeout_floor.return_value = 2.0
+        config_mock.get_scraper_timeout_cap.return_value = 30.0
+        config_mock.get_scraper_timeout_percentile.return_value = 99.0
+        config_mock.get_scraper_timeout_history_path.return_value = ""
+        config_mock.get_scraper_hedge_enabled.return_value = True
+        config_mock.get_scraper_hedge_percentile.return_value = 95.0
+        config_mock.get_scraper_hedge_budget.return_value = 0.1
+        config_mock.get_scraper_hedge_min_samples.return_value = 20
+        config_mock.get_scraper_circuit_breaker_enabled.return_value = True
+        config_mock.get_scraper_circuit_failure_threshold.return_value = 0.5
+        config_mock.get_scraper_circuit_min_failures.return_value = 5
+        config_mock.get_scraper_circuit_cooldown.return_value = 30.0
+        config_mock.get_scraper_robots_enabled.return_value = False
+        config_mock.get_scraper_robots_user_agent.return_value = "SEOAnalyzer"
+        config_mock.get_scraper_robots_ttl.return_value = 86400.0
+        config_mock.get_scraper_pdf_enabled.return_value = True
+        config_mock.get_scraper_pdf_max_bytes.return_value = 10 * 1024 * 1024
+        config_mock.get_scraper_parser_mode.return_value = "thread"
+        config_mock.get_scraper_parser_workers.return_value = 2
+        config_mock.get_scraper_parser_engine.return_value = "lxml"
+        config_mock.get_scraper_per_host_concurrent.return_value = 2
+        config_mock.get_scraper_host_delay.return_value = 0.0
+        config_mock.get_scraper_html_store_enabled.return_value = False
+        config_mock.get_scraper_dns_cache_enabled.return_value = True
+        config_mock.get_scraper_dns_cache_ttl.return_value = 300.0
+        config_mock.get_scraper_dns_negative_ttl.return_value = 30.0
+        config_mock.get_scraper_parse_cache_enabled.return_value = True
+        config_mock.get_scraper_parse_cache_ttl.return_value = 7 * 24 * 3600
+        config_mock.get_scraper_parse_cache_max_entries.return_value = 2048
+        config_mock.get_retry_budget_ratio.return_value = 0.2
+        config_mock.get_retry_budget_reserve.return_value = 10.0
+        config_mock.get_retry_max_delay.return_value = 30.0
         return config_mock
 
     def test_serp_service_initialization(self, mock_config_object):
@@ -0,0 +1,101 @@
+"""文字統計工具單元測試。
+
+測試 CJK 字元、單字、段落與句數的計算規則。
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 確保可以從不同的工作目錄執行測試
+# 動態添加 backend 目錄到 Python 路徑
+current_file = Path(__file__)
+test_dir = current_file.parent
+backend_dir = test_dir.parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+# pylint: disable=import-error,wrong-import-position
+from app.utils.text_stats import TextStats, analyze_text
+
+
+class TestTextStats:
+    """文字統計測試類別。"""
+
+    @pytest.mark.parametrize("text", ["", "   ", "\n\n\t"])
+    def test_empty_text(self, text):
+        """測試空白文字回傳全部為零的統計。"""
+        assert analyze_text(text) == TextStats()
+
+    def test_mixed_chinese_and_english(self):
+        """測試中英混合文字。
+
+        驗證：
+        - 每個漢字計為一字，英文以單字計
+        - 全形標點不計入字數
+        """
+        stats = analyze_text("SEO 關鍵字研究，Keyword research 很重要。")
+
+        assert stats.cjk_chars == 8
+        assert stats.latin_words == 3
+        assert stats.word_count == 11
+        assert stats.sentence_count == 1
+
+    def test_extended_cjk_ranges(self):
+        """測試擴充 A、擴充 B、相容表意文字、假名與注音皆計為 CJK 字元。"""
+        text = "㐀\U00020000豈かなカナㄅㄆ"
+
+        stats = analyze_text(text)
+
+        assert stats.cjk_chars == 9
+        assert stats.latin_words == 0
+
+    def test_cjk_punctuation_is_not_counted(self):
+        """測試 CJK 符號、全形標點與引號只作為分隔符號。"""
+        stats = analyze_text("「引號」、《書名》（括號）——破折號…")
+
+        assert stats.cjk_chars == 9
+        assert stats.latin_words == 0
+
+    def test_hangul_counts_as_words(self):
+        """測試韓文以空白分詞計算。"""
+        assert analyze_text("한국어 텍스트 분석").latin_words == 3
+
+    def test_latin_word_rules(self):
+        """測試撇號、數字與連字號的單字規則。"""
+        stats = analyze_text("It's 3.14 — well-known, isn’t it?")
+
+        # It's, 3.14, well, known, isn’t, it
+        assert stats.latin_words == 6
+        assert stats.cjk_chars == 0
+
+    def test_sentence_count(self):
+        """測試句數計算。
+
+        驗證：
+        - 半形與全形句尾標點
+        - 連續標點只算一句
+        - 小數點不視為句尾
+        - 結尾沒有標點的文字也算一句
+        """
+        assert analyze_text("第一句。第二句！第三句？？").sentence_count == 3
+        assert analyze_text("One. Two! Three?! Pi is 3.14").sentence_count == 4
+        assert analyze_text("標題沒有標點").sentence_count == 1
+
+    def test_paragraph_count(self):
+        """測試以空行（可含空白）分隔的段落數。"""
+        text = "第一段內容。\n\n第二段 English.\n   \n第三段\n同一段的下一行\n\n\n"
+
+        stats = analyze_text(text)
+
+        assert stats.paragraph_count == 3
+        # 第三段沒有句尾標點，以段落結尾計為一句
+        assert stats.sentence_count == 3
+
+    def test_non_ascii_latin_text(self):
+        """測試含重音字母的拉丁語系文字。"""
+        stats = analyze_text("Le café était très bon. C'était magnifique!")
+
+        assert stats.latin_words == 7
+        assert stats.sentence_count == 2